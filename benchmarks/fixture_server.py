@@ -0,0 +1,131 @@
+"""Local stand-in for Booking.com serving the recorded results pages in benchmarks/fixtures.
+
+Run from the repository root:
+
+    python -m benchmarks.fixture_server --port 8765 --page small
+
+and point the scraper at it through the environment:
+
+    WEBSCRAP_BASE_URL=http://127.0.0.1:8765/searchresults.html \\
+    WEBSCRAP_AUTOCOMPLETE_URL=http://127.0.0.1:8765/autocomplete.json python cli.py search ...
+
+GET /searchresults.html returns the fixture page for the first `pages` offsets and a
+results page without property cards past them; pass a list of fixture names to serve a
+different page per offset (the last one repeats). POST /autocomplete.json resolves every
+destination to DEST_ID/DEST_TYPE, so a search runs end to end without the network.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from utils.config import Config
+import argparse
+import json
+import os
+import threading
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+DEST_ID = "-2103041"
+DEST_TYPE = "city"
+EMPTY_PAGE = ('<!DOCTYPE html><html><body><div data-testid="searchresults_header">'
+              '<h1>Chennai: 0 properties found</h1></div></body></html>')
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, f"{name}.html"), encoding="utf-8") as f:
+        return f.read()
+
+
+class FixtureServer:
+    """Threaded HTTP server on 127.0.0.1; usable as a context manager"""
+
+    def __init__(self, page="small", pages=1, port=0):
+        names = [page] if isinstance(page, str) else list(page)
+        self.page_sources = [load_fixture(name) for name in names]
+        self.pages = pages
+        self.requests = []  # (method, path) of every request served
+        self.connections = []  # client address of every connection accepted
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real site
+
+            def setup(self):
+                super().setup()
+                fixture.connections.append(self.client_address)
+
+            def do_GET(self):
+                fixture.requests.append(("GET", self.path))
+                url = urlparse(self.path)
+                if url.path != "/searchresults.html":
+                    return self._reply(404, "text/plain", "not found")
+                offset = int(parse_qs(url.query).get("offset", ["0"])[0])
+                page = offset // Config.RESULTS_PAGE_SIZE
+                page_source = fixture.page_sources[min(page, len(fixture.page_sources) - 1)]
+                self._reply(200, "text/html; charset=utf-8", page_source if page < fixture.pages else EMPTY_PAGE)
+
+            def do_POST(self):
+                fixture.requests.append(("POST", self.path))
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if urlparse(self.path).path != "/autocomplete.json":
+                    return self._reply(404, "text/plain", "not found")
+                self._reply(200, "application/json", json.dumps({"results": [{"dest_id": DEST_ID, "dest_type": DEST_TYPE}]}))
+
+            def _reply(self, status, content_type, body):
+                body = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def root(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_url(self):
+        return f"{self.root}/searchresults.html"
+
+    @property
+    def autocomplete_url(self):
+        return f"{self.root}/autocomplete.json"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the recorded results pages as a local Booking.com stand-in")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--page", default="small", help="fixture name in benchmarks/fixtures (default: small)")
+    parser.add_argument("--pages", type=int, default=1, help="offset pages that return property cards (default: 1)")
+    args = parser.parse_args(argv)
+    server = FixtureServer(args.page, args.pages, args.port)
+    print(f"WEBSCRAP_BASE_URL={server.base_url}")
+    print(f"WEBSCRAP_AUTOCOMPLETE_URL={server.autocomplete_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+if __name__ == "__main__":
+    main()
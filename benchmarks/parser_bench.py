@@ -0,0 +1,219 @@
+"""Offline benchmark for the property-card parsers and the amount helpers.
+
+Run from the repository root:
+
+    python -m benchmarks.parser_bench
+
+Every parser backend parses every fixture in benchmarks/fixtures. Throughput (pages/s,
+cards/s), peak memory and correctness against benchmarks/golden are reported, and a
+JSON report is written for comparing runs (--baseline old_report.json). The "large"
+fixture is built from small.html at run time so the corpus stays small on disk.
+"""
+from copy import deepcopy
+from lxml import html
+from utils.config import Config
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Keep the benchmark from writing scrape metrics or touching the response cache
+Config.METRICS_ENABLED = False
+
+from utils.card_parser import CARD_PARSERS, get_card_parser
+from utils.hotel_record import format_amount, parse_amount, parse_currency
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BENCH_DIR, "fixtures")
+GOLDEN_DIR = os.path.join(BENCH_DIR, "golden")
+LARGE_COPIES = 50
+AMOUNT_SAMPLES = ["₹ 3,450", "+₹ 414 taxes and fees", "US$1,234.50", "€ 89", "1,234 reviews", "", "Includes taxes"]
+
+def build_large_page(source, copies=LARGE_COPIES):
+    """Repeat the cards of a page `copies` times with distinct names and links"""
+    tree = html.fromstring(source)
+    cards = tree.xpath('//div[@data-testid="property-card"]')
+    container = cards[0].getparent()
+    for card in cards:
+        container.remove(card)
+    for copy_no in range(1, copies + 1):
+        for card in cards:
+            clone = deepcopy(card)
+            for title in clone.xpath('.//div[@data-testid="title"]'):
+                title.text = f"{title.text} #{copy_no}"
+            for link in clone.xpath('.//a[@href]'):
+                link.set("href", link.get("href").replace(".html", f"-{copy_no}.html"))
+            container.append(clone)
+    return html.tostring(tree, encoding="unicode", doctype="<!DOCTYPE html>")
+
+def load_fixtures():
+    fixtures = {}
+    for file_name in sorted(os.listdir(FIXTURE_DIR)):
+        if file_name.endswith(".html"):
+            with open(os.path.join(FIXTURE_DIR, file_name), encoding="utf-8") as f:
+                fixtures[file_name[:-len(".html")]] = f.read()
+    if "small" in fixtures:
+        fixtures["large"] = build_large_page(fixtures["small"])
+    return fixtures
+
+def golden_path(fixture):
+    return os.path.join(GOLDEN_DIR, f"{fixture}.json")
+
+def load_golden(fixture):
+    try:
+        with open(golden_path(fixture), encoding="utf-8") as f:
+            return json.load(f)
+    except OSError:
+        return None
+
+def write_golden(fixture, records):
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    with open(golden_path(fixture), "w", encoding="utf-8") as f:
+        json.dump([record.to_dict() for record in records], f, indent=1, ensure_ascii=False)
+        f.write("\n")
+
+def check_correctness(records, golden):
+    """(matches golden, number of differing rows, first difference)"""
+    if golden is None:
+        return None, None, "no golden output"
+    rows = [record.to_dict() for record in records]
+    mismatches = sum(1 for row, expected in zip(rows, golden) if row != expected)
+    mismatches += abs(len(rows) - len(golden))
+    first_diff = None
+    for index, (row, expected) in enumerate(zip(rows, golden)):
+        if row != expected:
+            first_diff = {"row": index, "got": row, "expected": expected}
+            break
+    if first_diff is None and len(rows) != len(golden):
+        first_diff = f"got {len(rows)} rows, expected {len(golden)}"
+    return mismatches == 0, mismatches, first_diff
+
+def time_runs(fn, repeat, min_time):
+    """Per-run seconds; repeats at least `repeat` times and until min_time has elapsed"""
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < repeat or time.perf_counter() - started < min_time:
+        run_start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - run_start)
+    return timings
+
+def peak_memory(fn):
+    """Peak bytes allocated by Python while fn runs (measured in a separate, untimed pass)"""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def bench_quiet(parser):
+    # Card warnings would drown the report; edge-case pages drop cards on purpose
+    parser.logger.disabled = True
+    return parser
+
+def bench_parser(backend, fixtures, repeat, min_time):
+    parser = bench_quiet(get_card_parser(backend))
+    results = {}
+    for fixture, source in fixtures.items():
+        records = parser.parse(source)
+        correct, mismatches, first_diff = check_correctness(records, load_golden(fixture))
+        timings = time_runs(lambda: parser.parse(source), repeat, min_time)
+        median = statistics.median(timings)
+        results[fixture] = {
+            "page_bytes": len(source.encode("utf-8")),
+            "cards": len(records),
+            "runs": len(timings),
+            "best_s": min(timings),
+            "median_s": median,
+            "pages_per_s": 1 / median if median else None,
+            "cards_per_s": len(records) / median if median else None,
+            "peak_memory_kib": round(peak_memory(lambda: parser.parse(source)) / 1024, 1),
+            "correct": correct,
+            "mismatches": mismatches,
+            "first_diff": first_diff,
+        }
+    return results
+
+def bench_amounts(repeat, min_time):
+    """Per-call cost of the number parsing/formatting used by the results table"""
+    samples = AMOUNT_SAMPLES * 100
+    values = [parse_amount(text) for text in samples]
+    results = {}
+    for name, fn in (
+        ("parse_amount", lambda: [parse_amount(text) for text in samples]),
+        ("parse_currency", lambda: [parse_currency(text) for text in samples]),
+        ("format_amount", lambda: [format_amount(value, "₹") for value in values]),
+    ):
+        median = statistics.median(time_runs(fn, repeat, min_time))
+        results[name] = {"calls_per_s": len(samples) / median, "ns_per_call": median / len(samples) * 1e9}
+    return results
+
+def compare(report, baseline):
+    """Median-time ratios against a previous report (>1 means slower now)"""
+    ratios = {}
+    for backend, fixtures in report["parsers"].items():
+        for fixture, result in fixtures.items():
+            old = baseline.get("parsers", {}).get(backend, {}).get(fixture)
+            if old and old.get("median_s"):
+                ratios[f"{backend}/{fixture}"] = round(result["median_s"] / old["median_s"], 3)
+    return ratios
+
+def print_report(report):
+    print(f"{'backend':<8} {'fixture':<12} {'cards':>6} {'pages/s':>10} {'cards/s':>12} {'peak KiB':>10}  correct")
+    for backend, fixtures in report["parsers"].items():
+        for fixture, result in fixtures.items():
+            correct = {True: "yes", False: f"NO ({result['mismatches']} rows)", None: "n/a"}[result["correct"]]
+            print(f"{backend:<8} {fixture:<12} {result['cards']:>6} {result['pages_per_s']:>10.1f} "
+                  f"{result['cards_per_s']:>12.0f} {result['peak_memory_kib']:>10.1f}  {correct}")
+    for name, result in report["amounts"].items():
+        print(f"{name:<21} {result['ns_per_call']:>8.0f} ns/call")
+    for key, ratio in report.get("baseline_ratio", {}).items():
+        print(f"{key:<21} {ratio:>8.3f}x baseline median")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the property-card parsers on recorded pages")
+    parser.add_argument("--backends", nargs="+", default=list(CARD_PARSERS), choices=list(CARD_PARSERS))
+    parser.add_argument("--repeat", type=int, default=5, help="minimum timed runs per fixture")
+    parser.add_argument("--min-time", type=float, default=0.5, help="minimum seconds spent per fixture")
+    parser.add_argument("--output", default=os.path.join(BENCH_DIR, "report.json"), help="JSON report path")
+    parser.add_argument("--baseline", help="previous JSON report to compare against")
+    parser.add_argument("--update-golden", action="store_true",
+                        help="rewrite the golden outputs from the first backend (after checking the backends agree)")
+    args = parser.parse_args(argv)
+
+    fixtures = load_fixtures()
+    if args.update_golden:
+        for fixture, source in fixtures.items():
+            outputs = [bench_quiet(get_card_parser(backend)).parse(source) for backend in args.backends]
+            if any(output != outputs[0] for output in outputs[1:]):
+                print(f"Backends disagree on {fixture}; golden output not updated", file=sys.stderr)
+                return 1
+            write_golden(fixture, outputs[0])
+        print(f"Golden outputs written to {GOLDEN_DIR}")
+
+    report = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parsers": {backend: bench_parser(backend, fixtures, args.repeat, args.min_time) for backend in args.backends},
+        "amounts": bench_amounts(args.repeat, args.min_time),
+    }
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["baseline_ratio"] = compare(report, json.load(f))
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print_report(report)
+    print(f"Report written to {args.output}")
+
+    failed = any(result["correct"] is False for fixtures in report["parsers"].values() for result in fixtures.values())
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+"""Command-line batch mode: run hotel searches without the Tk window.
+
+    python cli.py search -d "Chennai, India" -d "Goa, India" --checkin 2025-07-15 --checkout 2025-07-20 \\
+        --range --adults 2 --adult-increment 1 --step-count 2 --filter hotelfacility=433 -o results.csv
+
+    python cli.py search --job-file sweep.json -o results.db
+
+    python cli.py watch --watch-file watches.json -o prices.db
+
+    python cli.py history cheapest -d "Chennai, India"
+    python cli.py history trajectory --hotel "Hotel A & Spa" --night 2025-07-15
+
+A job file is a JSON list of searches using the same names as the options, e.g.
+[{"destination": "Chennai, India", "checkin": "2025-07-15", "checkout": "2025-07-17", "range": true}].
+Results are written as each search completes (.csv, .jsonl, .db/.sqlite or .parquet). Every
+scraped row is also kept in the price-history database queried by `history`.
+"""
+from datetime import datetime
+from utils.config import Config
+from utils.exporters import EXPORTERS, get_exporter
+from utils.job_scheduler import JobScheduler, WatchJob
+from utils.metrics import ScrapeMetrics
+from utils.price_history import PriceHistoryStore
+from utils.search_dispatcher import SearchDispatcher, build_batch_grid, expand_adult_counts
+from utils.web_driver_manager import WebDriverManager
+from utils.web_driver_pool import WebDriverPool
+import argparse
+import json
+import logging
+import sys
+import time
+
+logger = logging.getLogger('cli')
+logger.setLevel(logging.INFO)
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    logger.addHandler(handler)
+
+SEARCH_DEFAULTS = {
+    "range": False,
+    "adults": 2,
+    "adult_increment": 0,
+    "step_count": 1,
+    "rooms": 1,
+    "children": 0,
+    "filters": [],
+}
+
+def search_params(search):
+    """Turn one search (CLI options or a job-file entry) into build_search_grid parameters"""
+    search = dict(SEARCH_DEFAULTS, **{key: value for key, value in search.items() if value is not None})
+    for key in ("destination", "checkin", "checkout"):
+        if not search.get(key):
+            raise ValueError(f"Search is missing '{key}': {search}")
+    if datetime.strptime(search["checkout"], '%Y-%m-%d') <= datetime.strptime(search["checkin"], '%Y-%m-%d'):
+        raise ValueError(f"Check-out must be after check-in for {search['destination']}")
+    base_adults = int(search["adults"])
+    return {
+        "destination": search["destination"],
+        "checkin_date": search["checkin"],
+        "checkout_date": search["checkout"],
+        "adult_counts": expand_adult_counts(base_adults, int(search["adult_increment"]), int(search["step_count"])),
+        "base_adults": base_adults,
+        "rooms": str(search["rooms"]),
+        "children": str(search["children"]),
+        "search_type": "range" if search["range"] else "single",
+        "filter_params": list(search["filters"]),
+    }
+
+def load_searches(args):
+    """Searches from the job file, or one per --destination"""
+    if args.job_file:
+        with open(args.job_file, encoding='utf-8') as f:
+            searches = json.load(f)
+        return searches if isinstance(searches, list) else searches["searches"]
+    return [{
+        "destination": destination,
+        "checkin": args.checkin,
+        "checkout": args.checkout,
+        "range": args.range,
+        "adults": args.adults,
+        "adult_increment": args.adult_increment,
+        "step_count": args.step_count,
+        "rooms": args.rooms,
+        "children": args.children,
+        "filters": args.filter,
+    } for destination in args.destination or []]
+
+def run_jobs(jobs, dispatcher, engine, incremental=False):
+    """(job, hotel_results) for each completed search, from the configured engine"""
+    if engine == "async":
+        # Imported lazily so the pool engine does not need aiohttp
+        from utils.async_hotel_scraper import iter_grid
+        return iter_grid(jobs, browser_fallback=dispatcher, incremental=incremental)
+    # Log in once before the pool slots start, instead of every slot logging in at the same time
+    dispatcher.prepare_grid(jobs)
+    return dispatcher.iter_run(jobs, incremental=incremental)
+
+def print_summary(total_jobs, completed, exporter, elapsed, first_result_after):
+    rows = exporter.rows_written
+    print(f"Searches: {completed}/{total_jobs} completed, {total_jobs - completed} failed or empty")
+    print(f"Rows written: {rows} to {exporter.path}")
+    print(f"Export: {exporter.summary()}")
+    print(f"Elapsed: {elapsed:.1f}s", end="")
+    if first_result_after is not None:
+        print(f" (first result after {first_result_after:.1f}s)", end="")
+    print()
+    if elapsed:
+        print(f"Throughput: {completed / elapsed * 60:.1f} searches/min, {rows / elapsed:.1f} rows/s")
+    phases = ScrapeMetrics().phase_summary()
+    if phases:
+        print("Time per phase (count, seconds):")
+        for phase, (count, seconds) in phases.items():
+            print(f"  {phase:<20} {count:>6} {seconds:>10.2f}")
+
+def command_search(args):
+    try:
+        jobs = build_batch_grid(search_params(search) for search in load_searches(args))
+        if not jobs:
+            raise ValueError("Nothing to search: pass --destination or --job-file")
+        exporter = get_exporter(args.output, args.format)
+    except (OSError, KeyError, ValueError) as e:
+        logger.error(str(e))
+        return 2
+
+    dispatcher = SearchDispatcher(WebDriverPool(size=args.pool_size))
+    completed, started = 0, time.perf_counter()
+    first_result_after = None
+    try:
+        with exporter:
+            for job, hotel_results in run_jobs(jobs, dispatcher, args.engine, args.incremental):
+                if hotel_results:
+                    completed += 1
+                    if first_result_after is None:
+                        first_result_after = time.perf_counter() - started
+                exporter.write(job, hotel_results or [])
+                logger.info(f"Search {job['index'] + 1}/{len(jobs)} ({job['params']['ss']}, "
+                            f"{job['params']['checkin']}, adults={job['adults']}): {len(hotel_results or [])} hotels")
+    finally:
+        dispatcher.shutdown()
+        WebDriverManager().quit_driver()
+    print_summary(len(jobs), completed, exporter, time.perf_counter() - started, first_result_after)
+    return 0 if completed else 1
+
+def command_watch(args):
+    try:
+        with open(args.watch_file, encoding='utf-8') as f:
+            watches = json.load(f)
+        watch_jobs = [WatchJob.from_dict(watch) for watch in (watches if isinstance(watches, list) else watches["watches"])]
+        exporter = get_exporter(args.output, args.format, append=True)
+    except (OSError, KeyError, TypeError, ValueError) as e:
+        logger.error(str(e))
+        return 2
+
+    def write_results(job, hotel_results, watch_jobs):
+        rows = exporter.write(job, hotel_results or [])
+        logger.info(f"{job['params']['ss']} {job['params']['checkin']} adults={job['adults']}: {rows} hotels "
+                    f"(for {', '.join(watch_job.name for watch_job in watch_jobs)})")
+
+    dispatcher = SearchDispatcher(WebDriverPool(size=args.pool_size))
+    scheduler = JobScheduler(dispatcher, on_results=write_results, incremental=args.incremental)
+    for watch_job in watch_jobs:
+        scheduler.add(watch_job)
+    logger.info(f"Watching {len(watch_jobs)} job(s) with {dispatcher.pool.size} browser(s)")
+    try:
+        with exporter:
+            if args.once:
+                scheduler.run_due()
+            else:
+                scheduler.run_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopping watch")
+    finally:
+        dispatcher.shutdown()
+        WebDriverManager().quit_driver()
+    logger.info(f"Rows written to {args.output}: {exporter.summary()}")
+    return 0
+
+def command_history(args):
+    store = PriceHistoryStore()
+    since = time.time() - args.days * 24 * 60 * 60 if args.days else None
+    if args.query == "cheapest":
+        if not args.destination:
+            logger.error("history cheapest needs --destination")
+            return 2
+        rows = store.cheapest_per_night(args.destination, since=since, adults=args.adults)
+        columns = ("stay_date", "adults", "price", "currency", "name")
+    else:
+        if not args.hotel or not args.night:
+            logger.error("history trajectory needs --hotel and --night")
+            return 2
+        rows = [row for row in store.price_trajectory(args.hotel, args.night, adults=args.adults)
+                if since is None or row["scraped_at"] >= since]
+        for row in rows:
+            row["scraped_at"] = time.strftime('%Y-%m-%d %H:%M', time.localtime(row["scraped_at"]))
+        columns = ("scraped_at", "adults", "price", "tax", "currency")
+    if not rows:
+        print("No price history found")
+        return 1
+    for row in rows:
+        print("\t".join("" if row[column] is None else str(row[column]) for column in columns))
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Scrape hotel prices without the GUI")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search = commands.add_parser("search", help="run a batch of searches once and export the results")
+    search.add_argument("-d", "--destination", action="append", help="destination to search (repeatable)")
+    search.add_argument("--checkin", help="check-in date, YYYY-MM-DD")
+    search.add_argument("--checkout", help="check-out date, YYYY-MM-DD")
+    search.add_argument("--range", action="store_true", help="search every night between check-in and check-out")
+    search.add_argument("--adults", type=int, default=SEARCH_DEFAULTS["adults"])
+    search.add_argument("--adult-increment", type=int, default=SEARCH_DEFAULTS["adult_increment"])
+    search.add_argument("--step-count", type=int, default=SEARCH_DEFAULTS["step_count"])
+    search.add_argument("--rooms", type=int, default=SEARCH_DEFAULTS["rooms"])
+    search.add_argument("--children", type=int, default=SEARCH_DEFAULTS["children"])
+    search.add_argument("--filter", action="append", default=[], help="Booking filter code, e.g. hotelfacility=433 (repeatable)")
+    search.add_argument("--job-file", help="JSON list of searches instead of the options above")
+    search.add_argument("-o", "--output", required=True, help="output file (.csv, .jsonl, .db, .parquet)")
+    search.add_argument("--format", choices=list(EXPORTERS), help="output format when the extension is ambiguous")
+    search.add_argument("--engine", choices=["pool", "async"], default=Config.SCRAPE_ENGINE)
+    search.add_argument("--pool-size", type=int, default=Config.DRIVER_POOL_SIZE, help="browser instances to run")
+    search.add_argument("--incremental", action="store_true", help="reuse recently scraped nights")
+    search.set_defaults(handler=command_search)
+
+    watch = commands.add_parser("watch", help="re-run watch jobs on their interval and append the results")
+    watch.add_argument("--watch-file", required=True,
+                       help="JSON list of watch jobs: destination, start_in_days, nights, adults or adult_counts, "
+                            "filters, interval (seconds)")
+    watch.add_argument("-o", "--output", required=True, help="output file to append to (.csv, .jsonl, .db)")
+    watch.add_argument("--format", choices=list(EXPORTERS), help="output format when the extension is ambiguous")
+    watch.add_argument("--pool-size", type=int, default=Config.DRIVER_POOL_SIZE, help="browser budget")
+    watch.add_argument("--incremental", action="store_true", help="skip cells another watch refreshed recently")
+    watch.add_argument("--once", action="store_true", help="run every watch job once and exit (for cron)")
+    watch.set_defaults(handler=command_watch)
+
+    history = commands.add_parser("history", help="query the price history of earlier searches")
+    history.add_argument("query", choices=["cheapest", "trajectory"],
+                         help="cheapest price per night at a destination, or one hotel's price over time for a night")
+    history.add_argument("-d", "--destination", help="destination (cheapest)")
+    history.add_argument("--hotel", help="hotel link or name (trajectory)")
+    history.add_argument("--night", help="stay date, YYYY-MM-DD (trajectory)")
+    history.add_argument("--adults", type=int, help="only rows for this adult count")
+    history.add_argument("--days", type=float, help="only scrapes from the last N days")
+    history.set_defaults(handler=command_history)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
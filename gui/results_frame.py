@@ -1,19 +1,42 @@
-from tkinter import ttk
+from tkinter import ttk, filedialog, messagebox
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 import os.path
 import datetime
+import queue
+import threading
 import tkinter as tk
 import webbrowser
+from gui.virtual_table import VirtualTable
+from utils.config import Config
+from utils.exporters import get_exporter
+from utils.results_table import DISPLAY_COLUMNS, ResultsTable
+import numpy as np
 
 class ResultsFrame:
+    HEADINGS = {
+        "serial": "#",
+        "name": "Hotel Name",
+        "location": "Location",
+        "adults": "Adults",
+        "price": "Price",
+        "tax": "Tax",
+        "review": "Review",
+        "review_count": "Review Count",
+        "date": "Date",
+    }
+
     def __init__(self, parent):
         self.frame = ttk.LabelFrame(parent, text="Search Results", padding="10")
         # Configure the frame to expand
         self.frame.columnconfigure(0, weight=1)
         self.frame.rowconfigure(0, weight=1)
+        # Rows live in the table; tree item ids are their row positions and
+        # self.order holds the positions in display order
+        self.table = ResultsTable()
+        self.order = np.arange(0)
         self.create_results_table()
         
     def create_results_table(self):
@@ -31,19 +54,13 @@ class ResultsFrame:
         columns = ("serial", "name", "location", "adults", "price", "tax", "review", "review_count", "date")
         self.tree = ttk.Treeview(tree_frame, columns=columns, show="headings")
         
-        # Define headings
-        self.tree.heading("serial", text="#")
-        self.tree.heading("name", text="Hotel Name")
-        self.tree.heading("location", text="Location")
-        self.tree.heading("adults", text="Adults")
-        self.tree.heading("price", text="Price ▼", command=lambda: self.sort_by_number("price"))
-        self.tree.heading("tax", text="Tax ▼", command=lambda: self.sort_by_number("tax"))
-        self.tree.heading("review", text="Review ▼", command=lambda: self.sort_by_number("review"))
-        self.tree.heading("review_count", text="Review Count ▼", command=lambda: self.sort_by_number("review_count"))
-        self.tree.heading("date", text="Date")
+        # Define headings: click sorts by a column, shift-click adds it as a further sort key
+        for col in columns:
+            self.tree.heading(col, text=self.HEADINGS[col], command=lambda col=col: self.sort_by(col))
+        self.tree.bind("<Shift-Button-1>", self.on_heading_shift_click)
         
-        # Store sort states
-        self.sort_states = {"price": True, "tax": True, "review": True, "review_count": True}
+        # Store sort state: [(column, descending), ...], most significant first
+        self.sort_columns = []
         
         # Configure columns
         min_width = 120
@@ -58,6 +75,8 @@ class ResultsFrame:
         
         # Scrollbars
         y_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        # Large result sets only keep the rows in view in the tree
+        self.virtual = VirtualTable(self.tree, y_scrollbar, lambda positions: self.table.display_rows(positions))
         x_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
         self.tree.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
         
@@ -77,87 +96,183 @@ class ResultsFrame:
         # Upload to Google Sheets button
         upload_button = ttk.Button(controls_frame, text="Upload to Google Sheets", command=self.upload_to_google_sheets)
         upload_button.pack(side=tk.LEFT, padx=5)
+
+        # Export to file button
+        self.export_button = ttk.Button(controls_frame, text="Export to File", command=self.export_results)
+        self.export_button.pack(side=tk.LEFT, padx=5)
         
         # Double click handler
         self.tree.bind("<Double-1>", self.on_item_double_click)
 
     def on_item_double_click(self, event):
-        item = self.tree.selection()[0]
-        hotel_data = self.tree.item(item)
-        if "values" in hotel_data and hotel_data["values"]:
-            link = hotel_data["tags"][0] if hotel_data["tags"] else None
+        selection = self.tree.selection()
+        if selection:
+            link = self.table.link(int(selection[0]))
             if link:
                 webbrowser.open(link)
                 
-    def sort_by_number(self, col):
-        # Toggle sort state
-        self.sort_states[col] = not self.sort_states[col]
-        reverse = self.sort_states[col]
-        
-        # Update header
-        arrow = "▼" if reverse else "▲"
-        self.tree.heading(col, text=f"{col.title()} {arrow}")
-        
-        # Sort items
-        items = [(self.extract_number(self.tree.set(item, col)), item) 
-                for item in self.tree.get_children('')]
-        items.sort(reverse=reverse)
-        
-        # Rearrange items
-        for index, (_, item) in enumerate(items):
-            self.tree.move(item, '', index)
-            
-    def extract_number(self, value):
-        try:
-            numeric_str = ''.join(filter(lambda x: x.isdigit() or x == '.', value))
-            return float(numeric_str) if numeric_str else 0
-        except ValueError:
-            return 0
+    def on_heading_shift_click(self, event):
+        if self.tree.identify_region(event.x, event.y) != "heading":
+            return None
+        col = self.tree.column(self.tree.identify_column(event.x), "id")
+        self.sort_by(col, add=True)
+        # Keep the heading's own click binding from sorting again on release
+        return "break"
+
+    def sort_by(self, col, add=False):
+        """Sort by col (ascending first, toggled on the next click); with add=True keep the
+        current sort columns and use col as a further key"""
+        current = dict(self.sort_columns)
+        if add:
+            if col in current:
+                self.sort_columns = [(name, not descending if name == col else descending)
+                                     for name, descending in self.sort_columns]
+            else:
+                self.sort_columns.append((col, False))
+        elif list(current) == [col]:
+            self.sort_columns = [(col, not current[col])]
+        else:
+            self.sort_columns = [(col, False)]
+        self.update_headings()
+        self.apply_sort()
+
+    def update_headings(self):
+        ranked = len(self.sort_columns) > 1
+        sort_rank = {col: (rank, descending) for rank, (col, descending) in enumerate(self.sort_columns, 1)}
+        for col in self.tree["columns"]:
+            text = self.HEADINGS[col]
+            if col in sort_rank:
+                rank, descending = sort_rank[col]
+                text += " ▼" if descending else " ▲"
+                if ranked:
+                    text += str(rank)
+            self.tree.heading(col, text=text)
+
+    def apply_sort(self):
+        """Reorder the view by the sort columns using the table's cached sort keys"""
+        if not self.sort_columns:
+            return
+        self._show_order(self.table.sort_order([(DISPLAY_COLUMNS[col], descending)
+                                                for col, descending in self.sort_columns]))
+
+    def settle_order(self, order):
+        """Streaming has finished: keep the user's sort, re-applied so it also covers the rows
+        that arrived after it was chosen, or else show the rows in the given order"""
+        if self.sort_columns:
+            self.apply_sort()
+        else:
+            self._show_order(np.asarray(order, dtype=np.int64))
+
+    def _show_order(self, order):
+        self.order = order
+        if self.virtual.active:
+            self.virtual.set_order(self.order, keep_top=False)
+        else:
+            # One Tcl call reorders every row; items keep their ids, so the selection survives
+            self.tree.set_children('', *map(str, self.order))
+
+    def view_positions(self):
+        """Table row positions in the current display order"""
+        return self.order.tolist()
         
     def copy_table_content(self):
-        headers = [self.tree.heading(col)["text"] for col in self.tree["columns"]]
-        items = [self.tree.item(item_id)["values"] for item_id in self.tree.get_children()]
+        headers = [self.HEADINGS[col] for col in self.tree["columns"]]
+        rows = self.table.display_rows(self.view_positions())
         
         content = ["\t".join(headers)]
-        content.extend("\t".join(str(value) for value in item) for item in items)
+        content.extend("\t".join(str(value) for value in row) for row in rows)
         
         final_content = "\n".join(content)
         self.frame.master.clipboard_clear()
         self.frame.master.clipboard_append(final_content)
         
     def update_results(self, hotel_results):
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
-        # Add new items
-        for hotel in hotel_results:
-            price_text = hotel["pricing"].text if hotel["pricing"] else "N/A"
-            tax_text = hotel["tax"] if hotel["tax"] else "₹0"
-            
-            values = (
-                hotel.get("serial_no", ""),
-                hotel["name"],
-                hotel["location"],
-                hotel.get("adults", "N/A"),  # Add number of adults
-                self.format_price(price_text),
-                self.format_price(tax_text),
-                hotel["review"] if hotel["review"] else "N/A",
-                hotel["review_count"] if hotel["review_count"] else "N/A",
-                hotel.get("date", "N/A")
-            )
-            self.tree.insert("", tk.END, values=values, tags=(hotel["link"],))
+        """Show a ResultsTable (or a list of HotelRecords) in place of the current rows"""
+        self.clear_results()
+        if isinstance(hotel_results, ResultsTable):
+            self.table = hotel_results
+            self._insert_rows(0, len(self.table))
+        else:
+            self.append_results(hotel_results)
+
+    def append_results(self, hotel_results, job=None):
+        """Add rows below the existing ones (used while a search is still streaming in);
+        returns the (start, end) table positions they occupy"""
+        start, end = self.table.append(hotel_results, job)
+        self._insert_rows(start, end)
+        return start, end
+
+    def _insert_rows(self, start, end):
+        # New rows go below the current ones, whatever the sort order
+        self.order = np.concatenate([self.order, np.arange(start, end)])
+        if not self.virtual.active and len(self.order) > Config.VIRTUAL_TABLE_THRESHOLD:
+            self.virtual.attach()
+        if self.virtual.active:
+            self.virtual.set_order(self.order)
+            return
+        for position, values in enumerate(self.table.display_rows(range(start, end)), start):
+            self.tree.insert("", tk.END, iid=str(position), values=values)
             
-    def format_price(self, price_text):
-        if not price_text or price_text == "N/A":
-            return "₹0"
-        numeric_value = self.extract_number(price_text)
-        return f"₹{numeric_value:,.2f}"
-        
     def clear_results(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.virtual.detach()
+        self.tree.delete(*self.tree.get_children())
+        self.table = ResultsTable()
+        self.order = np.arange(0)
+        self.sort_columns = []
+        self.update_headings()
+
+    def record_rows(self):
+        """Rows in the current display order with numbers kept as numbers (for Sheets/export)"""
+        columns = [DISPLAY_COLUMNS[col] for col in self.tree["columns"]]
+        return self.table.values(columns, self.view_positions())
             
+    def export_results(self):
+        """Stream the rows, in display order, to a CSV/JSONL/Parquet/SQLite file on a worker thread"""
+        if not len(self.table):
+            messagebox.showinfo("Export", "There are no results to export.")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Export results",
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl"), ("Parquet", "*.parquet"), ("SQLite", "*.db")],
+        )
+        if not path:
+            return
+        try:
+            exporter = get_exporter(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Export Failed", str(e))
+            return
+
+        # Take the frame on the Tk thread: appends only ever replace it with a new frame, so the
+        # worker keeps reading this snapshot while new results stream into the table
+        frame, positions = self.table.frame, self.order.copy()
+        outcome = queue.Queue()
+
+        def run_export():
+            try:
+                with exporter:
+                    exporter.write_table(frame, positions)
+                outcome.put(None)
+            except Exception as e:
+                outcome.put(e)
+
+        self.export_button.configure(state='disabled')
+        threading.Thread(target=run_export, daemon=True).start()
+        self.frame.after(200, self.check_export_done, exporter, outcome)
+
+    def check_export_done(self, exporter, outcome):
+        try:
+            error = outcome.get_nowait()
+        except queue.Empty:
+            self.frame.after(200, self.check_export_done, exporter, outcome)
+            return
+        self.export_button.configure(state='normal')
+        if error is not None:
+            messagebox.showerror("Export Failed", f"Failed to export results: {str(error)}")
+            return
+        messagebox.showinfo("Export Complete", f"Exported to {exporter.path}\n{exporter.summary()}")
+
     def upload_to_google_sheets(self):
         try:            
             # If modifying these scopes, delete the file token.json.
@@ -199,12 +314,12 @@ class ResultsFrame:
             spreadsheet_id = spreadsheet.get('spreadsheetId')
             
             # Prepare the data
-            headers = [self.tree.heading(col)["text"].replace(" ▼", "").replace(" ▲", "") for col in self.tree["columns"]]
+            headers = [self.HEADINGS[col] for col in self.tree["columns"]]
             values = [headers]
             
-            for item_id in self.tree.get_children():
-                row = list(self.tree.item(item_id)["values"])
-                values.append(row)
+            # Upload parsed numbers rather than the formatted display strings
+            for row in self.record_rows():
+                values.append(["" if value is None else value for value in row])
             
             range_name = 'Sheet1!A1'
             body = {
@@ -224,5 +339,4 @@ class ResultsFrame:
             webbrowser.open(spreadsheet_url)
             
         except Exception as e:
-            import tkinter.messagebox as messagebox
             messagebox.showerror("Error", f"Failed to upload to Google Sheets: {str(e)}")
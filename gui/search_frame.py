@@ -1,15 +1,16 @@
 import tkinter as tk
 from tkinter import ttk
 from tkcalendar import Calendar
-from utils.hotel_scraper import HotelScraper
-from utils.resources.filters import Filters
+from utils.filter_catalog import FilterCatalog
+from utils.search_dispatcher import expand_adult_counts
 
 class SearchFrame:
     def __init__(self, parent):
         self.frame = ttk.Frame(parent)
-        self.hotel_scraper = HotelScraper()
         self.filter_vars = {}
         self.filter = None
+        self.filters_destination = None
+        self.pending_filters = None
         
         # Create search criteria frame on the left
         self.search_criteria_frame = ttk.LabelFrame(self.frame, text="Search Criteria", padding="10")
@@ -30,8 +31,8 @@ class SearchFrame:
         self.destination.insert(0, "Chennai, India")
         self.destination.grid(row=0, column=1, columnspan=2, sticky=tk.W, pady=5)
         
-        # Add destination change handler
-        self.destination.bind('<FocusOut>', lambda e: self.load_filters())
+        # Add destination change handler (only reloads when the destination actually changed)
+        self.destination.bind('<FocusOut>', lambda e: self.load_filters(only_if_changed=True))
         
         # Check-in date
         ttk.Label(self.search_criteria_frame, text="Check-in Date:").grid(row=1, column=0, sticky=tk.W, pady=5)
@@ -80,10 +81,15 @@ class SearchFrame:
                        value="single").grid(row=6, column=1, sticky=tk.W, pady=5)
         ttk.Radiobutton(self.search_criteria_frame, text="Date Range", variable=self.search_type, 
                        value="range").grid(row=6, column=2, sticky=tk.W, pady=5)
+
+        # Incremental refresh
+        self.incremental = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.search_criteria_frame, text="Only refresh stale results",
+                        variable=self.incremental).grid(row=7, column=1, columnspan=2, sticky=tk.W, pady=5)
                        
         # Buttons frame
         self.buttons_frame = ttk.Frame(self.search_criteria_frame)
-        self.buttons_frame.grid(row=7, column=0, columnspan=3, pady=10)
+        self.buttons_frame.grid(row=8, column=0, columnspan=3, pady=10)
 
         # Setup filter section
         # Filter header frame
@@ -155,62 +161,78 @@ class SearchFrame:
         self.filter_vars.clear()
         
         # Load fresh filters
-        self.load_filters()        
+        self.load_filters(force=True)
 
-    def load_filters(self, *args):
-        # Ensure all existing widgets are destroyed
-        for widget in self.filters_frame.winfo_children():
-            widget.destroy()
-        self.filter_vars.clear()
-        
-        # Reset select all checkbox
-        self.select_all_var.set(False)
-        
-        # Disable refresh button while loading
-        self.refresh_btn.configure(state='disabled')
+    def load_filters(self, force=False, only_if_changed=False):
+        """Show the cached (or bundled) filters at once and refresh them in the background"""
+        destination = self.destination.get()
+        if only_if_changed and destination == self.filters_destination:
+            return
+        self.filters_destination = destination
         
-        # Show loading message
-        loading_label = ttk.Label(self.filters_frame, text="Loading filters...")
-        loading_label.pack(pady=10)
-        self.filter_frame.update()
+        filters, pending = FilterCatalog().request(destination, force=force)
+        self.show_filters(filters)
+        self.pending_filters = pending
+        if pending is None:
+            self.refresh_btn.configure(state='normal')
+        else:
+            # Poll from the Tk thread; widgets must not be touched from the worker
+            self.refresh_btn.configure(state='disabled')
+            self.frame.after(200, self.check_filters_loaded, pending)
+            
+    def check_filters_loaded(self, pending):
+        if pending is not self.pending_filters:
+            return  # superseded by a newer destination
+        if not pending.done():
+            self.frame.after(200, self.check_filters_loaded, pending)
+            return
+        self.pending_filters = None
+        self.refresh_btn.configure(state='normal')
         
-        hotel_scraper = HotelScraper()
-
         try:
-            # Get new filters
-            self.filter = hotel_scraper.get_filter_details(self.destination.get())
-            filters = self.filter
-            loading_label.destroy()
-            
-            if filters and 'all' in filters:
-                for filter_item in filters['all']:
-                    # Create new variables and widgets
-                    var = tk.BooleanVar()
-                    var.set(False)  # Explicitly set to False
-                    
-                    # Create new checkbutton with explicit default state
-                    checkbox = ttk.Checkbutton(self.filters_frame, 
-                                             text=filter_item['name'],
-                                             variable=var,
-                                             command=self.update_select_all_state)
-                    checkbox.state(['!selected'])  # Explicitly set unchecked state
-                    checkbox.pack(anchor="w", padx=10, pady=2)
-                    
-                    # Store in filter_vars dictionary
-                    self.filter_vars[filter_item['name']] = {
-                        'var': var,
-                        'widget': checkbox
-                    }
-        except Exception as e:
-            loading_label.destroy()
-            error_label = ttk.Label(self.filters_frame, 
-                                  text="Error loading filters.\nPlease try again.",
+            filters = pending.result()
+        except Exception:
+            filters = None
+        if filters is None:
+            error_label = ttk.Label(self.filter_frame, 
+                                  text="Could not refresh filters, showing saved list.",
                                   foreground="red")
-            error_label.pack(pady=10)
+            error_label.pack(pady=5)
             error_label.after(3000, error_label.destroy)  # Remove error message after 3 seconds
-        finally:
-            # Re-enable refresh button
-            self.refresh_btn.configure(state='normal')
+            return
+        self.show_filters(filters)
+        
+    def show_filters(self, filters):
+        """Rebuild the checkboxes, keeping the selection of filters that are still offered"""
+        selected = {name for name, items in self.filter_vars.items() if items['var'].get()}
+        
+        # Ensure all existing widgets are destroyed
+        for widget in self.filters_frame.winfo_children():
+            widget.destroy()
+        self.filter_vars.clear()
+        self.select_all_checkbox.configure(state='normal')
+        
+        self.filter = filters
+        if filters and 'all' in filters:
+            for filter_item in filters['all']:
+                # Create new variables and widgets
+                var = tk.BooleanVar()
+                var.set(filter_item['name'] in selected)
+                
+                checkbox = ttk.Checkbutton(self.filters_frame, 
+                                         text=filter_item['name'],
+                                         variable=var,
+                                         command=self.update_select_all_state)
+                checkbox.pack(anchor="w", padx=10, pady=2)
+                
+                # Store in filter_vars dictionary
+                self.filter_vars[filter_item['name']] = {
+                    'var': var,
+                    'widget': checkbox
+                }
+        
+        # Re-apply the current search text and select-all state
+        self.filter_search(self.search_var.get())
             
     def update_select_all_state(self):
         """Update select all checkbox state based on individual checkboxes"""
@@ -288,18 +310,7 @@ class SearchFrame:
         
         # Generate list of adult counts based on increment and step count
         base_adults = int(self.adults.get())
-        adult_increment = int(self.adult_increment.get())
-        step_count = int(self.step_count.get())
-        adult_counts = []
-        
-        if adult_increment > 0 and step_count > 1:
-            # Generate sequence of adult counts
-            for i in range(step_count):
-                adult_count = base_adults + (i * adult_increment)
-                if adult_count <= 10:  # Maximum adult limit
-                    adult_counts.append(adult_count)
-        else:
-            adult_counts = [base_adults]
+        adult_counts = expand_adult_counts(base_adults, int(self.adult_increment.get()), int(self.step_count.get()))
         
         return {
             "destination": self.destination.get(),
@@ -310,6 +321,7 @@ class SearchFrame:
             "rooms": self.rooms.get(),
             "children": self.children.get(),
             "search_type": self.search_type.get(),
+            "incremental": self.incremental.get(),  # Reuse recently scraped nights
             "selected_filters": selected_filter_names,
             "filter_params": selected_filter_values  # Add the URL parameters for filters
         }
@@ -0,0 +1,120 @@
+from tkinter import ttk
+from utils.config import Config
+import numpy as np
+
+class VirtualTable:
+    """Shows a large result set in a ttk.Treeview while only holding the rows in view.
+
+    The tree is given a window of rows (the visible ones plus `buffer` above and
+    below) and scrolls natively inside it. When the view nears either edge of the
+    window, the window is rebuilt around the current position. The scrollbar is
+    driven by row positions over the whole result set, so it behaves as if every
+    row were in the tree. Item ids are the table row positions.
+    """
+
+    def __init__(self, tree, scrollbar, fetch_rows, buffer=None):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.fetch_rows = fetch_rows  # fetch_rows(positions) -> one tuple of display values per position
+        self.buffer = buffer or Config.VIRTUAL_TABLE_BUFFER
+        self.order = np.arange(0)
+        self.window = (0, 0)  # [start, end) of self.order currently in the tree
+        self.active = False
+        self._recenter_pending = False
+
+    def attach(self):
+        """Take over the tree and scrollbar"""
+        self.active = True
+        self.tree.delete(*self.tree.get_children())
+        self.window = (0, 0)
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
+        self.scrollbar.configure(command=self._on_scrollbar)
+        self._resize_binding = self.tree.bind("<Configure>", lambda event: self._fill(self.top()), add="+")
+
+    def detach(self):
+        """Give the tree and scrollbar back to plain Treeview scrolling"""
+        if not self.active:
+            return
+        self.active = False
+        self.tree.unbind("<Configure>", self._resize_binding)
+        self.tree.delete(*self.tree.get_children())
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
+        self.scrollbar.configure(command=self.tree.yview)
+        self.order = np.arange(0)
+        self.window = (0, 0)
+
+    def set_order(self, order, keep_top=True):
+        """Show these table row positions, in this order"""
+        top = self.top() if keep_top else 0
+        self.order = np.asarray(order)
+        self._fill(top, force=True)
+
+    def visible_rows(self):
+        rowheight = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        return max(1, self.tree.winfo_height() // rowheight)
+
+    def top(self):
+        """Index into self.order of the first row in view"""
+        start, end = self.window
+        if end <= start:
+            return 0
+        return start + int(round(float(self.tree.yview()[0]) * (end - start)))
+
+    def _fill(self, top, force=False):
+        total = len(self.order)
+        visible = self.visible_rows()
+        top = max(0, min(top, total - visible))
+        start, end = self.window
+        margin = max(1, self.buffer // 4)
+        # Keep the current window while the view stays clear of its edges
+        fits = (start <= top and top + visible <= end
+                and (start == 0 or top - start >= margin)
+                and (end == total or end - (top + visible) >= margin))
+        if force or not fits:
+            start = max(0, top - self.buffer)
+            end = min(total, top + visible + self.buffer)
+            selected = self.tree.selection()
+            self.tree.delete(*self.tree.get_children())
+            positions = self.order[start:end]
+            for position, values in zip(positions, self.fetch_rows(positions)):
+                self.tree.insert("", "end", iid=str(position), values=values)
+            self.window = (start, end)
+            kept = [item for item in selected if self.tree.exists(item)]
+            if kept:
+                self.tree.selection_set(kept)
+        if end > start:
+            self.tree.yview_moveto((top - start) / (end - start))
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _on_tree_scroll(self, first, last):
+        """The tree moved inside its window: update the scrollbar and re-window near an edge"""
+        start, end = self.window
+        total = len(self.order)
+        if not total or end <= start:
+            self.scrollbar.set(0, 1)
+            return
+        first_row = start + float(first) * (end - start)
+        last_row = start + float(last) * (end - start)
+        self.scrollbar.set(first_row / total, last_row / total)
+        margin = max(1, self.buffer // 4)
+        near_edge = (first_row - start < margin and start > 0) or (end - last_row < margin and end < total)
+        if near_edge and not self._recenter_pending:
+            # Rebuilding from inside the tree's own callback would re-enter it
+            self._recenter_pending = True
+            self.tree.after_idle(self._recenter)
+
+    def _recenter(self):
+        self._recenter_pending = False
+        if self.active:
+            self._fill(self.top())
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        top = self.top()
+        if action == "moveto":
+            top = int(float(amount) * len(self.order))
+        elif unit == "pages":
+            top += int(amount) * self.visible_rows()
+        else:
+            top += int(amount)
+        self._fill(top)
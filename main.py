@@ -1,10 +1,15 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime, timedelta
+from datetime import datetime
 from gui.search_frame import SearchFrame
 from gui.results_frame import ResultsFrame
 from utils.web_driver_manager import WebDriverManager
-from utils.hotel_scraper import HotelScraper
+from utils.search_dispatcher import SearchDispatcher, build_search_grid
+from utils.async_hotel_scraper import iter_grid
+from utils.config import Config
+import numpy as np
+import queue
+import threading
 
 class HotelSearchApp:
     def __init__(self, root):
@@ -13,7 +18,7 @@ class HotelSearchApp:
         
         # Initialize managers
         self.driver_manager = WebDriverManager()
-        self.hotel_scraper = HotelScraper()
+        self.dispatcher = SearchDispatcher()
         
         # Setup window
         self.setup_window()
@@ -110,80 +115,75 @@ class HotelSearchApp:
             return
             
         self.show_searching_message()
-        
+        self.search_button.configure(state='disabled')
+        
+        # Scrape on a worker thread so the Tk mainloop stays responsive; results are
+        # streamed back through the queue and appended as each search completes
+        self.search_jobs = jobs = build_search_grid(params)
+        self.rows_by_index = {}  # job index -> (start, end) table positions of its rows
+        self.results_frame.clear_results()
+        self.search_outcome = queue.Queue()
+        threading.Thread(target=self.run_search, args=(jobs, params['incremental'], self.search_outcome),
+                         daemon=True).start()
+        self.root.after(200, self.check_search_done)
+        
+    def run_search(self, jobs, incremental, outcome):
         try:
-            all_results = []
-            
-            if params['search_type'] == "single":
-                search_params = {
-                    "ss": params['destination'],
-                    "checkin": params['checkin_date'],
-                    "checkout": params['checkout_date'],
-                    "group_adults": params['base_adults'],
-                    "no_rooms": params['rooms'],
-                    "group_children": params['children'],
-                    "sb": "1",
-                    "src": "searchresults",
-                    "src_elem": "sb",
-                    "filter": params["filter_params"]
-                }
-                # Search for each adult count
-                for adult_count in params['adult_counts']:
-                    search_params['group_adults'] = adult_count
-                    hotel_results = self.hotel_scraper.get_hotel_pricing(search_params)
-                    if hotel_results:
-                        for hotel in hotel_results:
-                            hotel['adults'] = adult_count
-                        all_results.extend(hotel_results)
-                    self.root.after(1000)  # Small delay between requests
+            if Config.SCRAPE_ENGINE == "async":
+                completed = iter_grid(jobs, browser_fallback=self.dispatcher, incremental=incremental)
             else:
-                current_date = start_date
-                while current_date < end_date:
-                    next_date = current_date + timedelta(days=1)
-                    search_params = {
-                        "ss": params['destination'],
-                        "checkin": current_date.strftime('%Y-%m-%d'),
-                        "checkout": next_date.strftime('%Y-%m-%d'),
-                        "group_adults": params['base_adults'],  # Use base adults as default
-                        "no_rooms": params['rooms'],
-                        "group_children": params['children'],
-                        "sb": "1",
-                        "src": "searchresults",
-                        "src_elem": "sb",
-                        "filter": params["filter_params"]
-                    }
-                    
-                    # Search for each adult count
-                    for adult_count in params['adult_counts']:
-                        search_params['group_adults'] = adult_count
-                        hotel_results = self.hotel_scraper.get_hotel_pricing(search_params)
-                        if hotel_results:
-                            for hotel in hotel_results:
-                                hotel['date'] = current_date.strftime('%Y-%m-%d')
-                                hotel['adults'] = adult_count
-                            all_results.extend(hotel_results)
-                        self.root.after(1000)  # Small delay between requests
-                    
-                    current_date = next_date
-                    self.root.after(1000)  # Small delay between requests
-                    self.root.update()
+                # Log in once, then fan the (night x adult count) grid out across the driver pool
+                self.dispatcher.prepare_grid(jobs)
+                completed = self.dispatcher.iter_run(jobs, incremental=incremental)
+            for job, hotel_results in completed:
+                outcome.put(("results", job, hotel_results))
+            outcome.put(("done", None, None))
+        except Exception as e:
+            outcome.put(("error", None, e))
             
-            if not all_results:
-                messagebox.showwarning("No Results", "No hotels found for the selected criteria.")
-                self.results_frame.show_search_criteria()
+    def check_search_done(self):
+        while True:
+            try:
+                kind, job, payload = self.search_outcome.get_nowait()
+            except queue.Empty:
+                self.root.after(200, self.check_search_done)
                 return
+            if kind != "results":
+                break
+            # Show the table as soon as the first hotels arrive
+            if payload:
+                self.rows_by_index[job['index']] = self.results_frame.append_results(payload, job)
+                self.results_frame.frame.configure(text="Search Results (searching...)")
+                self.show_results()
+        
+        self.search_button.configure(state='normal')
+        self.results_frame.frame.configure(text="Search Results")
+        all_results = self.results_frame.table
+        if kind == "error" and not len(all_results):
+            self.searching_label.grid_remove()
+            self.show_error_message(f"An error occurred while searching: {str(payload)}")
+            return
+        if kind == "error":
+            messagebox.showwarning("Search Incomplete", f"Some searches failed: {str(payload)}")
             
-            self.results_frame.update_results(all_results)
-            self.show_results()
-            
-        except Exception as e:
+        if not len(all_results):
+            messagebox.showwarning("No Results", "No hotels found for the selected criteria.")
             self.searching_label.grid_remove()
-            self.show_error_message(f"An error occurred while searching: {str(e)}")
+            self.show_search_criteria()
+            return
+        
+        # Rows arrived in completion order; settle them into grid order unless the user sorted
+        # the table meanwhile. The streamed table is kept, so selections survive.
+        grid_order = [np.arange(*self.rows_by_index[job['index']])
+                      for job in self.search_jobs if job['index'] in self.rows_by_index]
+        self.results_frame.settle_order(np.concatenate(grid_order))
+        self.show_results()
 
 def main():
     root = tk.Tk()
     app = HotelSearchApp(root)
     root.mainloop()
+    app.dispatcher.shutdown()
     WebDriverManager().quit_driver()
 
 if __name__ == "__main__":
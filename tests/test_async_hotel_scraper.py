@@ -0,0 +1,30 @@
+"""asyncio engine pieces that run without the network.
+
+    python -m pytest tests
+"""
+from utils.async_hotel_scraper import session_cookie_jar
+from yarl import URL
+import asyncio
+import unittest
+
+class SessionCookieJarTest(unittest.TestCase):
+    COOKIES = [
+        {"name": "bkng", "value": "domain-wide", "domain": ".booking.com", "path": "/"},
+        {"name": "pcm", "value": "host-only", "domain": "secure.booking.com", "path": "/"},
+    ]
+
+    def filter_cookies(self, url):
+        async def run():
+            return session_cookie_jar(self.COOKIES).filter_cookies(URL(url))
+        return {name: morsel.value for name, morsel in asyncio.run(run()).items()}
+
+    def test_domain_cookie_reaches_subdomains(self):
+        self.assertEqual(self.filter_cookies("https://www.booking.com/searchresults.html"),
+                         {"bkng": "domain-wide"})
+
+    def test_host_only_cookie_stays_on_its_host(self):
+        self.assertEqual(self.filter_cookies("https://secure.booking.com/login.html"),
+                         {"bkng": "domain-wide", "pcm": "host-only"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""HTTP fetch path against the local fixture server (no network, no browser).
+
+    python -m pytest tests
+"""
+from benchmarks.fixture_server import DEST_ID, DEST_TYPE, FixtureServer, load_fixture
+from benchmarks.parser_bench import load_golden
+from utils.config import Config
+from utils.helpers.destination_cache import DestinationCache
+from utils.http_fetcher import HttpFetcher
+from utils.hotel_scraper import HotelScraper
+from utils.parse_pipeline import ParsePipeline
+from utils.response_cache import ResponseCache
+import os
+import tempfile
+import threading
+import unittest
+
+class NoBrowser:
+    """Driver manager that fails the test if the scraper falls back to the browser"""
+
+    def get_driver(self):
+        raise AssertionError("the HTTP path fell back to the browser")
+
+
+class HttpFetchTest(unittest.TestCase):
+    SETTINGS = ("BOOKING_BASE_URL", "BOOKING_AUTOCOMPLETE_URL", "DESTINATION_CACHE_FILE", "SESSION_FILE",
+                "FETCH_MODE", "PAGINATION_MODE", "RESPONSE_CACHE_ENABLED", "METRICS_ENABLED",
+                "PARSE_WORKERS", "DO_LOGING", "RESPONSE_CACHE_DIR", "CACHE_REPLAY_ONLY",
+                "RESULTS_PAGE_SIZE", "MAX_RESULTS")
+    PARAMS = {"ss": "Chennai, India", "checkin": "2025-07-15", "checkout": "2025-07-17",
+              "group_adults": "2", "no_rooms": "1", "group_children": "0"}
+
+    def setUp(self):
+        self.server = FixtureServer("small").start()
+        self.addCleanup(self.server.stop)
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.data_dir.cleanup)
+        self.saved = {name: getattr(Config, name) for name in self.SETTINGS}
+        self.addCleanup(self.restore_config)
+        Config.BOOKING_BASE_URL = self.server.base_url
+        Config.BOOKING_AUTOCOMPLETE_URL = self.server.autocomplete_url
+        Config.DESTINATION_CACHE_FILE = os.path.join(self.data_dir.name, "destinations.json")
+        Config.SESSION_FILE = os.path.join(self.data_dir.name, "session.json")
+        Config.RESPONSE_CACHE_DIR = os.path.join(self.data_dir.name, "responses")
+        Config.FETCH_MODE = "http"
+        Config.PAGINATION_MODE = "scroll"
+        Config.RESPONSE_CACHE_ENABLED = False
+        Config.METRICS_ENABLED = False
+        Config.PARSE_WORKERS = 0
+        Config.DO_LOGING = False
+        self.reset_singletons()
+
+    def restore_config(self):
+        for name, value in self.saved.items():
+            setattr(Config, name, value)
+        self.reset_singletons()
+
+    @staticmethod
+    def reset_singletons():
+        for singleton in (DestinationCache, HttpFetcher, ParsePipeline, ResponseCache):
+            singleton._instance = None
+
+    def test_search_runs_over_http(self):
+        hotels = HotelScraper(driver_manager=NoBrowser()).get_hotel_pricing(dict(self.PARAMS))
+
+        self.assertEqual([hotel.to_dict() for hotel in hotels], load_golden("small"))
+        self.assertEqual(DestinationCache().get("Chennai, India"), (DEST_ID, DEST_TYPE))
+        methods = [method for method, _ in self.server.requests]
+        self.assertEqual(methods, ["POST", "GET"])
+        self.assertIn(f"dest_id={DEST_ID}", self.server.requests[1][1])
+
+    def test_replay_only_stays_offline(self):
+        Config.RESPONSE_CACHE_ENABLED = True
+        HotelScraper(driver_manager=NoBrowser()).get_hotel_pricing(dict(self.PARAMS))
+        self.server.requests.clear()
+        Config.CACHE_REPLAY_ONLY = True
+        self.reset_singletons()
+
+        hotels = HotelScraper(driver_manager=NoBrowser()).get_hotel_pricing(dict(self.PARAMS))
+        self.assertEqual(len(hotels), len(load_golden("small")))
+        missing = dict(self.PARAMS, ss="Madurai, India")
+        self.assertEqual(HotelScraper(driver_manager=NoBrowser()).get_hotel_pricing(missing), [])
+        self.assertEqual(self.server.requests, [])
+
+    def test_offset_pages_stop_at_the_last_result(self):
+        Config.PAGINATION_MODE = "offset"
+        Config.RESULTS_PAGE_SIZE = len(load_golden("small"))  # every fixture page is a full page
+        Config.MAX_RESULTS = 40 * Config.RESULTS_PAGE_SIZE
+        self.server.pages = 2
+
+        hotels = HotelScraper(driver_manager=NoBrowser()).get_hotel_pricing(dict(self.PARAMS))
+        self.assertEqual(len(hotels), len(load_golden("small")))  # page 2 repeats page 1's hotels
+        pages_fetched = sum(1 for method, path in self.server.requests if method == "GET")
+        self.assertLess(pages_fetched, 40)
+
+    def test_dropped_card_does_not_end_the_results(self):
+        Config.PAGINATION_MODE = "offset"
+        Config.RESULTS_PAGE_SIZE = 6  # both fixtures hold six property cards
+        Config.MAX_RESULTS = 4 * Config.RESULTS_PAGE_SIZE
+        self.server.page_sources = [load_fixture("edge_cases"), load_fixture("small")]
+        self.server.pages = 2
+
+        hotels = HotelScraper(driver_manager=NoBrowser()).get_hotel_pricing(dict(self.PARAMS))
+        # edge_cases has a card without a review score, which the parser drops
+        self.assertEqual(len(hotels), len(load_golden("edge_cases")) + len(load_golden("small")))
+        self.assertEqual([hotel.serial_no for hotel in hotels], list(range(1, len(hotels) + 1)))
+
+    def test_fetch_returns_none_on_missing_page(self):
+        self.assertIsNone(HttpFetcher().fetch(f"{self.server.root}/missing.html"))
+
+    def test_each_thread_has_its_own_session(self):
+        fetcher = HttpFetcher()
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(fetcher.session))
+        thread.start()
+        thread.join()
+        self.assertIs(fetcher.session, fetcher.session)
+        self.assertIsNot(fetcher.session, sessions[0])
+
+    def test_fetch_threads_reuse_connections(self):
+        Config.PAGINATION_MODE = "offset"
+        Config.RESULTS_PAGE_SIZE = len(load_golden("small"))
+        Config.MAX_RESULTS = 4 * Config.RESULTS_PAGE_SIZE
+        self.server.pages = 4
+        for _ in range(3):
+            HotelScraper(driver_manager=NoBrowser()).get_hotel_pricing(dict(self.PARAMS))
+        # Three searches of four offset pages plus one autocomplete call, each on fresh threads
+        self.assertLessEqual(len(self.server.connections), Config.PAGINATION_WORKERS + 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+"""ResultsTable sorting and row access while rows are still being appended.
+
+    python -m pytest tests
+"""
+from utils.hotel_record import HotelRecord
+from utils.results_table import ResultsTable
+import unittest
+
+def hotels(*prices):
+    return [HotelRecord(serial_no=index, name=f"Hotel {price}", link=f"https://example.com/{price}",
+                        location="Chennai", price=price, currency="₹")
+            for index, price in enumerate(prices, 1)]
+
+
+class ResultsTableTest(unittest.TestCase):
+    def test_sort_order_includes_rows_appended_after_sorting(self):
+        table = ResultsTable()
+        table.append(hotels(300, 100))
+        self.assertEqual(table.sort_order("price").tolist(), [1, 0])
+
+        table.append(hotels(200))
+        self.assertEqual(table.sort_order("price").tolist(), [1, 2, 0])
+        self.assertEqual(table.sort_order("price", descending=True).tolist(), [0, 2, 1])
+
+    def test_rows_read_across_appended_chunks(self):
+        table = ResultsTable()
+        table.append(hotels(300, 100))
+        table.display_rows(range(0, 2))
+        table.append(hotels(200))
+        self.assertEqual([row[1] for row in table.display_rows([2, 0, 1])],
+                         ["Hotel 200", "Hotel 300", "Hotel 100"])
+        self.assertEqual(table.link(2), "https://example.com/200")
+
+if __name__ == "__main__":
+    unittest.main()
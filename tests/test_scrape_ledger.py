@@ -0,0 +1,41 @@
+"""Incremental refresh: cells reused from the ScrapeLedger keep their original fetch time.
+
+    python -m pytest tests
+"""
+from datetime import date, timedelta
+from utils.exporters import export_rows
+from utils.hotel_record import HotelRecord
+from utils.scrape_ledger import ScrapeLedger
+import os
+import tempfile
+import time
+import unittest
+
+class ScrapeLedgerTest(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.data_dir.cleanup)
+        self.ledger = ScrapeLedger(os.path.join(self.data_dir.name, "ledger.db"))
+        checkin = date.today() + timedelta(days=30)
+        self.job = {"index": 0, "date": None, "adults": 2, "params": {
+            "ss": "Chennai, India", "checkin": checkin.isoformat(),
+            "checkout": (checkin + timedelta(days=1)).isoformat(), "group_adults": 2}}
+
+    def test_reused_rows_keep_their_fetch_time(self):
+        fetched_at = time.time() - 3600
+        hotel = HotelRecord(1, "Hotel A", "https://example.com/a", "Chennai", price=3450.0, currency="₹")
+        hotel.fetched_at = fetched_at
+        self.ledger.record([self.job], {0: [hotel]})
+
+        reused, stale = self.ledger.partition([self.job])
+        self.assertEqual(stale, [])
+        [restored] = reused[0]
+        self.assertEqual(restored.to_dict(), hotel.to_dict())
+        self.assertEqual(restored.fetched_at, fetched_at)
+        self.assertTrue(restored.cached)
+
+        [row] = export_rows(self.job, reused[0])
+        self.assertEqual(row["scraped_at"], time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(fetched_at)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,280 @@
+from utils.card_parser import count_property_cards, has_property_cards
+from utils.config import Config
+from utils.helpers.destination_cache import DestinationCache
+from utils.helpers.retry_policy import CircuitOpenError, FetchPolicy, HttpStatusError, host_of
+from utils.helpers.session_helper import SessionHelper
+from utils.hotel_scraper import HotelScraper
+from utils.http_fetcher import HttpFetcher
+from utils.metrics import ScrapeMetrics
+from utils.parse_pipeline import ParsePipeline
+from utils.price_history import PriceHistoryStore
+from utils.response_cache import ResponseCache, replay_only
+from utils.search_dispatcher import annotate_results, merge_in_grid_order
+from utils.scrape_ledger import ScrapeLedger
+from http.cookies import SimpleCookie
+from yarl import URL
+import aiohttp
+import asyncio
+import logging
+import threading
+import time
+
+# Serializes destination lookups on the process-wide WebDriverManager browser
+_browser_lock = threading.Lock()
+
+def session_cookie_jar(cookies):
+    """aiohttp CookieJar holding the saved browser cookies. A '.booking.com' cookie keeps its
+    domain attribute so it is sent to www.booking.com too; without one the jar would store
+    it as host-only for booking.com."""
+    cookie_jar = aiohttp.CookieJar()
+    for cookie in cookies:
+        domain = cookie.get('domain') or 'www.booking.com'
+        entry = SimpleCookie()
+        entry[cookie['name']] = cookie['value']
+        entry[cookie['name']]['path'] = cookie.get('path') or '/'
+        if domain.startswith('.'):
+            entry[cookie['name']]['domain'] = domain
+        cookie_jar.update_cookies(entry, URL(f"https://{domain.lstrip('.')}/"))
+    return cookie_jar
+
+
+class AsyncHotelScraper:
+    """asyncio counterpart of HotelScraper that keeps many searches in flight over aiohttp.
+
+    Use as an async context manager. Pages without property cards can optionally be
+    retried in the browser by passing a SearchDispatcher as browser_fallback; those
+    calls run in a worker thread so they never block the event loop.
+    """
+
+    def __init__(self, concurrency=None, browser_fallback=None):
+        self.concurrency = concurrency or Config.ASYNC_CONCURRENCY
+        self.browser_fallback = browser_fallback
+        self._session = None
+        self._semaphore = None
+        self._pending_destinations = {}
+        self._setup_logging()
+
+    def _setup_logging(self):
+        self.logger = logging.getLogger('AsyncHotelScraper')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+
+    async def __aenter__(self):
+        self._session = aiohttp.ClientSession(
+            headers=HttpFetcher.HEADERS,
+            cookie_jar=session_cookie_jar(SessionHelper().cookies()),
+            connector=aiohttp.TCPConnector(limit=self.concurrency),
+            timeout=aiohttp.ClientTimeout(total=Config.HTTP_TIMEOUT),
+        )
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._session.close()
+        self._session = None
+
+    async def _get_text(self, url):
+        """GET url and return the body, or None on a non-200 response or network error"""
+        try:
+            return await FetchPolicy().call_async(host_of(url), self._get_text_once, url, label="HTTP fetch")
+        except (aiohttp.ClientError, asyncio.TimeoutError, HttpStatusError, CircuitOpenError) as e:
+            self.logger.warning(f"HTTP fetch failed: {str(e)}")
+            return None
+
+    async def _get_text_once(self, url):
+        async with self._semaphore:
+            async with self._session.get(url) as response:
+                if response.status in Config.RETRYABLE_STATUS_CODES:
+                    raise HttpStatusError(response.status, url)
+                if response.status != 200:
+                    self.logger.warning(f"HTTP fetch returned status {response.status}")
+                    return None
+                return await response.text()
+
+    async def _post_json_once(self, url, payload):
+        async with self._semaphore:
+            async with self._session.post(url, json=payload) as response:
+                if response.status in Config.RETRYABLE_STATUS_CODES:
+                    raise HttpStatusError(response.status, url)
+                if response.status != 200:
+                    return None
+                return await response.json(content_type=None)
+
+    async def get_destination_info(self, search_term):
+        """Get destination ID and type, sharing one lookup between concurrent callers"""
+        if replay_only():
+            return HotelScraper.cached_destination(search_term)
+        cache = DestinationCache()
+        dest_id, dest_type = cache.get(search_term)
+        if dest_id and dest_type:
+            return dest_id, dest_type
+
+        key = cache.normalize(search_term)
+        if key not in self._pending_destinations:
+            self._pending_destinations[key] = asyncio.ensure_future(self._resolve_destination(search_term))
+        try:
+            return await asyncio.shield(self._pending_destinations[key])
+        finally:
+            self._pending_destinations.pop(key, None)
+
+    async def _resolve_destination(self, search_term):
+        dest_id, dest_type = None, None
+        if Config.RESOLVE_DESTINATION_VIA_HTTP:
+            try:
+                data = await FetchPolicy().call_async(
+                    host_of(Config.BOOKING_AUTOCOMPLETE_URL), self._post_json_once,
+                    Config.BOOKING_AUTOCOMPLETE_URL, HotelScraper.autocomplete_payload(search_term),
+                    label="Autocomplete")
+                if data is not None:
+                    dest_id, dest_type = HotelScraper.parse_autocomplete(data)
+            except (aiohttp.ClientError, asyncio.TimeoutError, HttpStatusError, CircuitOpenError,
+                    ValueError) as e:
+                self.logger.warning(f"Autocomplete lookup failed: {str(e)}")
+
+        if dest_id and dest_type:
+            DestinationCache().put(search_term, dest_id, dest_type)
+            return dest_id, dest_type
+
+        # Fall back to the browser redirect in a worker thread, on a pool driver when there is
+        # a pool; the shared WebDriverManager browser is only ever driven by one thread at a time
+        if self.browser_fallback is not None:
+            return await asyncio.to_thread(self.browser_fallback.resolve_destination, search_term)
+        return await asyncio.to_thread(self._resolve_in_browser, search_term)
+
+    @staticmethod
+    def _resolve_in_browser(search_term):
+        with _browser_lock:
+            return HotelScraper().get_destination_info(search_term)
+
+    async def get_hotel_pricing(self, params, job=None):
+        """Fetch and parse one results page; falls back to the browser when it has no cards"""
+        params = dict(params)
+        dest_id, dest_type = await self.get_destination_info(params["ss"])
+        if not dest_id or not dest_type:
+            self.logger.error("Could not find destination information")
+            return []
+
+        url = HotelScraper.compose_search_url(params, dest_id, dest_type)
+        if Config.PAGINATION_MODE == "offset":
+            page_count = max(1, -(-Config.MAX_RESULTS // Config.RESULTS_PAGE_SIZE))
+            pages = await asyncio.gather(*[
+                self._fetch_results(HotelScraper.page_url(url, page)) for page in range(page_count)
+            ])
+            hotel_results = HotelScraper.merge_result_pages(pages, Config.MAX_RESULTS)
+        else:
+            hotel_results, _ = await self._fetch_results(url)
+
+        if not hotel_results and self.browser_fallback is not None and job is not None:
+            self.logger.info("HTTP response had no property cards, falling back to WebDriver")
+            return await asyncio.to_thread(self.browser_fallback.run_job, job)
+        return annotate_results(hotel_results, job) if job is not None else hotel_results
+
+    async def _fetch_results(self, url):
+        """Fetch and parse one results page, going through the response cache when enabled.
+        Returns (hotels, property cards on the page before parsing)."""
+        cache = ResponseCache() if Config.RESPONSE_CACHE_ENABLED else None
+        page_source, stored_at = cache.lookup(url) if cache else (None, None)
+        if page_source is not None:
+            self.logger.info(f"Serving results page from cache: {url}")
+            return (HotelScraper.stamp_fetch(await ParsePipeline().parse_async(page_source), stored_at, True),
+                    count_property_cards(page_source))
+        if cache and cache.replay_only:
+            self.logger.warning(f"Replay-only mode and no cached page for: {url}")
+            return [], 0
+
+        self.logger.info(f"Fetching URL over HTTP: {url}")
+        with ScrapeMetrics().phase('http_fetch'):
+            page_source = await self._get_text(url)
+        fetched_at = time.time()
+        if has_property_cards(page_source) and cache:
+            await asyncio.to_thread(cache.put, url, page_source)
+        return (HotelScraper.stamp_fetch(await ParsePipeline().parse_async(page_source), fetched_at, False),
+                count_property_cards(page_source))
+
+    async def get_filter_details(self, search_term):
+        page_source = await self._get_text(f"{Config.BOOKING_BASE_URL}?ss={search_term}")
+        if not page_source:
+            return None
+        try:
+            return await asyncio.to_thread(HotelScraper.parse_filter_details, page_source)
+        except Exception as e:
+            self.logger.error(f"Error parsing filter details: {str(e)}")
+            return None
+
+    async def iter_grid(self, jobs):
+        """Yield (job, hotel_results) for each search grid job as soon as it completes.
+        hotel_results is None when the search failed."""
+        async def run(job):
+            try:
+                with ScrapeMetrics().phase('query'):
+                    hotel_results = await self.get_hotel_pricing(job['params'], job)
+                ScrapeMetrics().increment('queries')
+                return job, hotel_results
+            except Exception as e:
+                self.logger.error(f"Search {job['index']} (date={job['date']}, adults={job['adults']}) failed: {str(e)}")
+                return job, None
+
+        for next_done in asyncio.as_completed([run(job) for job in jobs]):
+            yield await next_done
+
+    async def iter_results(self, jobs, incremental=False):
+        """Yield (job, hotel_results) for every successful job as soon as it is available,
+        reusing fresh ledger cells when incremental is set (see SearchDispatcher.iter_run)"""
+        ledger = ScrapeLedger()
+        history = PriceHistoryStore() if Config.PRICE_HISTORY_ENABLED else None
+        reused, pending = ledger.partition(jobs) if incremental else ({}, list(jobs))
+        for job in jobs:
+            if job['index'] in reused:
+                yield job, reused[job['index']]
+
+        scraped = {}
+        try:
+            async for job, hotel_results in self.iter_grid(pending):
+                if hotel_results is not None:
+                    scraped[job['index']] = hotel_results
+                    if history is not None:
+                        history.record(job, hotel_results)
+                    yield job, hotel_results
+        finally:
+            ledger.record(pending, scraped)
+            if history is not None:
+                history.flush()
+            ScrapeMetrics().export()
+
+    async def run_grid(self, jobs, incremental=False):
+        """Run every job and return the merged results in grid order (see SearchDispatcher.run)"""
+        results_by_index = {}
+        async for job, hotel_results in self.iter_results(jobs, incremental):
+            results_by_index[job['index']] = hotel_results
+        return merge_in_grid_order(jobs, results_by_index)
+
+
+def run_grid(jobs, concurrency=None, browser_fallback=None, incremental=False):
+    """Blocking helper that runs a search grid on a fresh event loop"""
+    async def main():
+        async with AsyncHotelScraper(concurrency, browser_fallback) as scraper:
+            return await scraper.run_grid(jobs, incremental)
+    return asyncio.run(main())
+
+
+def iter_grid(jobs, concurrency=None, browser_fallback=None, incremental=False):
+    """Blocking generator over (job, hotel_results) as searches complete, for callers on a
+    worker thread that want results streamed rather than returned at the end"""
+    loop = asyncio.new_event_loop()
+    scraper = AsyncHotelScraper(concurrency, browser_fallback)
+    loop.run_until_complete(scraper.__aenter__())
+    results = scraper.iter_results(jobs, incremental)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(results.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(results.aclose())
+        loop.run_until_complete(scraper.__aexit__(None, None, None))
+        loop.close()
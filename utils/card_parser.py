@@ -0,0 +1,167 @@
+from bs4 import BeautifulSoup
+from lxml import etree, html
+from utils.config import Config
+from utils.hotel_record import HotelRecord
+from utils.metrics import ScrapeMetrics
+import logging
+import re
+
+PROPERTY_CARD_MARKER = 'data-testid="property-card"'
+# Results-page header, e.g. "Chennai: 1,234 properties found"; block and challenge pages lack it
+RESULTS_HEADER_PATTERN = re.compile(r'(?:\d[\d,]*|No) propert(?:y|ies) found')
+
+def has_property_cards(page_source):
+    """Cheap check that a page has result cards, without parsing it"""
+    return bool(page_source) and PROPERTY_CARD_MARKER in page_source
+
+def count_property_cards(page_source):
+    """Number of result cards on the page, including cards the parsers go on to drop"""
+    return page_source.count(PROPERTY_CARD_MARKER) if page_source else 0
+
+def is_results_page(page_source):
+    """True for a genuine results page, including one past the last result that has no cards"""
+    return has_property_cards(page_source) or bool(page_source and RESULTS_HEADER_PATTERN.search(page_source))
+
+
+class CardParser:
+    """Base class for property-card parsers. parse() turns a results page into HotelRecords;
+    subclasses implement _parse_cards()."""
+
+    name = None
+
+    def __init__(self):
+        self.logger = logging.getLogger('HotelScraper')
+
+    def _parse_cards(self, page_source):
+        raise NotImplementedError
+
+    def parse(self, page_source):
+        metrics = ScrapeMetrics()
+        metrics.observe('page_source_bytes', len(page_source), buckets=Config.METRICS_BYTES_BUCKETS)
+        with metrics.phase('parse'):
+            return self._parse_cards(page_source)
+
+
+class SoupCardParser(CardParser):
+    """Original BeautifulSoup/html.parser implementation, kept as the fallback backend"""
+
+    name = "soup"
+
+    def _parse_cards(self, page_source):
+        soup = BeautifulSoup(page_source, 'html.parser')
+        hotel_results = []
+
+        # Find all property cards
+        for index, el in enumerate(soup.find_all("div", {"data-testid": "property-card"}), 1):
+            try:
+                title = el.find("div", {"data-testid": "title"})
+                title_link = el.find("a", {"data-testid": "title-link"})
+                address = el.find("span", {"data-testid": "address"})
+                pricing = el.find("span", {"data-testid": "price-and-discounted-price"})
+                tax = el.find("div", {"data-testid": "taxes-and-charges"})
+
+                # Extract review score
+                review = el.select_one('a[data-testid="review-score-link"] > span > div > div:nth-child(2)').text
+                review_count = el.select_one('a[data-testid="review-score-link"] > span > div > div:nth-child(3) > div:nth-child(2)').text
+                record = HotelRecord.from_text(
+                    serial_no=index,
+                    name=title.text.strip() if title else "",
+                    link=title_link["href"] if title_link else "",
+                    location=address.text.strip() if address else "",
+                    price_text=pricing.text if pricing else None,
+                    tax_text=tax.text.replace("taxes and fees", "") if tax else "",
+                    review_text=review,
+                    review_count_text=review_count,
+                )
+            except Exception as e:
+                self.logger.warning(f"Error processing hotel card: {str(e)}")
+                ScrapeMetrics().increment('cards_dropped', parser=self.name)
+                continue
+            ScrapeMetrics().increment('cards_found', parser=self.name)
+            hotel_results.append(record)
+
+        return hotel_results
+
+
+class LxmlCardParser(CardParser):
+    """lxml parser with precompiled XPath and a single walk over each card's elements"""
+
+    name = "lxml"
+
+    # (tag, data-testid) pairs collected in one pass over the card
+    _card_fields = {
+        ("div", "title"): "name",
+        ("a", "title-link"): "link",
+        ("span", "address"): "location",
+        ("span", "price-and-discounted-price"): "pricing",
+        ("div", "taxes-and-charges"): "tax",
+        ("a", "review-score-link"): "review_link",
+    }
+    _find_cards = etree.XPath('//div[@data-testid="property-card"]')
+    # Equivalent of "> span > div > div:nth-child(2)" and "... > div:nth-child(3) > div:nth-child(2)"
+    _find_review = etree.XPath('./span/div/*[2][self::div]')
+    _find_review_count = etree.XPath('./span/div/*[3][self::div]/*[2][self::div]')
+
+    def _parse_cards(self, page_source):
+        try:
+            tree = html.fromstring(page_source)
+        except (etree.ParserError, ValueError) as e:
+            self.logger.warning(f"Could not parse results page: {str(e)}")
+            return []
+        hotel_results = []
+
+        for index, card in enumerate(self._find_cards(tree), 1):
+            try:
+                found = {}
+                for el in card.iter(tag=etree.Element):
+                    testid = el.get("data-testid")
+                    if testid is None:
+                        continue
+                    field = self._card_fields.get((el.tag, testid))
+                    if field and field not in found:
+                        found[field] = el
+
+                review_link = found.get("review_link")
+                if review_link is None:
+                    raise ValueError("review score link not found")
+                review = self._find_review(review_link)
+                review_count = self._find_review_count(review_link)
+                if not review or not review_count:
+                    raise ValueError("review score not found")
+
+                title = found.get("name")
+                title_link = found.get("link")
+                address = found.get("location")
+                pricing = found.get("pricing")
+                tax = found.get("tax")
+                record = HotelRecord.from_text(
+                    serial_no=index,
+                    name=title.text_content().strip() if title is not None else "",
+                    link=title_link.attrib["href"] if title_link is not None else "",
+                    location=address.text_content().strip() if address is not None else "",
+                    price_text=pricing.text_content() if pricing is not None else None,
+                    tax_text=tax.text_content().replace("taxes and fees", "") if tax is not None else "",
+                    review_text=review[0].text_content(),
+                    review_count_text=review_count[0].text_content(),
+                )
+            except Exception as e:
+                self.logger.warning(f"Error processing hotel card: {str(e)}")
+                ScrapeMetrics().increment('cards_dropped', parser=self.name)
+                continue
+            ScrapeMetrics().increment('cards_found', parser=self.name)
+            hotel_results.append(record)
+
+        return hotel_results
+
+
+CARD_PARSERS = {
+    SoupCardParser.name: SoupCardParser,
+    LxmlCardParser.name: LxmlCardParser,
+}
+
+def get_card_parser(name=None):
+    """Return a parser instance for Config.CARD_PARSER (or the given backend name)"""
+    name = name or Config.CARD_PARSER
+    if name not in CARD_PARSERS:
+        raise ValueError(f"Unknown card parser '{name}', expected one of: {', '.join(CARD_PARSERS)}")
+    return CARD_PARSERS[name]()
@@ -1,15 +1,131 @@
+import os
 
 class Config:
+    # Local storage for sessions and caches
+    DATA_DIR = os.path.join(os.path.expanduser("~"), ".webscrap")
+
     # Booking.com configuration
     BOOKING_LOGIN_URL = "https://account.booking.com/sign-in"
-    BOOKING_BASE_URL = "https://www.booking.com/searchresults.html"
+    # Both can be pointed at a local stand-in (see benchmarks/fixture_server.py) through the environment
+    BOOKING_BASE_URL = os.environ.get("WEBSCRAP_BASE_URL", "https://www.booking.com/searchresults.html")
+    BOOKING_AUTOCOMPLETE_URL = os.environ.get("WEBSCRAP_AUTOCOMPLETE_URL",
+                                              "https://accommodations.booking.com/autocomplete.json")
     SORT_ORDER = "price"
     AID = "7342860"
     LANG = "en-us"
     SRC = "searchresults"
+    DEFAULT_CURRENCY = "₹"  # shown when a card has no currency symbol
     # Scraping configuration
-    SCROLL_PAUSE_TIME = 3
+    SCROLL_PAUSE_TIME = 3  # maximum seconds to wait for a scroll to load more cards
     MAX_SCROLL_ATTEMPTS = 5
+    CARD_PARSER = "lxml"  # "lxml" (fast) or "soup" (BeautifulSoup fallback)
+    PARSE_WORKERS = None  # parser processes fed by the fetchers; None = one per CPU core, 0 = parse on the fetching thread
+    PARSE_QUEUE_SIZE = 8  # fetched pages waiting for a parser before fetchers block (backpressure)
+    PARSE_START_METHOD = "spawn"  # "spawn" or "forkserver"; forking a process running Tk and Selenium is unsafe
+    FETCH_MODE = "http"  # "http" tries a plain HTTP request before the browser, "driver" always uses the browser
+    PAGINATION_MODE = "scroll"  # "scroll" loads one lazy list, "offset" fetches result pages in parallel
+    RESULTS_PAGE_SIZE = 25  # hotels per results page (offset step)
+    MAX_RESULTS = 100  # upper bound on hotels per search in offset mode
+    PAGINATION_WORKERS = 4  # concurrent page fetches per search in offset mode
+
+    # HTTP session configuration
+    HTTP_POOL_CONNECTIONS = 4  # distinct hosts kept in the pool
+    HTTP_POOL_SIZE = 16  # keep-alive connections per host
+    HTTP_TIMEOUT = 20  # seconds
+
+    # Wait engine configuration
+    PAGE_READY_TIMEOUT = 10  # seconds
+    WAIT_POLL_INTERVAL = 0.25  # seconds between readiness checks
+    OTP_TIMEOUT = 60  # seconds to wait for the OTP email
+    OTP_POLL_INTERVAL = 3  # seconds between mailbox checks
+    OTP_CLOCK_SKEW = 5  # seconds an OTP email may be dated before the request and still count
+
+    # Lean scrape driver profile: headless Chrome that blocks resources the parser never uses
+    LEAN_SCRAPE = True
+    BLOCKED_RESOURCE_TYPES = ["Image", "Media", "Font"]
+    RESOURCE_TYPE_PATTERNS = {
+        "Image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*cf.bstatic.com/xdata/images/*"],
+        "Media": ["*.mp4", "*.webm", "*.mp3", "*.m3u8"],
+        "Font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    }
+    BLOCKED_URL_PATTERNS = [  # analytics, ads and maps
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+        "*facebook.net*", "*hotjar.com*", "*criteo.*", "*bat.bing.com*",
+        "*maps.googleapis.com*", "*maps.gstatic.com*",
+    ]
+    # Deny patterns to drop from the lists above, matched against the pattern text: "*.svg" keeps
+    # SVGs loading. This is not a per-URL exemption; a URL that another deny pattern still
+    # matches stays blocked (Network.setBlockedURLs has no allow rules)
+    ALLOWED_URL_PATTERNS = []
+    ESTIMATED_RESOURCE_BYTES = {  # typical transfer size per blocked request, for the savings estimate
+        "Image": 40 * 1024,
+        "Media": 500 * 1024,
+        "Font": 30 * 1024,
+        "Script": 60 * 1024,
+        "Other": 10 * 1024,
+    }
+
+    # Driver pool configuration
+    DRIVER_POOL_SIZE = 3
+    DRIVER_PROFILE_ROOT = None  # None creates a temporary directory for the pool profiles
+
+    # Retry, circuit breaker and rate limiting (shared by every fetch path)
+    RETRY_MAX_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 1  # seconds, doubled on every attempt (with full jitter)
+    RETRY_MAX_DELAY = 30  # seconds
+    RETRY_UNKNOWN_ERRORS = False  # retry exceptions that have no explicit rule
+    RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+    CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive failures before a host is paused
+    CIRCUIT_RESET_TIMEOUT = 60  # seconds a paused host waits before a trial request
+    DEFAULT_RATE_LIMIT = 2  # requests per second per host
+    HOST_RATE_LIMITS = {
+        "www.booking.com": 2,
+        "accommodations.booking.com": 5,
+    }
+    RATE_LIMIT_BURST = 4  # requests allowed back-to-back before pacing kicks in
+
+    # Results-page cache
+    RESPONSE_CACHE_ENABLED = True
+    RESPONSE_CACHE_DIR = os.path.join(DATA_DIR, "responses")
+    RESPONSE_CACHE_TTL = 30 * 60  # seconds a cached results page stays fresh
+    RESPONSE_CACHE_MAX_BYTES = 200 * 1024 * 1024  # least recently used pages are evicted past this size
+    RESPONSE_CACHE_COMPRESSION = 6  # zlib level
+    CACHE_REPLAY_ONLY = False  # serve only from the cache (offline replay), never fetch
+
+    # Incremental refresh
+    SCRAPE_LEDGER_FILE = os.path.join(DATA_DIR, "scrape_ledger.db")
+    INCREMENTAL_FRESHNESS = 6 * 60 * 60  # seconds before a scraped night is re-fetched
+    NEAR_TERM_DAYS = 7  # nights starting within this many days use the shorter window
+    NEAR_TERM_FRESHNESS = 60 * 60  # seconds
+
+    # Price history (every scraped row, for trajectories and cheapest-night queries)
+    PRICE_HISTORY_ENABLED = True
+    PRICE_HISTORY_FILE = os.path.join(DATA_DIR, "price_history.db")
+    PRICE_HISTORY_BATCH_SIZE = 5000  # buffered rows written per transaction
+
+    # Recurring watch jobs
+    WATCH_DEFAULT_INTERVAL = 6 * 60 * 60  # seconds between runs of a watch job
+    WATCH_DEFAULT_NIGHTS = 7  # nights covered by a watch job's date window
+
+    # Scrape metrics (per-phase timings, histograms)
+    METRICS_ENABLED = True
+    METRICS_JSON_FILE = os.path.join(DATA_DIR, "metrics.json")
+    METRICS_PROMETHEUS_FILE = os.path.join(DATA_DIR, "metrics.prom")  # for node_exporter's textfile collector
+    METRICS_PORT = None  # e.g. 9464 to serve /metrics over HTTP
+    METRICS_SECONDS_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+    METRICS_BYTES_BUCKETS = (50_000, 100_000, 250_000, 500_000, 1_000_000, 2_500_000, 5_000_000, 10_000_000)
+
+    # Search engine: "pool" runs searches on the driver pool, "async" keeps many HTTP
+    # searches in flight with asyncio and only uses the pool as a fallback
+    SCRAPE_ENGINE = "pool"
+    ASYNC_CONCURRENCY = 20  # maximum concurrent requests for the async engine
+
+    # Results table: above this many rows only the rows in view (plus a buffer) are in the Treeview
+    VIRTUAL_TABLE_THRESHOLD = 2000
+    VIRTUAL_TABLE_BUFFER = 100  # rows kept above and below the visible ones
+
+    # File export (CSV, JSONL, SQLite, Parquet)
+    EXPORT_CHUNK_ROWS = 10000  # rows converted and written at a time (one Parquet row group)
 
     # Animation frames for loading
     LOADING_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
@@ -22,5 +138,19 @@ class Config:
 
     DO_LOGING = True
 
+    # Session persistence
+    SESSION_FILE = os.path.join(DATA_DIR, "session.json")
+    SESSION_TTL = 12 * 60 * 60  # seconds before a saved login is considered stale
+
+    # Destination resolution
+    DESTINATION_CACHE_FILE = os.path.join(DATA_DIR, "destinations.json")
+    DESTINATION_CACHE_TTL = 30 * 24 * 60 * 60  # dest_ids rarely change
+    RESOLVE_DESTINATION_VIA_HTTP = True  # Try the autocomplete endpoint before the browser
+
+    # Filter catalog (search filters per destination)
+    FILTER_CACHE_FILE = os.path.join(DATA_DIR, "filters.json")
+    FILTER_CACHE_TTL = 24 * 60 * 60  # seconds before a destination's filters are fetched again
+    FILTER_CATALOG_WORKERS = 2  # background threads fetching filter lists
+
     # Feature Toggles
     GET_FILTER_FROM_WEB_PAGE = False
\ No newline at end of file
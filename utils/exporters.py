@@ -0,0 +1,222 @@
+from utils.config import Config
+from utils.results_table import RESULT_COLUMNS, ResultsTable, frame_values
+import csv
+import json
+import os
+import sqlite3
+import time
+
+# Search context columns followed by the HotelRecord fields, in output order
+EXPORT_COLUMNS = RESULT_COLUMNS
+
+def export_rows(job, hotel_results, scraped_at=None):
+    """Flatten one job's HotelRecords into dicts keyed by EXPORT_COLUMNS"""
+    return ResultsTable.from_records(hotel_results, job, scraped_at).records(EXPORT_COLUMNS)
+
+
+class Exporter:
+    """Streams search results to a file as each job completes, or a whole ResultsTable frame in
+    chunks of Config.EXPORT_CHUNK_ROWS, so memory does not grow with the result size.
+    Use as a context manager; stats() reports the throughput."""
+
+    format = None
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self.append = append
+        self.rows_written = 0
+        self.chunk_rows = Config.EXPORT_CHUNK_ROWS
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, job, hotel_results):
+        rows = export_rows(job, hotel_results)
+        self._write_rows(rows)
+        self.rows_written += len(rows)
+        return len(rows)
+
+    def write_table(self, frame, positions=None):
+        """Write a ResultsTable.frame (in the given row order) chunk by chunk; returns the row count"""
+        positions = range(len(frame)) if positions is None else positions
+        for start in range(0, len(positions), self.chunk_rows):
+            chunk = frame.iloc[positions[start:start + self.chunk_rows]][list(EXPORT_COLUMNS)]
+            self._write_frame(chunk)
+            self.rows_written += len(chunk)
+        return len(positions)
+
+    def _write_frame(self, chunk):
+        """Write a DataFrame chunk; formats with a columnar writer override this"""
+        self._write_rows([dict(zip(EXPORT_COLUMNS, row)) for row in frame_values(chunk, EXPORT_COLUMNS)])
+
+    def _write_rows(self, rows):
+        raise NotImplementedError
+
+    def _close(self):
+        pass
+
+    def close(self):
+        if self.finished_at is None:
+            self._close()
+            self.finished_at = time.perf_counter()
+
+    def stats(self):
+        """Rows, bytes and throughput of the export so far"""
+        seconds = (self.finished_at or time.perf_counter()) - self.started_at
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        return {
+            'format': self.format,
+            'rows': self.rows_written,
+            'bytes': size,
+            'seconds': round(seconds, 3),
+            'rows_per_s': round(self.rows_written / seconds, 1) if seconds else None,
+            'mb_per_s': round(size / seconds / 1e6, 2) if seconds else None,
+        }
+
+    def summary(self):
+        stats = self.stats()
+        text = f"{stats['rows']} rows, {stats['bytes'] / 1e6:.2f} MB in {stats['seconds']:.2f}s"
+        if stats['rows_per_s'] is not None:
+            text += f" ({stats['rows_per_s']:.0f} rows/s, {stats['mb_per_s']:.2f} MB/s)"
+        return text
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class CsvExporter(Exporter):
+    format = "csv"
+
+    def __init__(self, path, append=False):
+        super().__init__(path, append)
+        has_rows = append and os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, 'a' if append else 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=EXPORT_COLUMNS)
+        if not has_rows:
+            self._writer.writeheader()
+
+    def _write_rows(self, rows):
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def _write_frame(self, chunk):
+        chunk.to_csv(self._file, header=False, index=False, lineterminator='\r\n')
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+
+class JsonlExporter(Exporter):
+    format = "jsonl"
+
+    def __init__(self, path, append=False):
+        super().__init__(path, append)
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def _write_rows(self, rows):
+        for row in rows:
+            self._file.write(json.dumps(row, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+
+class SqliteExporter(Exporter):
+    """Writes to a `hotels` table, committing once per job"""
+
+    format = "sqlite"
+    TABLE = "hotels"
+    _types = {"adults": "INTEGER", "serial_no": "INTEGER", "price": "REAL", "tax": "REAL",
+              "review_score": "REAL", "review_count": "INTEGER"}
+
+    def __init__(self, path, append=False):
+        super().__init__(path, append)
+        self._connection = sqlite3.connect(path)
+        columns = ", ".join(f"{column} {self._types.get(column, 'TEXT')}" for column in EXPORT_COLUMNS)
+        with self._connection:
+            if not append:
+                self._connection.execute(f"DROP TABLE IF EXISTS {self.TABLE}")
+            self._connection.execute(f"CREATE TABLE IF NOT EXISTS {self.TABLE} ({columns})")
+        placeholders = ", ".join("?" for _ in EXPORT_COLUMNS)
+        self._insert = f"INSERT INTO {self.TABLE} ({', '.join(EXPORT_COLUMNS)}) VALUES ({placeholders})"
+
+    def _write_rows(self, rows):
+        with self._connection:
+            self._connection.executemany(self._insert, [tuple(row[column] for column in EXPORT_COLUMNS) for row in rows])
+
+    def _close(self):
+        self._connection.close()
+
+
+class ParquetExporter(Exporter):
+    """Writes a typed Parquet file with one row group per EXPORT_CHUNK_ROWS rows (needs pyarrow)"""
+
+    format = "parquet"
+    _types = {"adults": "int16", "serial_no": "int32", "price": "float64", "tax": "float64",
+              "review_score": "float64", "review_count": "int64"}
+    # Few distinct values per column; dictionary encoding keeps the file small
+    _dictionary = ("destination", "checkin", "checkout", "currency", "date", "scraped_at")
+
+    def __init__(self, path, append=False):
+        if append:
+            raise ValueError("Parquet files cannot be appended to, use .csv, .jsonl or .db instead")
+        super().__init__(path, append)
+        # Imported lazily so the other formats do not need pyarrow
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ValueError("Parquet export needs pyarrow (pip install pyarrow)")
+        self._pa = pyarrow
+        self._schema = pyarrow.schema([
+            (column, pyarrow.dictionary(pyarrow.int32(), pyarrow.string()) if column in self._dictionary
+             else getattr(pyarrow, self._types.get(column, "string"))())
+            for column in EXPORT_COLUMNS
+        ])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+        self._buffer = []
+
+    def _write_rows(self, rows):
+        # Jobs arrive a few dozen rows at a time; batch them into full row groups
+        self._buffer.extend(rows)
+        if len(self._buffer) >= self.chunk_rows:
+            self._flush()
+
+    def _write_frame(self, chunk):
+        self._flush()
+        self._writer.write_table(self._pa.Table.from_pandas(chunk, schema=self._schema, preserve_index=False))
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        columns = {column: [row[column] for row in self._buffer] for column in EXPORT_COLUMNS}
+        self._writer.write_table(self._pa.Table.from_pydict(columns, schema=self._schema))
+        self._buffer = []
+
+    def _close(self):
+        self._flush()
+        self._writer.close()
+
+
+EXPORTERS = {
+    CsvExporter.format: CsvExporter,
+    JsonlExporter.format: JsonlExporter,
+    SqliteExporter.format: SqliteExporter,
+    ParquetExporter.format: ParquetExporter,
+}
+
+_EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".db": "sqlite", ".sqlite": "sqlite",
+               ".sqlite3": "sqlite", ".parquet": "parquet"}
+
+def get_exporter(path, format=None, append=False):
+    """Exporter for path, with the format taken from the extension unless given"""
+    format = format or _EXTENSIONS.get(os.path.splitext(path)[1].lower())
+    if format not in EXPORTERS:
+        raise ValueError(f"Cannot tell the export format of '{path}', expected one of: {', '.join(EXPORTERS)}")
+    return EXPORTERS[format](path, append)
@@ -0,0 +1,167 @@
+from concurrent.futures import ThreadPoolExecutor
+from lxml import html
+from urllib.parse import quote
+from utils.config import Config
+from utils.helpers.destination_cache import DestinationCache
+from utils.http_fetcher import HttpFetcher
+from utils.resources.filters import Filters
+import copy
+import json
+import logging
+import os
+import threading
+import time
+
+class FilterCatalog:
+    """Process-wide catalog of search filters per destination.
+
+    request() answers immediately from the disk cache, or from the static Filters list
+    when nothing is cached, and refreshes stale entries on a background worker over the
+    shared HttpFetcher session. Concurrent requests for one destination share a fetch.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(FilterCatalog, cls).__new__(cls)
+                cls._instance._setup()
+        return cls._instance
+
+    def _setup(self):
+        self.cache_file = Config.FILTER_CACHE_FILE
+        self.ttl = Config.FILTER_CACHE_TTL
+        self._lock = threading.Lock()
+        self._entries = None
+        self._in_flight = {}
+        self._executor = ThreadPoolExecutor(max_workers=Config.FILTER_CATALOG_WORKERS,
+                                            thread_name_prefix='FilterCatalog')
+        self.logger = logging.getLogger('FilterCatalog')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+
+    @staticmethod
+    def static_filters():
+        """The bundled filter list, copied so callers cannot modify it"""
+        return copy.deepcopy(Filters.filter)
+
+    def _load(self):
+        if self._entries is None:
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_file)), exist_ok=True)
+        tmp_file = self.cache_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, indent=2)
+        os.replace(tmp_file, self.cache_file)
+
+    def cached(self, destination):
+        """Return (filters, is_fresh) from the disk cache, or (None, False)"""
+        key = DestinationCache.normalize(destination)
+        with self._lock:
+            entry = self._load().get(key)
+        if not entry:
+            return None, False
+        return entry['filters'], entry['fetched_at'] + self.ttl > time.time()
+
+    def put(self, destination, filters):
+        key = DestinationCache.normalize(destination)
+        with self._lock:
+            self._load()[key] = {
+                'filters': filters,
+                'fetched_at': time.time(),
+            }
+            self._save()
+
+    def request(self, destination, force=False):
+        """Return (filters to show now, Future of refreshed filters or None).
+
+        The Future resolves to the fetched filters, or to None when the fetch failed
+        and the immediate answer should stay.
+        """
+        filters, fresh = self.cached(destination)
+        if filters is None:
+            filters = self.static_filters()
+        if fresh and not force:
+            return filters, None
+        return filters, self.refresh(destination)
+
+    def refresh(self, destination):
+        """Fetch the destination's filters in the background, sharing an in-flight fetch"""
+        key = DestinationCache.normalize(destination)
+        with self._lock:
+            pending = self._in_flight.get(key)
+            if pending is not None:
+                return pending
+            pending = self._executor.submit(self._refresh, destination)
+            self._in_flight[key] = pending
+        pending.add_done_callback(lambda _: self._forget(key, pending))
+        return pending
+
+    def _forget(self, key, pending):
+        with self._lock:
+            if self._in_flight.get(key) is pending:
+                del self._in_flight[key]
+
+    def _refresh(self, destination):
+        filters = self.fetch(destination)
+        if filters and filters['all']:
+            self.put(destination, filters)
+            self.logger.info(f"Cached {len(filters['all'])} filters for: {destination}")
+            return filters
+        return None
+
+    def fetch(self, destination):
+        """Fetch and parse the filter list for destination now; None on failure"""
+        url = f"{Config.BOOKING_BASE_URL}?ss={quote(destination)}"
+        page_source = HttpFetcher().fetch(url)
+        if not page_source:
+            return None
+        try:
+            return self.parse(page_source)
+        except Exception as e:
+            self.logger.error(f"Error parsing filter details: {str(e)}")
+            return None
+
+    @staticmethod
+    def parse(content):
+        """Extract the filter checkboxes from a results page"""
+        # Parse the HTML content using lxml
+        tree = html.fromstring(content)
+
+        # Initialize the filter details with a single 'all' group
+        filter_details = {
+            'all': []
+        }
+
+        # Keep track of processed values to avoid duplicates
+        processed_values = set()
+
+        labels = tree.xpath('//div[@data-testid="filters-group-label-content"]')
+        keys = tree.xpath('//div[@data-testid="filters-group-container"]//input')
+
+        for label, key in zip(labels, keys):
+            filter_name = label.text_content().strip() if label is not None else "Unknown Filter"
+            value = key.get('value', '').strip() if key is not None else ''
+
+            filter_item ={
+                'name': str(filter_name),
+                'value': value,
+            }
+
+            filter_details['all'].append(filter_item)
+
+        filter_details['all'] = [item for item in filter_details['all'] if item['value'] not in processed_values and (processed_values.add(item['value']) or True)]
+        return filter_details
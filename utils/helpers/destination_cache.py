@@ -0,0 +1,90 @@
+from utils.config import Config
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+class DestinationCache:
+    """Process-wide, disk-backed TTL cache of dest_id/dest_type keyed on the normalized search term."""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(DestinationCache, cls).__new__(cls)
+                cls._instance._setup()
+        return cls._instance
+
+    def _setup(self):
+        self.cache_file = Config.DESTINATION_CACHE_FILE
+        self.ttl = Config.DESTINATION_CACHE_TTL
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._entries = None
+        self.logger = logging.getLogger('DestinationCache')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+
+    @staticmethod
+    def normalize(search_term):
+        """'  Chennai ,India ' -> 'chennai, india'"""
+        term = re.sub(r'\s*,\s*', ', ', search_term.strip().lower())
+        return re.sub(r'\s+', ' ', term)
+
+    def _load(self):
+        if self._entries is None:
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_file)), exist_ok=True)
+        tmp_file = self.cache_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, indent=2)
+        os.replace(tmp_file, self.cache_file)
+
+    def get(self, search_term, allow_stale=False):
+        """Return (dest_id, dest_type) if cached and fresh (or at all, with allow_stale), else (None, None)"""
+        key = self.normalize(search_term)
+        with self._lock:
+            entry = self._load().get(key)
+        if entry and (allow_stale or entry['resolved_at'] + self.ttl > time.time()):
+            return entry['dest_id'], entry['dest_type']
+        return None, None
+
+    def put(self, search_term, dest_id, dest_type):
+        key = self.normalize(search_term)
+        with self._lock:
+            self._load()[key] = {
+                'dest_id': dest_id,
+                'dest_type': dest_type,
+                'resolved_at': time.time(),
+            }
+            self._save()
+
+    def get_or_resolve(self, search_term, resolver):
+        """Return cached info or call resolver(search_term) once, even with concurrent callers"""
+        key = self.normalize(search_term)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            dest_id, dest_type = self.get(search_term)
+            if dest_id and dest_type:
+                self.logger.info(f"Destination cache hit for: {key}")
+                return dest_id, dest_type
+            dest_id, dest_type = resolver(search_term)
+            if dest_id and dest_type:
+                self.put(search_term, dest_id, dest_type)
+            return dest_id, dest_type
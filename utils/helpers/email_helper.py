@@ -5,6 +5,7 @@ import datetime
 from utils.config import Config
 from datetime import datetime, timedelta
 from email.header import decode_header
+from email.utils import parsedate_to_datetime
 
 class EmailHelper:
     def decode_content(content, charset=None):
@@ -23,7 +24,14 @@ class EmailHelper:
         except (UnicodeDecodeError, AttributeError):
             return content.decode('utf-8', errors='ignore')
         
-    def get_otp_from_email():
+    def sent_after(email_message, since):
+        try:
+            return parsedate_to_datetime(email_message["date"]).timestamp() >= since
+        except (TypeError, ValueError):
+            return False
+
+    def get_otp_from_email(since=None):
+        """OTP from the newest Booking.com email; None if that email is dated before `since` (epoch time)"""
         # Connect to the IMAP server
         imap_port = 993
         imap_server = imaplib.IMAP4_SSL(Config.EMAIL_IMAP_SERVER, imap_port)
@@ -44,6 +52,12 @@ class EmailHelper:
         _, msg_data = imap_server.fetch(num, "(RFC822)")
         email_body = msg_data[0][1]
         email_message = email.message_from_bytes(email_body)
+
+        # IMAP SINCE only filters by day, so the newest mail may belong to an earlier login
+        if since is not None and not EmailHelper.sent_after(email_message, since - Config.OTP_CLOCK_SKEW):
+            imap_server.close()
+            imap_server.logout()
+            return None
         
         # Get the email subject
         subject_header = decode_header(email_message["subject"])[0]
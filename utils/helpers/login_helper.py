@@ -2,15 +2,16 @@ from utils.web_driver_manager import WebDriverManager
 from utils.config import Config
 from selenium.webdriver.common.by import By
 from utils.helpers.email_helper import EmailHelper
-import time
+from utils.helpers.wait_helper import WaitHelper
 import logging
 import itertools
+import time
 
 class LoginHelper:
     """Helper class for managing login operations."""
     
-    def __init__(self):
-        self.driver = WebDriverManager().get_driver()
+    def __init__(self, driver=None):
+        self.driver = driver or WebDriverManager().get_driver()
         self._setup_logging()
 
     def _setup_logging(self):
@@ -30,18 +31,29 @@ class LoginHelper:
         email_input = self.driver.find_element(By.ID, "username")
         email_input.send_keys(Config.EMAIL_ADDRESS)
         continue_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
+        requested_at = time.time()
         continue_button.click()
-        time.sleep(10)
-        otp = EmailHelper.get_otp_from_email()
+        waits = WaitHelper(self.driver)
+        waits.for_element(By.CSS_SELECTOR, "[name*=code]", label="OTP fields", timeout=Config.OTP_TIMEOUT)
+        otp = waits.until(lambda d: self._fetch_otp(requested_at), "OTP email", Config.OTP_TIMEOUT,
+                          poll_interval=Config.OTP_POLL_INTERVAL)
         self.logger.info(f"OTP received: {otp}")
         if not otp:
             raise Exception("OTP not found in email. Please check your email settings or try again later.")
         
-        otp_input = self.driver.find_element(By.CSS_SELECTOR, "[name*=code]")
         otp_chars = list(otp)
         for i in range(len(otp_chars)):            
             self.driver.find_element(By.CSS_SELECTOR, f"[name=code_{i}]").send_keys(otp_chars[i])
 
         submit_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
         submit_button.click()
-        time.sleep(5)
\ No newline at end of file
+        waits.for_url_not_contains("account.booking.com")
+        self.logger.info(f"Login waits: {waits.summary()}")
+
+    def _fetch_otp(self, requested_at):
+        """Return the OTP if the email sent for this login has arrived yet, else None"""
+        try:
+            return EmailHelper.get_otp_from_email(since=requested_at)
+        except Exception as e:
+            self.logger.debug(f"OTP email not available yet: {str(e)}")
+            return None
\ No newline at end of file
@@ -0,0 +1,276 @@
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from urllib.parse import urlparse
+from utils.config import Config
+from utils.metrics import ScrapeMetrics
+import asyncio
+import logging
+import random
+import requests
+import threading
+import time
+
+class HttpStatusError(Exception):
+    """Raised for HTTP responses worth retrying (rate limiting and server errors)."""
+
+    def __init__(self, status_code, url=None):
+        super().__init__(f"HTTP {status_code} for {url}")
+        self.status_code = status_code
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host whose circuit is open (or already being probed)."""
+
+    def __init__(self, host, retry_in):
+        super().__init__(f"Circuit open for {host}, next trial in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter and per-error-class retry rules."""
+
+    # Exception class -> whether it is worth retrying. The most specific match wins.
+    DEFAULT_RULES = {
+        requests.ConnectionError: True,
+        requests.Timeout: True,
+        HttpStatusError: True,
+        WebDriverException: True,
+        # A missing element is page state, not a transient fault. Element waits that time out
+        # are raised as NoSuchElementException by their callers; a TimeoutException left
+        # here is a page load that timed out, which is worth another attempt.
+        NoSuchElementException: False,
+        asyncio.TimeoutError: True,
+        ValueError: False,
+        CircuitOpenError: False,
+    }
+
+    def __init__(self, max_attempts=None, base_delay=None, max_delay=None, rules=None):
+        self.max_attempts = max_attempts or Config.RETRY_MAX_ATTEMPTS
+        self.base_delay = base_delay if base_delay is not None else Config.RETRY_BASE_DELAY
+        self.max_delay = max_delay if max_delay is not None else Config.RETRY_MAX_DELAY
+        self.rules = dict(self.DEFAULT_RULES)
+        self.rules.update(rules or {})
+
+    def should_retry(self, error, attempt):
+        if attempt >= self.max_attempts:
+            return False
+        for cls in type(error).__mro__:
+            if cls in self.rules:
+                return self.rules[cls]
+        return Config.RETRY_UNKNOWN_ERRORS
+
+    def delay(self, attempt):
+        """Seconds to wait after the given (1-based) failed attempt"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """Closed -> open after failure_threshold consecutive failures -> half-open once
+    reset_timeout has passed. Half-open lets a single trial request through; its outcome
+    closes or re-opens the circuit. Callers that are not allowed through fail fast."""
+
+    def __init__(self, failure_threshold=None, reset_timeout=None):
+        self.failure_threshold = failure_threshold or Config.CIRCUIT_FAILURE_THRESHOLD
+        self.reset_timeout = reset_timeout or Config.CIRCUIT_RESET_TIMEOUT
+        self.failures = 0
+        self.opened_at = None
+        self.probe_started_at = None  # set while the half-open trial request is in flight
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """(True, 0) if the caller may make a request now, else (False, seconds until the next trial)"""
+        with self._lock:
+            if self.opened_at is None:
+                return True, 0
+            now = time.monotonic()
+            retry_at = self.opened_at + self.reset_timeout
+            # A trial that never reported back (e.g. its thread died) expires after reset_timeout
+            if self.probe_started_at is not None and now < self.probe_started_at + self.reset_timeout:
+                retry_at = self.probe_started_at + self.reset_timeout
+            if now < retry_at:
+                return False, retry_at - now
+            self.probe_started_at = now
+            return True, 0
+
+    def release(self):
+        """End a trial without a verdict (e.g. an empty page); the next caller may probe"""
+        with self._lock:
+            self.probe_started_at = None
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probe_started_at = None
+
+    def record_failure(self):
+        """Returns True when this failure opened the circuit"""
+        with self._lock:
+            self.failures += 1
+            half_open = self.probe_started_at is not None
+            self.probe_started_at = None
+            if half_open or self.failures >= self.failure_threshold:
+                # A failed half-open trial re-opens the circuit for another reset_timeout
+                was_closed = self.opened_at is None
+                self.opened_at = time.monotonic()
+                return was_closed
+            return False
+
+
+class TokenBucket:
+    """Token-bucket rate limiter: bursts up to capacity, then rate tokens per second."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return how many seconds the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            return 0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+
+class FetchPolicy:
+    """Process-wide retry, circuit-breaker and rate-limit layer shared by every fetch path.
+
+    call() runs fn with per-host pacing and retries, and raises CircuitOpenError without
+    calling fn while the host's circuit is open. Pass host=None for local operations
+    (e.g. starting Chrome) that should be retried but not rate limited. retry_if lets a
+    caller treat a returned value (such as an empty result list) as a retryable failure.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(FetchPolicy, cls).__new__(cls)
+                cls._instance._setup()
+        return cls._instance
+
+    def _setup(self):
+        self.retry_policy = RetryPolicy()
+        self._breakers = {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger('FetchPolicy')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+
+    def breaker(self, host):
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker()
+            return self._breakers[host]
+
+    def bucket(self, host):
+        with self._lock:
+            if host not in self._buckets:
+                rate = Config.HOST_RATE_LIMITS.get(host, Config.DEFAULT_RATE_LIMIT)
+                self._buckets[host] = TokenBucket(rate, Config.RATE_LIMIT_BURST)
+            return self._buckets[host]
+
+    def _before_attempt(self, host):
+        """Seconds to wait before the next attempt against host (pacing); raises
+        CircuitOpenError when the circuit is open or its half-open trial is taken"""
+        if host is None:
+            return 0
+        allowed, retry_in = self.breaker(host).allow()
+        if not allowed:
+            ScrapeMetrics().increment('circuit_rejected', host=host)
+            raise CircuitOpenError(host, retry_in)
+        return self.bucket(host).reserve()
+
+    def _release(self, host):
+        if host is not None:
+            self.breaker(host).release()
+
+    def _after_attempt(self, host, error, label, attempt):
+        """Record the outcome; returns the backoff delay if another attempt should be made"""
+        if host is not None:
+            if error is None:
+                self.breaker(host).record_success()
+            elif self.breaker(host).record_failure():
+                self.logger.warning(f"Opening circuit for {host} after repeated failures")
+                ScrapeMetrics().increment('circuit_opened', host=host)
+        if error is None:
+            return None
+        if not self.retry_policy.should_retry(error, attempt):
+            return None
+        delay = self.retry_policy.delay(attempt)
+        self.logger.warning(f"{label} attempt {attempt} failed ({error}), retrying in {delay:.1f}s")
+        ScrapeMetrics().increment('retries', operation=label, reason=type(error).__name__)
+        return delay
+
+    def call(self, host, fn, *args, retry_if=None, label=None, **kwargs):
+        label = label or getattr(fn, '__name__', 'call')
+        attempt = 0
+        while True:
+            attempt += 1
+            wait = self._before_attempt(host)
+            if wait:
+                time.sleep(wait)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                delay = self._after_attempt(host, e, label, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            if retry_if is not None and retry_if(result) and attempt < self.retry_policy.max_attempts:
+                self.logger.warning(f"{label} attempt {attempt} returned no results, retrying")
+                ScrapeMetrics().increment('retries', operation=label, reason='empty')
+                self._release(host)
+                time.sleep(self.retry_policy.delay(attempt))
+                continue
+            self._after_attempt(host, None, label, attempt)
+            return result
+
+    async def call_async(self, host, fn, *args, retry_if=None, label=None, **kwargs):
+        """Coroutine version of call() for the asyncio engine; fn must be a coroutine function"""
+        label = label or getattr(fn, '__name__', 'call')
+        attempt = 0
+        while True:
+            attempt += 1
+            wait = self._before_attempt(host)
+            if wait:
+                await asyncio.sleep(wait)
+            try:
+                result = await fn(*args, **kwargs)
+            except Exception as e:
+                delay = self._after_attempt(host, e, label, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            if retry_if is not None and retry_if(result) and attempt < self.retry_policy.max_attempts:
+                self.logger.warning(f"{label} attempt {attempt} returned no results, retrying")
+                ScrapeMetrics().increment('retries', operation=label, reason='empty')
+                self._release(host)
+                await asyncio.sleep(self.retry_policy.delay(attempt))
+                continue
+            self._after_attempt(host, None, label, attempt)
+            return result
+
+
+def host_of(url):
+    """'https://www.booking.com/searchresults.html?...' -> 'www.booking.com'"""
+    return urlparse(url).netloc
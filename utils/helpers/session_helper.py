@@ -0,0 +1,119 @@
+from utils.config import Config
+import json
+import logging
+import os
+import threading
+import time
+
+class SessionHelper:
+    """Capture, persist and re-inject the authenticated Booking.com session."""
+
+    _lock = threading.Lock()
+    _cookie_fields = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires')
+
+    def __init__(self, session_file=None, ttl=None):
+        self.session_file = session_file or Config.SESSION_FILE
+        self.ttl = ttl if ttl is not None else Config.SESSION_TTL
+        self._setup_logging()
+
+    def _setup_logging(self):
+        self.logger = logging.getLogger('SessionHelper')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+
+    def load(self):
+        """Return the saved session state, or None if missing or expired"""
+        with self._lock:
+            try:
+                with open(self.session_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                return None
+        if state.get('expires_at', 0) <= time.time():
+            self.logger.info("Saved session expired")
+            return None
+        return state
+
+    def save(self, cookies, local_storage):
+        now = time.time()
+        state = {
+            'saved_at': now,
+            'expires_at': now + self.ttl,
+            'cookies': cookies,
+            'local_storage': local_storage,
+        }
+        with self._lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.session_file)), exist_ok=True)
+            tmp_file = self.session_file + '.tmp'
+            # Auth cookies: readable by the owner only, from the moment the file exists
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.chmod(tmp_file, 0o600)  # O_CREAT keeps the mode of a leftover tmp file
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_file, self.session_file)
+        self.logger.info(f"Session saved with {len(cookies)} cookies")
+
+    def clear(self):
+        with self._lock:
+            try:
+                os.remove(self.session_file)
+            except OSError:
+                pass
+
+    def cookies(self):
+        """Cookies of the saved session as a list of dicts (empty if there is none)"""
+        state = self.load()
+        return state['cookies'] if state else []
+
+    def capture(self, driver):
+        """Save cookies for every booking.com domain plus the current page's localStorage"""
+        try:
+            all_cookies = driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', [])
+        except Exception:
+            all_cookies = driver.get_cookies()
+            for cookie in all_cookies:
+                if 'expiry' in cookie:
+                    cookie['expires'] = cookie.pop('expiry')
+        cookies = [
+            {k: v for k, v in cookie.items() if k in self._cookie_fields}
+            for cookie in all_cookies if 'booking.com' in cookie.get('domain', '')
+        ]
+        try:
+            local_storage = driver.execute_script("return Object.assign({}, window.localStorage);") or {}
+        except Exception:
+            local_storage = {}
+        if cookies:
+            self.save(cookies, local_storage)
+
+    def inject(self, driver):
+        """Restore a saved session into a fresh driver without navigating. Returns True on success"""
+        state = self.load()
+        if not state:
+            return False
+        try:
+            cookies = []
+            for cookie in state['cookies']:
+                cookie = dict(cookie)
+                if cookie.get('expires', -1) in (-1, None):
+                    cookie.pop('expires', None)  # Session cookie
+                cookies.append(cookie)
+            driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies})
+
+            if state.get('local_storage'):
+                # Seed localStorage on the next booking.com document load
+                script = (
+                    "if (location.hostname.endsWith('booking.com')) {"
+                    f" const items = {json.dumps(state['local_storage'])};"
+                    " for (const [k, v] of Object.entries(items)) {"
+                    " if (localStorage.getItem(k) === null) localStorage.setItem(k, v); } }"
+                )
+                driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': script})
+            self.logger.info(f"Injected saved session ({len(cookies)} cookies)")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to inject saved session: {str(e)}")
+            return False
@@ -0,0 +1,79 @@
+from selenium.common.exceptions import WebDriverException
+from utils.config import Config
+import logging
+import time
+
+class WaitHelper:
+    """Condition-driven waits that return as soon as the page is ready and record how long they took."""
+
+    def __init__(self, driver, poll_interval=None):
+        self.driver = driver
+        self.poll_interval = poll_interval or Config.WAIT_POLL_INTERVAL
+        self.timings = []  # (label, seconds waited, condition satisfied)
+        self._setup_logging()
+
+    def _setup_logging(self):
+        self.logger = logging.getLogger('WaitHelper')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+
+    def until(self, condition, label, timeout, poll_interval=None):
+        """Poll condition(driver) until it returns something truthy or timeout expires.
+
+        Returns the condition's value, or None on timeout. Timeouts are not errors:
+        callers carry on with whatever the page has loaded so far, as they did
+        after the old fixed sleeps.
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        result = None
+        while True:
+            try:
+                result = condition(self.driver)
+            except WebDriverException:
+                result = None
+            if result or time.monotonic() >= deadline:
+                break
+            time.sleep(poll_interval or self.poll_interval)
+        elapsed = time.monotonic() - start
+        self.timings.append((label, elapsed, bool(result)))
+        if result:
+            self.logger.debug(f"Wait '{label}' satisfied in {elapsed:.2f}s")
+        else:
+            self.logger.info(f"Wait '{label}' timed out after {elapsed:.2f}s")
+        return result or None
+
+    def for_element(self, by, value, label=None, timeout=None):
+        """Wait for at least one matching element and return the list of matches"""
+        return self.until(lambda d: d.find_elements(by, value), label or f"element {value}",
+                          timeout or Config.PAGE_READY_TIMEOUT)
+
+    def for_url_contains(self, text, timeout=None):
+        return self.until(lambda d: text in d.current_url, f"url contains {text}",
+                          timeout or Config.PAGE_READY_TIMEOUT)
+
+    def for_url_not_contains(self, text, timeout=None):
+        return self.until(lambda d: text not in d.current_url, f"url leaves {text}",
+                          timeout or Config.PAGE_READY_TIMEOUT)
+
+    def for_count_change(self, script, previous, label, timeout=None):
+        """Wait until the number returned by script differs from previous; returns the new value"""
+        def changed(d):
+            value = d.execute_script(script)
+            return value if value != previous else None
+
+        return self.until(changed, label, timeout or Config.PAGE_READY_TIMEOUT)
+
+    def total_time(self):
+        return sum(elapsed for _, elapsed, _ in self.timings)
+
+    def summary(self):
+        """One-line report of every wait, e.g. 'page ready 0.84s, scroll 1 0.50s (timeout)'"""
+        return ", ".join(
+            f"{label} {elapsed:.2f}s" + ("" if satisfied else " (timeout)")
+            for label, elapsed, satisfied in self.timings
+        )
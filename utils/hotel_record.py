@@ -0,0 +1,82 @@
+from utils.config import Config
+import re
+
+_AMOUNT_PATTERN = re.compile(r'\d[\d,]*(?:\.\d+)?')
+_CURRENCY_PATTERN = re.compile(r'([^\d\s.,+\-]+)\s*\d')
+
+def parse_amount(text):
+    """'₹ 3,450' -> 3450.0, '1,234 reviews' -> 1234.0; None when there is no number"""
+    if not text:
+        return None
+    match = _AMOUNT_PATTERN.search(text)
+    return float(match.group(0).replace(',', '')) if match else None
+
+def parse_currency(text):
+    """'+₹ 414' -> '₹', 'US$120' -> 'US$'; None when there is no currency symbol"""
+    if not text:
+        return None
+    match = _CURRENCY_PATTERN.search(text)
+    return match.group(1) if match else None
+
+def format_amount(value, currency=None):
+    """Format a parsed amount the way the results table shows prices"""
+    return f"{currency or Config.DEFAULT_CURRENCY}{value or 0:,.2f}"
+
+
+class HotelRecord:
+    """One hotel row with its values already parsed. Holds plain strings and numbers only,
+    never parser objects, so a results list does not keep any page tree alive."""
+
+    FIELDS = ("serial_no", "name", "link", "location", "price", "tax", "currency",
+              "review_score", "review_count", "date", "adults")
+    # Provenance of the page the row came from: when it was fetched (epoch time) and whether
+    # it was replayed from the response cache rather than fetched for this search
+    __slots__ = FIELDS + ("fetched_at", "cached")
+
+    def __init__(self, serial_no, name, link, location, price=None, tax=None, currency=None,
+                 review_score=None, review_count=None, date=None, adults=None):
+        self.serial_no = serial_no
+        self.name = name
+        self.link = link
+        self.location = location
+        self.price = price
+        self.tax = tax
+        self.currency = currency
+        self.review_score = review_score
+        self.review_count = review_count
+        self.date = date
+        self.adults = adults
+        self.fetched_at = None
+        self.cached = False
+
+    @classmethod
+    def from_text(cls, serial_no, name, link, location, price_text, tax_text, review_text, review_count_text):
+        """Build a record from the raw card strings, parsing the numbers once"""
+        review_count = parse_amount(review_count_text)
+        return cls(
+            serial_no=serial_no,
+            # str() drops lxml's "smart string" back-reference to the parsed tree
+            name=str(name),
+            link=str(link),
+            location=str(location),
+            price=parse_amount(price_text),
+            tax=parse_amount(tax_text),
+            currency=parse_currency(price_text) or parse_currency(tax_text),
+            review_score=parse_amount(review_text),
+            review_count=int(review_count) if review_count is not None else None,
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{field: data.get(field) for field in cls.FIELDS})
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __eq__(self, other):
+        if not isinstance(other, HotelRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"HotelRecord({self.name!r}, price={self.price!r}, date={self.date!r}, adults={self.adults!r})"
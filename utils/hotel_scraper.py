@@ -1,28 +1,52 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 import urllib
 from utils.helpers.login_helper import LoginHelper
+from utils.helpers.session_helper import SessionHelper
+from utils.helpers.destination_cache import DestinationCache
+from utils.helpers.wait_helper import WaitHelper
+from utils.helpers.retry_policy import FetchPolicy, host_of
+from utils.helpers.resource_blocker import ResourceBlocker
 from utils.web_driver_manager import WebDriverManager
+from utils.http_fetcher import HttpFetcher
+from utils.response_cache import ResponseCache, replay_only
 from utils.config import Config
-from bs4 import BeautifulSoup
-from lxml import html
+from utils.card_parser import count_property_cards, has_property_cards, is_results_page
+from utils.filter_catalog import FilterCatalog
+from utils.metrics import ScrapeMetrics
+from utils.parse_pipeline import ParsePipeline
 import requests
 import logging
 import time
 import sys
 import itertools
+import threading
 from urllib.parse import urlparse, parse_qs
 
 class HotelScraper:
-    def __init__(self):
-        self.driver_manager = WebDriverManager()
+    PROPERTY_CARD_SELECTOR = 'div[data-testid="property-card"]'
+    # Page height and card count; either one changing means the scroll loaded more results
+    SCROLL_STATE_SCRIPT = (
+        "return document.body.scrollHeight + ':' + "
+        "document.querySelectorAll('div[data-testid=\"property-card\"]').length"
+    )
+
+    # One login at a time across every scraper: the OTP lookup reads the newest email, and a
+    # scraper that waited for the lock picks up the session the other one just saved
+    _login_lock = threading.Lock()
+
+    def __init__(self, driver_manager=None):
+        # Any object exposing get_driver() works here, e.g. a WebDriverPool slot
+        self.driver_manager = driver_manager or WebDriverManager()
         self._setup_logging()
-        self._max_retries = 2
-        self._retry_delay = 2  # seconds
         self.dest_id = None
         self.dest_type = None
         self.destination = None
+        self.session_helper = SessionHelper()
+        self._session_ready = False
+        self._driver_lock = threading.Lock()
 
     def _setup_logging(self):
         self.logger = logging.getLogger('HotelScraper')
@@ -43,58 +67,146 @@ class HotelScraper:
 
     def login(self):
         """Login to Booking.com using email and password."""
-        self.driver_manager.get_driver().get(Config.BOOKING_BASE_URL)
-        try:
-            is_sign_in_button = self.driver_manager.get_driver().find_element(By.XPATH, "//a/span[text() = 'Sign in']").is_displayed()
-        except:
-            is_sign_in_button = False
+        driver = self.driver_manager.get_driver()
+        driver.get(Config.BOOKING_BASE_URL)
+        is_sign_in_button = self._is_logged_out(driver)
         if Config.DO_LOGING and is_sign_in_button:
             self.logger.info("Starting login process")
             try:
-                login_helper = LoginHelper()
-                login_helper.login_with_email()
+                login_helper = LoginHelper(driver)
+                with ScrapeMetrics().phase('login'):
+                    FetchPolicy().call(host_of(Config.BOOKING_LOGIN_URL), login_helper.login_with_email, label="Login")
                 self.logger.info("Login successful")
             except Exception as e:
                 self.logger.error(f"Login failed: {str(e)}")
                 raise
+        if Config.DO_LOGING:
+            self.session_helper.capture(driver)
+            HttpFetcher().load_browser_cookies()
+        self._session_ready = True
+
+    def ensure_session(self):
+        """Make sure this scraper's driver carries a session, logging in only when none is saved"""
+        if self._session_ready or not Config.DO_LOGING:
+            return
+        with self._login_lock:
+            if self.session_helper.inject(self.driver_manager.get_driver()):
+                # Validated lazily: get_hotel_pricing re-logs in if a results page looks logged-out
+                self._session_ready = True
+                return
+            self.login()
+
+    def refresh_session(self, rejected_at):
+        """Replace a session the site no longer accepts; reuse one saved by another scraper
+        after rejected_at instead of logging in again"""
+        with self._login_lock:
+            state = self.session_helper.load()
+            if state and state['saved_at'] > rejected_at and self.session_helper.inject(self.driver_manager.get_driver()):
+                return
+            self.session_helper.clear()
+            self.login()
+
+    def _is_logged_out(self, driver):
+        try:
+            return driver.find_element(By.XPATH, "//a/span[text() = 'Sign in']").is_displayed()
+        except:
+            return False
 
     def get_destination_info(self, search_term):
         """Get destination ID and type from search term"""
-        driver = self.driver_manager.get_driver()
-        
+        with ScrapeMetrics().phase('destination_resolve'):
+            if replay_only():
+                return self.cached_destination(search_term)
+            return DestinationCache().get_or_resolve(search_term, self._resolve_destination)
+
+    @staticmethod
+    def cached_destination(search_term):
+        """Offline replay: the destination from DestinationCache only (stale entries included), never the network"""
+        dest_id, dest_type = DestinationCache().get(search_term, allow_stale=True)
+        if not dest_id or not dest_type:
+            logging.getLogger('HotelScraper').error(f"Replay-only mode and destination not cached: {search_term}")
+            return None, None
+        return dest_id, dest_type
+
+    def _resolve_destination(self, search_term):
+        if Config.RESOLVE_DESTINATION_VIA_HTTP:
+            dest_id, dest_type = self._resolve_destination_via_http(search_term)
+            if dest_id and dest_type:
+                return dest_id, dest_type
+        return self._resolve_destination_via_browser(search_term)
+
+    def _resolve_destination_via_http(self, search_term):
+        """Resolve the destination through the autocomplete endpoint without a browser"""
         try:
-            initial_url = f"{Config.BOOKING_BASE_URL}?ss={search_term}"
-            self.logger.info(f"Getting destination info for: {search_term}")
-            driver.get(initial_url)
-            time.sleep(3)
-            
-            # Click search button
-            search_button = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//button/span[text()='Search']/parent::button"))
-            )
-            driver.execute_script("arguments[0].click();", search_button)
-            time.sleep(5)
-            
-            # Parse URL for destination info
-            current_url = driver.current_url
-            parsed_url = urlparse(current_url)
-            query_params = parse_qs(parsed_url.query)
-            
-            dest_id = query_params.get('dest_id', [None])[0]
-            dest_type = query_params.get('dest_type', [None])[0]
-            
+            data = HttpFetcher().post_json(Config.BOOKING_AUTOCOMPLETE_URL, self.autocomplete_payload(search_term))
+            if data is None:
+                return None, None
+            dest_id, dest_type = self.parse_autocomplete(data)
             if dest_id and dest_type:
-                self.logger.info(f"Found destination info: ID={dest_id}, Type={dest_type}")
+                self.logger.info(f"Found destination info via autocomplete: ID={dest_id}, Type={dest_type}")
                 return dest_id, dest_type
-                
+        except (requests.RequestException, ValueError) as e:
+            self.logger.warning(f"Autocomplete lookup failed, falling back to browser: {str(e)}")
+        return None, None
+
+    @staticmethod
+    def autocomplete_payload(search_term):
+        return {
+            "query": search_term,
+            "aid": Config.AID,
+            "language": Config.LANG,
+            "size": 1,
+        }
+
+    @staticmethod
+    def parse_autocomplete(data):
+        """Return (dest_id, dest_type) of the best autocomplete match, or (None, None)"""
+        results = data.get("results") or []
+        if results and results[0].get("dest_id") and results[0].get("dest_type"):
+            return str(results[0]["dest_id"]), results[0]["dest_type"]
+        return None, None
+
+    def _resolve_destination_via_browser(self, search_term):
+        initial_url = f"{Config.BOOKING_BASE_URL}?ss={search_term}"
+        try:
+            return FetchPolicy().call(host_of(initial_url), self._browser_destination_attempt, search_term, initial_url,
+                                      label="Destination lookup")
         except Exception as e:
             self.logger.error(f"Error getting destination info: {str(e)}")
             return None, None
+
+    def _browser_destination_attempt(self, search_term, initial_url):
+        driver = self.driver_manager.get_driver()
+        self.logger.info(f"Getting destination info for: {search_term}")
+        driver.get(initial_url)
+        
+        # Click search button
+        try:
+            search_button = WebDriverWait(driver, 10).until(
+                EC.element_to_be_clickable((By.XPATH, "//button/span[text()='Search']/parent::button"))
+            )
+        except TimeoutException:
+            # The page loaded without a search button: not a fault another attempt would fix
+            raise NoSuchElementException("Search button not found on the destination page")
+        driver.execute_script("arguments[0].click();", search_button)
+        waits = WaitHelper(driver)
+        waits.for_url_contains("dest_id=")
+        self.logger.info(f"Destination lookup waits: {waits.summary()}")
         
+        # Parse URL for destination info
+        current_url = driver.current_url
+        parsed_url = urlparse(current_url)
+        query_params = parse_qs(parsed_url.query)
+        
+        dest_id = query_params.get('dest_id', [None])[0]
+        dest_type = query_params.get('dest_type', [None])[0]
+        
+        if dest_id and dest_type:
+            self.logger.info(f"Found destination info: ID={dest_id}, Type={dest_type}")
+            return dest_id, dest_type
         return None, None
 
     def get_hotel_pricing(self, params=None):
-        self.login()
         """Get hotel pricing with improved scraping and error handling"""
         if params is None:
             params = {
@@ -106,16 +218,130 @@ class HotelScraper:
                 "group_children": "0"
             }
 
-        if self.destination is None:
-            self.destination = params["ss"].split(",")[0]
+        url = self.build_search_url(params)
+        if url is None:
+            return []
+
+        if Config.PAGINATION_MODE == "offset":
+            return self._fetch_paginated(url)
+        return self._fetch_results(url)
+
+    def _fetch_results(self, url, scroll=True):
+        """Fetch one results page and parse its property cards"""
+        page_source, fetched_at, cached = self._fetch_page(url, scroll)
+        hotel_results = self.stamp_fetch(ParsePipeline().parse(page_source), fetched_at, cached)
+        if hotel_results:
+            self.logger.info(f"Successfully scraped {len(hotel_results)} hotels")
+        return hotel_results
+
+    def _fetch_page(self, url, scroll=True, allow_empty=False):
+        """(raw HTML, fetch time, served from cache) of one results page, taken from the cache,
+        over HTTP or in the browser, in that order.
 
-        if not self.dest_id or not self.dest_type or self.destination != (params["ss"].split(",")[0]):
-            # Get destination info
-            self.dest_id, self.dest_type = self.get_destination_info(params["ss"])
-            if not self.dest_id or not self.dest_id:
-                self.logger.error("Could not find destination information")
-                return []
+        With allow_empty (offset pages), a genuine results page without cards is the end of
+        the results and is returned as is; only failed or blocked fetches go to the browser.
+        """
+        if Config.RESPONSE_CACHE_ENABLED:
+            cache = ResponseCache()
+            page_source, stored_at = cache.lookup(url)
+            if page_source is not None:
+                self.logger.info(f"Serving results page from cache: {url}")
+                return page_source, stored_at, True
+            if cache.replay_only:
+                self.logger.warning(f"Replay-only mode and no cached page for: {url}")
+                return None, None, False
 
+        if Config.FETCH_MODE == "http":
+            page_source = self._fetch_via_http(url)
+            if has_property_cards(page_source):
+                return page_source, time.time(), False
+            if allow_empty and is_results_page(page_source):
+                self.logger.info(f"No more results at: {url}")
+                return page_source, time.time(), False
+            self.logger.info("HTTP response had no property cards, falling back to WebDriver")
+
+        # A scraper owns one driver; paginated fetches share it one page at a time.
+        # Parsing happens after the lock is released so the driver can load the next page.
+        with self._driver_lock:
+            page_source = self._fetch_via_driver(url, scroll, allow_empty)
+        return page_source, time.time(), False
+
+    @staticmethod
+    def stamp_fetch(hotel_results, fetched_at, cached):
+        """Record on each row when its page was fetched and whether it came from the cache"""
+        for hotel in hotel_results:
+            hotel.fetched_at = fetched_at
+            hotel.cached = cached
+        return hotel_results
+
+    def _fetch_paginated(self, url, max_results=None):
+        """Fetch result pages by offset concurrently instead of scrolling one long list.
+        The first short page ends the results; offsets not yet fetched by then are cancelled."""
+        max_results = max_results or Config.MAX_RESULTS
+        page_count = max(1, -(-max_results // Config.RESULTS_PAGE_SIZE))
+        page_urls = [self.page_url(url, page) for page in range(page_count)]
+        self.logger.info(f"Fetching up to {page_count} result page(s) by offset")
+        provenance = {}  # page URL -> (fetch time, served from cache)
+        card_counts = {}  # page URL -> property cards on the page, before parsing
+
+        def fetch(page_url):
+            page_source, *provenance[page_url] = self._fetch_page(page_url, scroll=False,
+                                                                  allow_empty=page_url != url)
+            card_counts[page_url] = count_property_cards(page_source)
+            return page_source
+
+        # Fetch threads hand raw pages to the parser processes and move on to the next offset
+        fetched = ParsePipeline().iter_pipeline(page_urls, fetch, Config.PAGINATION_WORKERS)
+        try:
+            hotel_results = self.merge_result_pages(
+                ((self.stamp_fetch(page, *provenance[page_url]), card_counts[page_url])
+                 for page_url, page in fetched), max_results)
+        finally:
+            fetched.close()
+        self.logger.info(f"Merged {len(hotel_results)} hotels")
+        return hotel_results
+
+    @staticmethod
+    def page_url(url, page):
+        """URL of the given zero-based results page"""
+        return url if page == 0 else f"{url}&offset={page * Config.RESULTS_PAGE_SIZE}"
+
+    @staticmethod
+    def merge_result_pages(pages, max_results):
+        """Concatenate (hotels, card count) pages in offset order up to the first short page,
+        drop hotels already seen and renumber them. A page is short by its property-card
+        count, not by the hotels parsed from it, so a card the parser drops does not end
+        the results."""
+        hotel_results = []
+        seen_links = set()
+        for page, card_count in pages:
+            for hotel in page:
+                key = hotel.link.split('?')[0] or hotel.name
+                if key in seen_links:
+                    continue
+                seen_links.add(key)
+                hotel.serial_no = len(hotel_results) + 1
+                hotel_results.append(hotel)
+                if len(hotel_results) >= max_results:
+                    return hotel_results
+            if card_count < Config.RESULTS_PAGE_SIZE:
+                break
+        return hotel_results
+
+    def build_search_url(self, params):
+        """Resolve the destination and build the results-page URL; None if the destination is unknown"""
+        # Resolved once per destination and shared by every scraper through DestinationCache
+        self.destination = params["ss"].split(",")[0]
+        self.dest_id, self.dest_type = self.get_destination_info(params["ss"])
+        if not self.dest_id or not self.dest_type:
+            self.logger.error("Could not find destination information")
+            return None
+
+        return self.compose_search_url(params, self.dest_id, self.dest_type)
+
+    @staticmethod
+    def compose_search_url(params, dest_id, dest_type):
+        """Build the results-page URL for params and an already resolved destination"""
         # Update parameters with destination info
         params.update({
             "ssne": params["ss"].split(",")[0],
@@ -126,125 +352,105 @@ class HotelScraper:
             "sb": "1",
             "src_elem": "sb",
             "src": Config.SRC,
-            "dest_id": self.dest_id,
-            "dest_type": self.dest_type,
+            "dest_id": dest_id,
+            "dest_type": dest_type,
             "order": Config.SORT_ORDER,
         })
         filter_params = params.get("filter", None)
-        
-        for attempt in range(self._max_retries):
-            try:
-                driver = self.driver_manager.get_driver()
-                query_string = '&'.join([f"{k}={v}" for k, v in params.items() if k != 'filter'])
-                url = f"{Config.BOOKING_BASE_URL}?{query_string}"
-                if filter_params is not None:
-                    filter_url = ";".join(f'{i}' for i in filter_params)
-                    encoded_filter_url = urllib.parse.quote(filter_url, safe=':/?&')
-                    url = url + "&nflt=" + encoded_filter_url
-                self.logger.info(f"Fetching URL: {url}")
-                loading_animation = self._show_loading_animation("Loading page")
-                driver.get(url)
-                time.sleep(5)
-
-                # Scroll to load more content
-                self.logger.info("Scrolling to load more content...")
-                last_height = driver.execute_script("return document.body.scrollHeight")
-                for _ in range(Config.MAX_SCROLL_ATTEMPTS):
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(Config.SCROLL_PAUSE_TIME)
-                    new_height = driver.execute_script("return document.body.scrollHeight")
-                    if new_height == last_height:
-                        break
-                    last_height = new_height
-
-                # Parse with BeautifulSoup
-                soup = BeautifulSoup(driver.page_source, 'html.parser')
-                hotel_results = []
-
-                # Find all property cards
-                for index, el in enumerate(soup.find_all("div", {"data-testid": "property-card"}), 1):
-                    try:
-                        hotel_data = {
-                            "serial_no": index,
-                            "name": el.find("div", {"data-testid": "title"}).text.strip() if el.find("div", {"data-testid": "title"}) else "",
-                            "link": el.find("a", {"data-testid": "title-link"})["href"] if el.find("a", {"data-testid": "title-link"}) else "",
-                            "location": el.find("span", {"data-testid": "address"}).text.strip() if el.find("span", {"data-testid": "address"}) else "",
-                            "pricing": el.find("span", {"data-testid": "price-and-discounted-price"}),
-                            "tax": el.find("div", {"data-testid": "taxes-and-charges"}).text.replace("taxes and fees", "") if el.find("div", {"data-testid": "taxes-and-charges"}) else "",
-                            "review": None
-                        }
-
-                        # Extract review score
-                        hotel_data["review"] = el.select_one('a[data-testid="review-score-link"] > span > div > div:nth-child(2)').text
-                        hotel_data["review_count"] = el.select_one('a[data-testid="review-score-link"] > span > div > div:nth-child(3) > div:nth-child(2)').text
-                        hotel_results.append(hotel_data)
-                    except Exception as e:
-                        self.logger.warning(f"Error processing hotel card: {str(e)}")
-                        continue
-
-                if hotel_results:
-                    self.logger.info(f"Successfully scraped {len(hotel_results)} hotels")
-                    return hotel_results
 
-                if attempt < self._max_retries - 1:
-                    self.logger.warning(f"No results found, retry attempt {attempt + 1}")
-                    time.sleep(self._retry_delay)
-                    continue
+        query_string = '&'.join([f"{k}={v}" for k, v in params.items() if k != 'filter'])
+        url = f"{Config.BOOKING_BASE_URL}?{query_string}"
+        if filter_params is not None:
+            filter_url = ";".join(f'{i}' for i in filter_params)
+            encoded_filter_url = urllib.parse.quote(filter_url, safe=':/?&')
+            url = url + "&nflt=" + encoded_filter_url
+        return url
 
-            except Exception as e:
-                self.logger.error(f"Error on attempt {attempt + 1}: {str(e)}")
-                if attempt < self._max_retries - 1:
-                    time.sleep(self._retry_delay)
-                    continue
-                raise
+    def _fetch_via_http(self, url):
+        """Fetch the results page over the pooled HTTP session (no browser)"""
+        self.logger.info(f"Fetching URL over HTTP: {url}")
+        with ScrapeMetrics().phase('http_fetch'):
+            page_source = HttpFetcher().fetch(url)
+        if has_property_cards(page_source):
+            self.logger.info("Fetched results page over HTTP")
+            self._cache_page(url, page_source)
+        return page_source
 
-        return []
+    def _cache_page(self, url, page_source):
+        if Config.RESPONSE_CACHE_ENABLED:
+            ResponseCache().put(url, page_source)
 
-    def get_filter_details(self, search_term):
+    def _fetch_via_driver(self, url, scroll=True, allow_empty=False):
+        """Load and scroll the results page in the browser and return its HTML"""
+        with ScrapeMetrics().phase('session_check'):
+            self.ensure_session()
+        # A page past the last result is an answer, not a failure worth retrying
+        usable = is_results_page if allow_empty else has_property_cards
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-            }
+            return FetchPolicy().call(host_of(url), self._driver_attempt, url, scroll,
+                                      retry_if=lambda page_source: not usable(page_source),
+                                      label="Results page")
+        except Exception as e:
+            self.logger.error(f"Error fetching results page: {str(e)}")
+            raise
 
-            initial_url = f"{Config.BOOKING_BASE_URL}?ss={search_term}"
-            response = requests.get(initial_url, headers=headers)
-            
-            if response.status_code != 200:
-                return None
+    def _driver_attempt(self, url, scroll):
+        driver = self.driver_manager.get_driver()
+        self.logger.info(f"Fetching URL: {url}")
+        loading_animation = self._show_loading_animation("Loading page")
+        waits = WaitHelper(driver)
+        loaded_at = time.time()
+        self._load_results_page(driver, url, waits)
 
-            # Parse the HTML content using lxml
-            tree = html.fromstring(response.content)
-            
-            # Initialize the filter details with a single 'all' group
-            filter_details = {
-                'all': []
-            }
-            
-            # Keep track of processed values to avoid duplicates
-            processed_values = set()
+        # The injected session may have expired server-side; log in again and reload
+        if Config.DO_LOGING and self._timed_login_check(driver):
+            self.logger.info("Results page looks logged-out, refreshing session")
+            self.refresh_session(loaded_at)
+            self._load_results_page(driver, url, waits)
 
-            labels = tree.xpath('//div[@data-testid="filters-group-label-content"]')
-            keys = tree.xpath('//div[@data-testid="filters-group-container"]//input')
-            
-            for label, key in zip(labels, keys):
-                filter_name = label.text_content().strip() if label is not None else "Unknown Filter"
-                value = key.get('value', '').strip() if key is not None else ''
-                
-                filter_item ={
-                    'name': filter_name,
-                    'value': value,
-                }
-
-                filter_details['all'].append(filter_item)
-                
-            filter_details['all'] = [item for item in filter_details['all'] if item['value'] not in processed_values and (processed_values.add(item['value']) or True)]
-            return filter_details
-            
-        except requests.RequestException as e:
-            self.logger.error(f"Error fetching filter details: {str(e)}")
-            return None
-        except Exception as e:
-            self.logger.error(f"Error parsing filter details: {str(e)}")
-            return None
\ No newline at end of file
+        # Scroll to load more content
+        if scroll:
+            self.logger.info("Scrolling to load more content...")
+            self._scroll_results(driver, waits)
+        self.logger.info(f"Waited {waits.total_time():.2f}s in total: {waits.summary()}")
+
+        if Config.LEAN_SCRAPE:
+            ResourceBlocker().collect(driver)
+
+        with ScrapeMetrics().phase('page_source'):
+            page_source = driver.page_source
+        if has_property_cards(page_source):
+            self.logger.info("Loaded results page in the browser")
+            self._cache_page(url, page_source)
+        return page_source
+
+    def _timed_login_check(self, driver):
+        with ScrapeMetrics().phase('login_check'):
+            return self._is_logged_out(driver)
+
+    def _load_results_page(self, driver, url, waits):
+        """Navigate and return once the first property cards have rendered"""
+        with ScrapeMetrics().phase('navigation'):
+            driver.get(url)
+            waits.for_element(By.CSS_SELECTOR, self.PROPERTY_CARD_SELECTOR, label="property cards")
+
+    def _scroll_results(self, driver, waits):
+        """Scroll until the lazy-loaded list stops growing"""
+        last_state = driver.execute_script(self.SCROLL_STATE_SCRIPT)
+        for attempt in range(1, Config.MAX_SCROLL_ATTEMPTS + 1):
+            with ScrapeMetrics().phase('scroll_iteration'):
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                new_state = waits.for_count_change(self.SCROLL_STATE_SCRIPT, last_state,
+                                                   f"scroll {attempt}", timeout=Config.SCROLL_PAUSE_TIME)
+            if new_state is None:
+                break
+            last_state = new_state
+
+    def get_filter_details(self, search_term):
+        """Fetch the filter list for a destination over the shared HTTP session (uncached)"""
+        return FilterCatalog().fetch(search_term)
+
+    @staticmethod
+    def parse_filter_details(content):
+        """Extract the filter checkboxes from a results page"""
+        return FilterCatalog.parse(content)
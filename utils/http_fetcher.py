@@ -0,0 +1,112 @@
+from requests.adapters import HTTPAdapter
+from utils.helpers.session_helper import SessionHelper
+from utils.helpers.retry_policy import CircuitOpenError, FetchPolicy, HttpStatusError, host_of
+from utils.config import Config
+import logging
+import requests
+import threading
+
+class HttpFetcher:
+    """Process-wide keep-alive HTTP fetcher used to fetch pages without a browser.
+
+    requests.Session is not documented as thread-safe (its cookie jar is mutated per
+    request), so every thread that fetches gets its own session. The sessions all mount
+    one HTTPAdapter, whose urllib3 pool manager is thread-safe, so keep-alive connections
+    outlive the short-lived fetch threads of each paginated search. Browser cookies are
+    kept here and copied into each session.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    }
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(HttpFetcher, cls).__new__(cls)
+                cls._instance._setup()
+        return cls._instance
+
+    def _setup(self):
+        self.logger = logging.getLogger('HttpFetcher')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+
+        self._adapter = HTTPAdapter(pool_connections=Config.HTTP_POOL_CONNECTIONS,
+                                    pool_maxsize=Config.HTTP_POOL_SIZE)
+        self._local = threading.local()
+        self._cookies = (0, [])  # (version, cookies), replaced as a whole so threads see a consistent pair
+        self.load_browser_cookies()
+
+    @property
+    def session(self):
+        """This thread's session, carrying the latest browser cookies"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            # Never closed: closing a session would close the shared adapter's connections
+            session = requests.Session()
+            session.mount('https://', self._adapter)
+            session.mount('http://', self._adapter)
+            session.headers.update(self.HEADERS)
+            self._local.session = session
+            self._local.cookies_version = None
+        version, cookies = self._cookies
+        if self._local.cookies_version != version:
+            self._local.cookies_version = version
+            for cookie in cookies:
+                session.cookies.set(cookie['name'], cookie['value'],
+                                    domain=cookie.get('domain'), path=cookie.get('path', '/'))
+        return session
+
+    def load_browser_cookies(self):
+        """Pick up the cookies saved from the browser session; each thread's session copies them on next use"""
+        cookies = SessionHelper().cookies()
+        self._cookies = (self._cookies[0] + 1, cookies)
+        if cookies:
+            self.logger.info(f"Loaded {len(cookies)} browser cookies for the HTTP sessions")
+
+    def fetch(self, url, timeout=None):
+        """Return the response body for url, or None on a non-200 response or network error"""
+        try:
+            return FetchPolicy().call(host_of(url), self._get, url, timeout or Config.HTTP_TIMEOUT,
+                                      label="HTTP fetch")
+        except (requests.RequestException, HttpStatusError, CircuitOpenError) as e:
+            self.logger.warning(f"HTTP fetch failed: {str(e)}")
+            return None
+
+    def post_json(self, url, payload, timeout=None):
+        """POST a JSON payload and return the decoded JSON response, or None on failure"""
+        try:
+            return FetchPolicy().call(host_of(url), self._post_json, url, payload, timeout or Config.HTTP_TIMEOUT,
+                                      label="HTTP post")
+        except (requests.RequestException, HttpStatusError, CircuitOpenError, ValueError) as e:
+            self.logger.warning(f"HTTP post failed: {str(e)}")
+            return None
+
+    def _get(self, url, timeout):
+        response = self.session.get(url, timeout=timeout)
+        if response.status_code in Config.RETRYABLE_STATUS_CODES:
+            raise HttpStatusError(response.status_code, url)
+        if response.status_code != 200:
+            self.logger.warning(f"HTTP fetch returned status {response.status_code}")
+            return None
+        return response.text
+
+    def _post_json(self, url, payload, timeout):
+        response = self.session.post(url, json=payload, timeout=timeout)
+        if response.status_code in Config.RETRYABLE_STATUS_CODES:
+            raise HttpStatusError(response.status_code, url)
+        if response.status_code != 200:
+            return None
+        return response.json()
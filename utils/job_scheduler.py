@@ -0,0 +1,159 @@
+from datetime import date, timedelta
+from utils.config import Config
+from utils.helpers.destination_cache import DestinationCache
+from utils.scrape_ledger import ScrapeLedger
+from utils.search_dispatcher import SearchDispatcher, build_search_grid, expand_adult_counts
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+class WatchJob:
+    """A search repeated on a fixed interval over a date window relative to today"""
+
+    def __init__(self, destination, start_in_days=1, nights=None, adult_counts=None, filters=None,
+                 interval=None, rooms=1, children=0, name=None):
+        self.destination = destination
+        self.start_in_days = start_in_days
+        self.nights = nights or Config.WATCH_DEFAULT_NIGHTS
+        self.adult_counts = adult_counts or [2]
+        self.filters = filters or []
+        self.interval = interval or Config.WATCH_DEFAULT_INTERVAL
+        self.rooms = rooms
+        self.children = children
+        self.name = name or destination
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build from a watch-file entry; "adults"/"adult_increment"/"step_count" work as in the CLI"""
+        data = dict(data)
+        if "adult_counts" not in data and "adults" in data:
+            data["adult_counts"] = expand_adult_counts(int(data["adults"]), int(data.get("adult_increment", 0)),
+                                                       int(data.get("step_count", 1)))
+        for key in ("adults", "adult_increment", "step_count"):
+            data.pop(key, None)
+        return cls(**data)
+
+    def search_params(self, today=None):
+        """Parameters for build_search_grid covering every night of the window"""
+        today = today or date.today()
+        checkin = today + timedelta(days=self.start_in_days)
+        return {
+            "destination": self.destination,
+            "checkin_date": checkin.strftime('%Y-%m-%d'),
+            "checkout_date": (checkin + timedelta(days=self.nights)).strftime('%Y-%m-%d'),
+            "adult_counts": self.adult_counts,
+            "base_adults": self.adult_counts[0],
+            "rooms": str(self.rooms),
+            "children": str(self.children),
+            "search_type": "range",
+            "filter_params": list(self.filters),
+        }
+
+    def __repr__(self):
+        return f"WatchJob({self.name!r}, every {self.interval}s)"
+
+
+class JobScheduler:
+    """Runs WatchJobs on their own cadence within the driver pool's fixed browser budget.
+
+    Each round takes every due watch job, groups them by destination (login and
+    destination lookup are paid once per round), runs identical search cells only once,
+    and submits cells nearest to today first so short-term prices refresh soonest.
+    """
+
+    def __init__(self, dispatcher=None, on_results=None, incremental=False):
+        self.dispatcher = dispatcher or SearchDispatcher()
+        self.on_results = on_results  # called once per cell as on_results(grid_job, hotel_results, watch_jobs)
+        self.incremental = incremental
+        self._queue = []  # heap of (next_run_at, sequence, watch_job)
+        self._sequence = itertools.count()
+        self._stop = threading.Event()
+        self._setup_logging()
+
+    def _setup_logging(self):
+        self.logger = logging.getLogger('JobScheduler')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+
+    def add(self, watch_job, run_at=None):
+        heapq.heappush(self._queue, (run_at or time.time(), next(self._sequence), watch_job))
+
+    def next_run_at(self):
+        return self._queue[0][0] if self._queue else None
+
+    def _pop_due(self, now):
+        due = []
+        while self._queue and self._queue[0][0] <= now:
+            due.append(heapq.heappop(self._queue)[2])
+        return due
+
+    @staticmethod
+    def plan(watch_jobs, today=None):
+        """Coalesce the watch jobs into unique grid jobs ordered nearest check-in first.
+
+        Returns (grid jobs, {grid index: [watch jobs wanting that cell]}, destinations).
+        """
+        cells = {}
+        by_destination = {}
+        for watch_job in watch_jobs:
+            key = DestinationCache.normalize(watch_job.destination)
+            by_destination.setdefault(key, watch_job.destination)
+            for job in build_search_grid(watch_job.search_params(today)):
+                cell_key = ScrapeLedger.cell_key(job)
+                if cell_key not in cells:
+                    cells[cell_key] = (job, [])
+                cells[cell_key][1].append(watch_job)
+
+        # Priority: earliest check-in, then destination, so one city's nights run together
+        heap = [(job['params']['checkin'], DestinationCache.normalize(job['params']['ss']), order, job, watchers)
+                for order, (job, watchers) in enumerate(cells.values())]
+        heapq.heapify(heap)
+        jobs, watchers_by_index = [], {}
+        while heap:
+            *_, job, watchers = heapq.heappop(heap)
+            job['index'] = len(jobs)
+            jobs.append(job)
+            watchers_by_index[job['index']] = watchers
+        return jobs, watchers_by_index, list(by_destination.values())
+
+    def run_due(self, now=None):
+        """Run every watch job that is due, reschedule them and return the number of cells run"""
+        now = now or time.time()
+        due = self._pop_due(now)
+        if not due:
+            return 0
+        jobs, watchers_by_index, destinations = self.plan(due)
+        self.logger.info(f"Running {len(due)} watch job(s) over {len(destinations)} destination(s): "
+                         f"{len(jobs)} unique search cell(s)")
+        self.dispatcher.prepare_grid(jobs)
+        try:
+            for job, hotel_results in self.dispatcher.iter_run(jobs, incremental=self.incremental):
+                if self.on_results is not None:
+                    self.on_results(job, hotel_results, watchers_by_index[job['index']])
+        except Exception as e:
+            self.logger.error(f"Watch round failed: {str(e)}")
+        finally:
+            for watch_job in due:
+                self.add(watch_job, run_at=now + watch_job.interval)
+        return len(jobs)
+
+    def run_forever(self):
+        """Run rounds until stop() is called"""
+        while not self._stop.is_set():
+            self.run_due()
+            next_run_at = self.next_run_at()
+            if next_run_at is None:
+                break
+            wait = max(0, next_run_at - time.time())
+            if wait:
+                self.logger.info(f"Next watch round in {wait:.0f}s")
+                self._stop.wait(wait)
+
+    def stop(self):
+        self._stop.set()
@@ -0,0 +1,255 @@
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from utils.config import Config
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style"""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = None
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        """Add another histogram with the same buckets into this one"""
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.sum += other.sum
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def cumulative(self):
+        """[(upper bound, observations <= bound)], ending with ('+Inf', count)"""
+        total, result = 0, []
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else None,
+            'max': self.max,
+            'buckets': {str(bound): count for bound, count in self.cumulative()},
+        }
+
+
+class ScrapeMetrics:
+    """Process-wide per-phase timings and counters for every scrape.
+
+    Phases (navigation, scroll, parse, ...) are timed with phase() and land in the
+    webscrap_phase_seconds histogram labelled by phase. Counters cover cards found and
+    dropped, retries and queries. export() writes a JSON dump and a Prometheus text file;
+    setting Config.METRICS_PORT also serves the text format on /metrics.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(ScrapeMetrics, cls).__new__(cls)
+                cls._instance._setup()
+        return cls._instance
+
+    def _setup(self):
+        self.enabled = Config.METRICS_ENABLED
+        self.started_at = time.time()
+        self._histograms = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self.logger = logging.getLogger('ScrapeMetrics')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+        if self.enabled and Config.METRICS_PORT:
+            self.serve(Config.METRICS_PORT)
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def observe(self, name, value, buckets=None, **labels):
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            if key not in self._histograms:
+                self._histograms[key] = Histogram(buckets or Config.METRICS_SECONDS_BUCKETS)
+            self._histograms[key].observe(value)
+
+    def increment(self, name, amount=1, **labels):
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe_phase(self, phase, seconds):
+        self.observe('phase_seconds', seconds, phase=phase)
+
+    @contextmanager
+    def phase(self, phase):
+        """Time the with-block into the phase_seconds histogram (also when it raises)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_phase(phase, time.perf_counter() - start)
+
+    def reset(self):
+        with self._lock:
+            self._histograms = {}
+            self._counters = {}
+            self.started_at = time.time()
+
+    def drain(self):
+        """Take and clear the raw (counters, histograms), e.g. to send them to another process"""
+        with self._lock:
+            drained = (self._counters, self._histograms)
+            self._counters, self._histograms = {}, {}
+        return drained
+
+    def merge(self, drained):
+        """Fold counters and histograms returned by drain() into this registry"""
+        if not self.enabled:
+            return
+        counters, histograms = drained
+        with self._lock:
+            for key, value in counters.items():
+                self._counters[key] = self._counters.get(key, 0) + value
+            for key, histogram in histograms.items():
+                if key in self._histograms:
+                    self._histograms[key].merge(histogram)
+                else:
+                    self._histograms[key] = histogram
+
+    def snapshot(self):
+        """JSON-friendly view of every counter and histogram"""
+        with self._lock:
+            histograms = {key: histogram.to_dict() for key, histogram in self._histograms.items()}
+            counters = dict(self._counters)
+        return {
+            'started_at': self.started_at,
+            'generated_at': time.time(),
+            'counters': [
+                {'name': name, 'labels': dict(labels), 'value': value}
+                for (name, labels), value in sorted(counters.items())
+            ],
+            'histograms': [
+                {'name': name, 'labels': dict(labels), **data}
+                for (name, labels), data in sorted(histograms.items())
+            ],
+        }
+
+    def phase_summary(self):
+        """{phase: (count, total seconds)} sorted by total time, for log lines"""
+        with self._lock:
+            phases = {
+                dict(labels)['phase']: (histogram.count, round(histogram.sum, 2))
+                for (name, labels), histogram in self._histograms.items() if name == 'phase_seconds'
+            }
+        return dict(sorted(phases.items(), key=lambda item: -item[1][1]))
+
+    @staticmethod
+    def _format_labels(labels, extra=None):
+        pairs = list(labels) + ([extra] if extra else [])
+        if not pairs:
+            return ''
+        escape = lambda value: str(value).replace('\\', '\\\\').replace('"', '\\"')
+        return '{' + ','.join(f'{name}="{escape(value)}"' for name, value in pairs) + '}'
+
+    def to_prometheus(self):
+        """Prometheus text exposition format (version 0.0.4)"""
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+        lines = []
+        declared = set()
+        for (name, labels), value in counters:
+            metric = f'webscrap_{name}_total'
+            if metric not in declared:
+                declared.add(metric)
+                lines.append(f'# TYPE {metric} counter')
+            lines.append(f'{metric}{self._format_labels(labels)} {value}')
+        for (name, labels), histogram in histograms:
+            metric = f'webscrap_{name}'
+            if metric not in declared:
+                declared.add(metric)
+                lines.append(f'# TYPE {metric} histogram')
+            for bound, count in histogram.cumulative():
+                lines.append(f'{metric}_bucket{self._format_labels(labels, ("le", bound))} {count}')
+            lines.append(f'{metric}_sum{self._format_labels(labels)} {histogram.sum}')
+            lines.append(f'{metric}_count{self._format_labels(labels)} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _write_atomic(path, content):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_file = path + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_file, path)
+
+    def export(self, json_file=None, prometheus_file=None):
+        """Write the JSON dump and the Prometheus text file configured in Config"""
+        if not self.enabled:
+            return
+        json_file = json_file or Config.METRICS_JSON_FILE
+        prometheus_file = prometheus_file or Config.METRICS_PROMETHEUS_FILE
+        try:
+            if json_file:
+                self._write_atomic(json_file, json.dumps(self.snapshot(), indent=2))
+            if prometheus_file:
+                self._write_atomic(prometheus_file, self.to_prometheus())
+        except OSError as e:
+            self.logger.warning(f"Could not export metrics: {str(e)}")
+            return
+        self.logger.info(f"Time per phase (count, seconds): {self.phase_summary()}")
+
+    def serve(self, port, host='127.0.0.1'):
+        """Serve the Prometheus text format on http://host:port/metrics from a daemon thread"""
+        if self._server is not None:
+            return self._server
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.to_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.logger.info(f"Serving metrics on http://{host}:{port}/metrics")
+        return self._server
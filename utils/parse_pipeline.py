@@ -0,0 +1,200 @@
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from utils.card_parser import get_card_parser
+from utils.config import Config
+from utils.metrics import ScrapeMetrics
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+
+def _init_worker(metrics_enabled):
+    # A forked worker inherits the parent's metrics (and maybe its /metrics port); start clean
+    Config.METRICS_ENABLED = metrics_enabled
+    Config.METRICS_PORT = None
+    ScrapeMetrics._instance = None
+    ScrapeMetrics._instance_lock = threading.Lock()
+
+def parse_page(backend, page_source):
+    """Worker-process entry point: parse one page and return (records, drained metrics)"""
+    records = get_card_parser(backend).parse(page_source)
+    return records, ScrapeMetrics().drain()
+
+
+class ParsePipeline:
+    """Process-wide pool of parser processes fed with raw results-page HTML.
+
+    Fetch threads hand pages to submit() and go back to the network or browser while
+    the cards are parsed in another process, outside the GIL. At most
+    Config.PARSE_QUEUE_SIZE pages wait for a parser at once; further submits block,
+    so fetchers cannot run ahead of the parsers. Worker metrics are merged back into
+    this process's ScrapeMetrics.
+
+    The pool only pays off when there is fetching to overlap (offset pages, the async
+    engine); a lone page is parsed on the calling thread by parse(), which is cheaper
+    than the round trip to a worker.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(ParsePipeline, cls).__new__(cls)
+                cls._instance._setup()
+        return cls._instance
+
+    def _setup(self):
+        workers = Config.PARSE_WORKERS
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.enabled = self.workers > 0
+        self.backend = Config.CARD_PARSER
+        self._inline_parser = get_card_parser(self.backend)
+        self._slots = threading.BoundedSemaphore(Config.PARSE_QUEUE_SIZE)
+        self._sequence = itertools.count()
+        self._executor = None
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger('ParsePipeline')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self.logger.info(f"Starting {self.workers} parser process(es) ({self.backend})")
+                # Never fork: this process already runs Tk, Selenium and pool threads
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                     initargs=(ScrapeMetrics().enabled,),
+                                                     mp_context=multiprocessing.get_context(Config.PARSE_START_METHOD))
+            return self._executor
+
+    def submit(self, page_source, **meta):
+        """Queue a page for parsing and return a Future of its HotelRecords.
+
+        Blocks while PARSE_QUEUE_SIZE pages are already waiting. The Future carries
+        .sequence (submission order) and .meta (the keyword arguments) for reordering.
+        """
+        if page_source and not self._slots.acquire(blocking=False):
+            with ScrapeMetrics().phase('parse_backpressure'):
+                self._slots.acquire()
+        return self._submit_acquired(page_source, meta)
+
+    def _submit_acquired(self, page_source, meta):
+        """submit() once a queue slot is held; the slot is released when the parse finishes"""
+        parsed = Future()
+        parsed.sequence = next(self._sequence)
+        parsed.meta = meta
+        if not page_source:
+            parsed.set_result([])
+            return parsed
+
+        metrics = ScrapeMetrics()
+        submitted = time.perf_counter()
+        try:
+            pending = self._get_executor().submit(parse_page, self.backend, page_source)
+        except Exception:
+            self._slots.release()
+            raise
+
+        def done(pending):
+            self._slots.release()
+            if parsed.cancelled():  # e.g. the awaiting coroutine was cancelled
+                return
+            try:
+                records, drained = pending.result()
+            except Exception as e:
+                parsed.set_exception(e)
+                return
+            metrics.merge(drained)
+            metrics.observe_phase('parse_roundtrip', time.perf_counter() - submitted)
+            parsed.set_result(records)
+
+        pending.add_done_callback(done)
+        return parsed
+
+    def parse(self, page_source):
+        """Parse one page on the calling thread: with nothing to overlap, the round trip to a
+        worker process costs more than the parse itself"""
+        return self._inline_parser.parse(page_source) if page_source else []
+
+    async def parse_async(self, page_source):
+        """Parse one page in a worker process for the asyncio engine, awaiting the result
+        instead of holding a thread; backpressure only takes a thread while it waits"""
+        if not page_source:
+            return []
+        if not self.enabled:
+            return await asyncio.to_thread(self._inline_parser.parse, page_source)
+        if not self._slots.acquire(blocking=False):
+            with ScrapeMetrics().phase('parse_backpressure'):
+                acquiring = asyncio.ensure_future(asyncio.to_thread(self._slots.acquire))
+                try:
+                    await asyncio.shield(acquiring)
+                except asyncio.CancelledError:
+                    # The thread still takes the slot; give it back once it does
+                    acquiring.add_done_callback(lambda _: self._slots.release())
+                    raise
+        try:
+            return await asyncio.wrap_future(self._submit_acquired(page_source, {}))
+        except BrokenProcessPool as e:
+            self._broken(e)
+            return await asyncio.to_thread(self._inline_parser.parse, page_source)
+
+    def iter_pipeline(self, items, fetch, workers):
+        """Fetch items on `workers` threads, parse the pages in the process pool and yield
+        (item, records) in input order while later items are still being fetched.
+        Closing the generator early cancels the fetches that have not started."""
+        items = list(items)
+
+        def fetch_and_submit(index, item):
+            page_source = fetch(item)
+            return page_source, self._stage(page_source, index=index)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(len(items), workers))) as executor:
+            fetched = [executor.submit(fetch_and_submit, index, item) for index, item in enumerate(items)]
+            try:
+                for item, pending in zip(items, fetched):
+                    yield item, self._resolve(*pending.result())
+            finally:
+                for pending in fetched:
+                    pending.cancel()
+
+    def _stage(self, page_source, **meta):
+        """A Future from the process pool, or the records themselves when parsing inline"""
+        if not page_source:
+            return []
+        if self.enabled:
+            try:
+                return self.submit(page_source, **meta)
+            except BrokenProcessPool as e:
+                self._broken(e)
+        return self._inline_parser.parse(page_source)
+
+    def _resolve(self, page_source, staged):
+        if not isinstance(staged, Future):
+            return staged
+        try:
+            return staged.result()
+        except BrokenProcessPool as e:
+            self._broken(e)
+            return self._inline_parser.parse(page_source)
+
+    def _broken(self, error):
+        self.logger.error(f"Parser process died, parsing inline: {str(error)}")
+        self._discard_executor()
+
+    def _discard_executor(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        self._discard_executor()
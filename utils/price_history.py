@@ -0,0 +1,209 @@
+from utils.config import Config
+from utils.helpers.destination_cache import DestinationCache
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+class PriceHistoryStore:
+    """Process-wide SQLite store of every scraped hotel price.
+
+    Rows are buffered per search cell and written in batches inside one transaction;
+    the database runs in WAL mode so queries never block ingestion. Hotels are stored
+    once in `hotels` (keyed by their link without query string) and each observation
+    in `prices`, indexed by (hotel, stay date) for trajectories and by
+    (destination, scrape time) for per-destination views.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS hotels (
+            id INTEGER PRIMARY KEY,
+            hotel_key TEXT NOT NULL UNIQUE,
+            name TEXT,
+            location TEXT,
+            link TEXT
+        );
+        CREATE TABLE IF NOT EXISTS prices (
+            scraped_at REAL NOT NULL,
+            hotel_id INTEGER NOT NULL REFERENCES hotels(id),
+            destination TEXT NOT NULL,
+            stay_date TEXT NOT NULL,
+            checkout TEXT,
+            adults INTEGER,
+            rooms INTEGER,
+            children INTEGER,
+            filters TEXT,
+            price REAL,
+            tax REAL,
+            currency TEXT,
+            review_score REAL,
+            review_count INTEGER,
+            serial_no INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS hotels_name ON hotels (name);
+        CREATE INDEX IF NOT EXISTS prices_hotel_stay ON prices (hotel_id, stay_date, scraped_at);
+        CREATE INDEX IF NOT EXISTS prices_destination_scraped ON prices (destination, scraped_at);
+        CREATE INDEX IF NOT EXISTS prices_destination_night_price
+            ON prices (destination, stay_date, price, scraped_at, adults);
+    """
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(PriceHistoryStore, cls).__new__(cls)
+                cls._instance._setup()
+        return cls._instance
+
+    def _setup(self):
+        self.db_file = Config.PRICE_HISTORY_FILE
+        self.batch_size = Config.PRICE_HISTORY_BATCH_SIZE
+        self._lock = threading.Lock()
+        self._pending = []
+        self._hotel_ids = {}
+        self.logger = logging.getLogger('PriceHistoryStore')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_file)), exist_ok=True)
+        # One connection shared by the dispatcher and GUI threads, serialized by _lock
+        self._connection = sqlite3.connect(self.db_file, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(self.SCHEMA)
+        self._connection.commit()
+
+    @staticmethod
+    def hotel_key(link=None, name=None):
+        """Stable hotel identity: the link without query/fragment, else the lowercased name"""
+        if link:
+            return link.split('#')[0].split('?')[0]
+        return (name or "").strip().lower()
+
+    def record(self, job, hotel_results, scraped_at=None):
+        """Buffer one search cell's rows; written once batch_size rows are waiting.
+
+        Only fresh observations are stored: rows replayed from the response cache were
+        recorded when their page was fetched. Each row is stamped with its page's fetch
+        time (scraped_at overrides it).
+        """
+        fresh = [hotel for hotel in hotel_results or [] if not hotel.cached]
+        if not fresh:
+            return
+        params = job['params']
+        now = time.time()
+        destination = DestinationCache.normalize(params['ss'])
+        filters = json.dumps(sorted(params.get('filter') or []))
+        rows = [(
+            self.hotel_key(hotel.link, hotel.name), hotel.name, hotel.location, hotel.link,
+            scraped_at or hotel.fetched_at or now, destination, params['checkin'], params['checkout'],
+            hotel.adults if hotel.adults is not None else job['adults'],
+            params.get('no_rooms'), params.get('group_children'), filters,
+            hotel.price, hotel.tax, hotel.currency, hotel.review_score, hotel.review_count, hotel.serial_no,
+        ) for hotel in fresh]
+        with self._lock:
+            self._pending.extend(rows)
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self):
+        """Write every buffered row in one transaction"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        try:
+            with self._connection:
+                hotel_ids = self._resolve_hotels(rows)
+                self._connection.executemany(
+                    "INSERT INTO prices (scraped_at, hotel_id, destination, stay_date, checkout, adults, rooms, "
+                    "children, filters, price, tax, currency, review_score, review_count, serial_no) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(row[4], hotel_ids[row[0]]) + row[5:] for row in rows],
+                )
+        except sqlite3.Error as e:
+            self._hotel_ids = {}
+            self.logger.error(f"Could not write {len(rows)} price rows: {str(e)}")
+            return
+        self.logger.info(f"Recorded {len(rows)} price rows")
+
+    def _resolve_hotels(self, rows):
+        """hotel_key -> id for the batch, inserting unseen hotels"""
+        new = {}
+        for hotel_key, name, location, link, *_ in rows:
+            if hotel_key not in self._hotel_ids:
+                new[hotel_key] = (hotel_key, name, location, link)
+        if new:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO hotels (hotel_key, name, location, link) VALUES (?, ?, ?, ?)", new.values())
+            keys = list(new)
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                self._hotel_ids.update(self._connection.execute(
+                    f"SELECT hotel_key, id FROM hotels WHERE hotel_key IN ({placeholders})", chunk))
+        return self._hotel_ids
+
+    def price_trajectory(self, hotel, stay_date, adults=None):
+        """[{scraped_at, price, tax, currency, adults}] for one hotel (link or name) and night, oldest first"""
+        query = ("SELECT p.scraped_at, p.price, p.tax, p.currency, p.adults FROM prices p "
+                 "WHERE p.hotel_id IN (SELECT id FROM hotels WHERE hotel_key = ? OR name = ?) AND p.stay_date = ?")
+        args = [self.hotel_key(hotel), hotel, stay_date]
+        if adults is not None:
+            query += " AND p.adults = ?"
+            args.append(adults)
+        query += " ORDER BY p.scraped_at"
+        return self._query(query, args)
+
+    # Walks the nights with index seeks (a recursive skip scan) and takes the first
+    # qualifying row in price order per night, so cost grows with nights, not rows
+    CHEAPEST_PER_NIGHT = """
+        WITH RECURSIVE nights(stay_date) AS (
+            SELECT MIN(stay_date) FROM prices WHERE destination = :destination
+            UNION ALL
+            SELECT (SELECT MIN(stay_date) FROM prices WHERE destination = :destination AND stay_date > nights.stay_date)
+            FROM nights WHERE nights.stay_date IS NOT NULL
+        )
+        SELECT n.stay_date, p.price, p.currency, h.name, h.link, p.adults, p.scraped_at
+        FROM nights n
+        JOIN prices p ON p.rowid = (
+            SELECT rowid FROM prices
+            WHERE destination = :destination AND stay_date = n.stay_date AND price IS NOT NULL
+              AND scraped_at >= :since AND (:adults IS NULL OR adults = :adults)
+            ORDER BY price LIMIT 1)
+        JOIN hotels h ON h.id = p.hotel_id
+        ORDER BY n.stay_date
+    """
+
+    def cheapest_per_night(self, destination, since=None, adults=None):
+        """[{stay_date, price, currency, name, link, adults, scraped_at}] with the lowest price seen
+        for each night at destination (optionally only scrapes after `since`, an epoch time)"""
+        return self._query(self.CHEAPEST_PER_NIGHT, {
+            'destination': DestinationCache.normalize(destination),
+            'since': since or 0,
+            'adults': adults,
+        })
+
+    def _query(self, query, args):
+        with self._lock:
+            self._flush_locked()
+            cursor = self._connection.execute(query, args)
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def stats(self):
+        with self._lock:
+            hotels, = self._connection.execute("SELECT COUNT(*) FROM hotels").fetchone()
+            rows, = self._connection.execute("SELECT COUNT(*) FROM prices").fetchone()
+        return {'hotels': hotels, 'price_rows': rows, 'pending': len(self._pending)}
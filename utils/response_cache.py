@@ -0,0 +1,156 @@
+from urllib.parse import urlparse, parse_qsl, urlencode
+from utils.config import Config
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+
+def replay_only():
+    """True when results pages and destinations may only come from the local caches"""
+    return Config.RESPONSE_CACHE_ENABLED and ResponseCache().replay_only
+
+
+class ResponseCache:
+    """Content-addressed on-disk cache of results-page HTML with TTL and LRU size cap.
+
+    Entries are zlib-compressed files named by the SHA-256 of the normalized URL, with
+    an index.json holding expiry and last-access times. In replay-only mode misses are
+    never filled from the network, which makes parser runs fully offline and repeatable.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(ResponseCache, cls).__new__(cls)
+                cls._instance._setup()
+        return cls._instance
+
+    def _setup(self):
+        self.cache_dir = Config.RESPONSE_CACHE_DIR
+        self.ttl = Config.RESPONSE_CACHE_TTL
+        self.max_bytes = Config.RESPONSE_CACHE_MAX_BYTES
+        self.replay_only = Config.CACHE_REPLAY_ONLY
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._index_file = os.path.join(self.cache_dir, 'index.json')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        try:
+            with open(self._index_file, 'r', encoding='utf-8') as f:
+                self._index = json.load(f)
+        except (OSError, ValueError):
+            self._index = {}
+        self.logger = logging.getLogger('ResponseCache')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+
+    @staticmethod
+    def normalize_url(url):
+        """Sort query parameters so the same search always maps to the same key"""
+        parsed = urlparse(url)
+        query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+        return f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{query}"
+
+    def key_for(self, url):
+        return hashlib.sha256(self.normalize_url(url).encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.html.z')
+
+    def _save_index(self):
+        tmp_file = self._index_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_file, self._index_file)
+
+    def get(self, url):
+        """Return the cached HTML for url, or None on a miss or expired entry"""
+        return self.lookup(url)[0]
+
+    def lookup(self, url):
+        """(HTML, epoch time it was fetched) for url, or (None, None) on a miss or expired entry"""
+        key = self.key_for(url)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry and (self.replay_only or entry['expires_at'] > time.time()):
+                try:
+                    with open(self._path(key), 'rb') as f:
+                        page_source = zlib.decompress(f.read()).decode('utf-8')
+                    entry['last_access'] = time.time()
+                    self.hits += 1
+                    return page_source, entry['stored_at']
+                except (OSError, zlib.error):
+                    self._index.pop(key, None)
+            self.misses += 1
+            return None, None
+
+    def put(self, url, page_source, ttl=None):
+        key = self.key_for(url)
+        data = zlib.compress(page_source.encode('utf-8'), Config.RESPONSE_CACHE_COMPRESSION)
+        now = time.time()
+        with self._lock:
+            with open(self._path(key), 'wb') as f:
+                f.write(data)
+            self._index[key] = {
+                'url': self.normalize_url(url),
+                'stored_at': now,
+                'expires_at': now + (ttl if ttl is not None else self.ttl),
+                'last_access': now,
+                'size': len(data),
+            }
+            self._evict()
+            self._save_index()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        total = sum(entry['size'] for entry in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1]['last_access']):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            total -= entry['size']
+            del self._index[key]
+            self.evictions += 1
+
+    def flush(self):
+        """Persist last-access times so LRU order survives restarts"""
+        with self._lock:
+            self._save_index()
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._index):
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            self._index = {}
+            self._save_index()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._index),
+                'bytes': sum(entry['size'] for entry in self._index.values()),
+            }
@@ -0,0 +1,229 @@
+from utils.config import Config
+import numpy as np
+import pandas as pd
+import time
+
+# HotelRecord fields plus the search context of the job that produced them
+RESULT_COLUMNS = ("destination", "checkin", "checkout", "adults", "serial_no", "name", "location",
+                  "price", "tax", "currency", "review_score", "review_count", "date", "link", "scraped_at")
+
+# Results-table view columns and the table column each one shows
+DISPLAY_COLUMNS = {
+    "serial": "serial_no",
+    "name": "name",
+    "location": "location",
+    "adults": "adults",
+    "price": "price",
+    "tax": "tax",
+    "review": "review_score",
+    "review_count": "review_count",
+    "date": "date",
+}
+
+def format_amounts(values, currencies):
+    """Vectorized format_amount: '₹3,450.00' for every value of a column"""
+    numbers = values.fillna(0).map("{:,.2f}".format)
+    return currencies.astype(object).fillna(Config.DEFAULT_CURRENCY) + numbers
+
+def frame_values(frame, columns, positions=None):
+    """Plain Python values (None for missing) of a results DataFrame, one list per row"""
+    if positions is not None:
+        frame = frame.iloc[positions]
+    frame = frame[list(columns)].astype(object)
+    return frame.where(frame.notna(), None).values.tolist()
+
+
+class ResultsTable:
+    """Search results held column by column in a pandas DataFrame.
+
+    Numbers stay numeric (parsed once by HotelRecord), repeated strings such as the
+    destination, dates and currency are categorical, and rows are addressed by
+    position. Appended rows are buffered as plain column lists and turned into a small
+    chunk frame on the next read; rows are displayed straight from their chunk, so a
+    search streaming in job by job never rebuilds the whole table. The chunks are only
+    consolidated into one frame when the whole table is needed (sorting, exports).
+    """
+
+    _dtypes = {
+        "destination": "category",
+        "checkin": "category",
+        "checkout": "category",
+        "adults": "Int16",
+        "serial_no": "Int32",
+        "name": object,
+        "location": object,
+        "price": "float64",
+        "tax": "float64",
+        "currency": "category",
+        "review_score": "float64",
+        "review_count": "Int64",
+        "date": "category",
+        "link": object,
+        "scraped_at": "category",
+    }
+
+    def __init__(self):
+        self._frame = self._empty()
+        self._chunks = []  # (start position, DataFrame) appended since the last consolidation
+        self._chunk_rows = 0
+        self._pending = {column: [] for column in RESULT_COLUMNS}
+        self._pending_rows = 0
+        self._sort_keys = {}  # column -> float key per row, NaN where missing
+        self._orders = {}  # ((column, descending), ...) -> row positions
+
+    @classmethod
+    def _empty(cls):
+        return pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in cls._dtypes.items()})
+
+    @classmethod
+    def from_records(cls, hotel_results, job=None, scraped_at=None):
+        table = cls()
+        table.append(hotel_results, job, scraped_at)
+        return table
+
+    def append(self, hotel_results, job=None, scraped_at=None):
+        """Add rows; returns the (start, end) positions they occupy. scraped_at defaults to
+        the time each row's page was fetched (HotelRecord.fetched_at), else now."""
+        start = len(self)
+        if not hotel_results:
+            return start, start
+        pending = self._pending
+        for field in ("serial_no", "name", "location", "price", "tax", "currency",
+                      "review_score", "review_count", "date", "link"):
+            pending[field].extend(getattr(hotel, field) for hotel in hotel_results)
+        adults = [hotel.adults for hotel in hotel_results]
+        if job:
+            adults = [job['adults'] if value is None else value for value in adults]
+        pending["adults"].extend(adults)
+        params = job['params'] if job else {}
+        count = len(hotel_results)
+        pending["destination"].extend([params.get('ss')] * count)
+        pending["checkin"].extend([params.get('checkin')] * count)
+        pending["checkout"].extend([params.get('checkout')] * count)
+        if scraped_at:
+            pending["scraped_at"].extend([scraped_at] * count)
+        else:
+            # When each row's page was fetched; rows reused from the ledger or the response
+            # cache keep their original time. Rows of one page share a fetch time.
+            now = time.strftime('%Y-%m-%dT%H:%M:%S')
+            stamps = {None: now}
+            for hotel in hotel_results:
+                if hotel.fetched_at not in stamps:
+                    stamps[hotel.fetched_at] = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(hotel.fetched_at))
+                pending["scraped_at"].append(stamps[hotel.fetched_at])
+        self._pending_rows += count
+        # New rows change every sort key and order
+        self._sort_keys = {}
+        self._orders = {}
+        return start, start + count
+
+    def _flush_pending(self):
+        """Turn the buffered rows into a chunk frame (cost grows with the new rows only)"""
+        if self._pending_rows:
+            # Missing numbers arrive as None; the dtypes turn them into NaN/<NA>
+            chunk = pd.DataFrame(self._pending, columns=list(RESULT_COLUMNS)).astype(self._dtypes)
+            self._chunks.append((len(self._frame) + self._chunk_rows, chunk))
+            self._chunk_rows += len(chunk)
+            self._pending = {column: [] for column in RESULT_COLUMNS}
+            self._pending_rows = 0
+
+    @property
+    def frame(self):
+        """The consolidated DataFrame (RangeIndex = row position)"""
+        self._flush_pending()
+        if self._chunks:
+            frames = ([self._frame] if len(self._frame) else []) + [chunk for _, chunk in self._chunks]
+            self._frame = pd.concat(frames, ignore_index=True).astype(self._dtypes) if len(frames) > 1 else frames[0]
+            self._chunks = []
+            self._chunk_rows = 0
+        return self._frame
+
+    def __len__(self):
+        return len(self._frame) + self._chunk_rows + self._pending_rows
+
+    def clear(self):
+        self.__init__()
+
+    def _select(self, positions):
+        """Rows at the given positions, read from the consolidated frame and the chunks
+        without consolidating them"""
+        if positions is None:
+            return self.frame
+        self._flush_pending()
+        positions = np.asarray(positions, dtype=np.int64)
+        if not self._chunks:
+            return self._frame.iloc[positions]
+        regions = [(0, self._frame)] + self._chunks
+        starts = np.array([start for start, _ in regions])
+        # side='right' skips an empty consolidated frame that shares its start with the first chunk
+        owner = np.searchsorted(starts, positions, side='right') - 1
+        if not len(positions) or (owner == owner[0]).all():
+            start, rows = regions[owner[0] if len(positions) else 0]
+            return rows.iloc[positions - start]
+        pieces, taken = [], []
+        for region, (start, rows) in enumerate(regions):
+            mine = np.flatnonzero(owner == region)
+            if len(mine):
+                pieces.append(rows.iloc[positions[mine] - start].astype(object))
+                taken.append(mine)
+        return pd.concat(pieces).iloc[np.argsort(np.concatenate(taken), kind="stable")]
+
+    def display_rows(self, positions=None):
+        """Display strings for the results table, one tuple per row in DISPLAY_COLUMNS order"""
+        frame = self._select(positions)
+        not_available = lambda column: frame[column].astype(object).where(frame[column].notna(), "N/A")
+        display = pd.DataFrame({
+            "serial": frame["serial_no"].astype(object).where(frame["serial_no"].notna(), ""),
+            "name": frame["name"],
+            "location": frame["location"],
+            "adults": not_available("adults"),
+            "price": format_amounts(frame["price"], frame["currency"]),
+            "tax": format_amounts(frame["tax"], frame["currency"]),
+            "review": not_available("review_score"),
+            "review_count": not_available("review_count"),
+            "date": not_available("date"),
+        })
+        return list(display.itertuples(index=False, name=None))
+
+    def values(self, columns, positions=None):
+        """Plain Python values (None for missing) for the given columns, one list per row"""
+        return frame_values(self.frame, columns, positions)
+
+    def records(self, columns=RESULT_COLUMNS, positions=None):
+        """Rows as dicts of plain Python values, e.g. for exporters"""
+        return [dict(zip(columns, row)) for row in self.values(columns, positions)]
+
+    def sort_key(self, column):
+        """Float sort key per row (NaN where missing), computed once per table contents.
+        Text and categorical columns are keyed by the rank of their value."""
+        frame = self.frame
+        if column not in self._sort_keys:
+            values = frame[column]
+            if values.dtype == object or isinstance(values.dtype, pd.CategoricalDtype):
+                codes, _ = pd.factorize(values.astype(object), sort=True)
+                key = codes.astype("float64")
+                key[codes < 0] = np.nan
+            else:
+                key = values.to_numpy(dtype="float64", na_value=np.nan)
+            self._sort_keys[column] = key
+        return self._sort_keys[column]
+
+    def sort_order(self, columns, descending=False):
+        """Row positions ordered by one column, or by [(column, descending), ...] with the
+        first column most significant. Stable, missing values last; cached until rows change."""
+        if isinstance(columns, str):
+            columns = [(columns, descending)]
+        cache_key = tuple(columns)
+        if cache_key not in self._orders:
+            keys = []
+            # np.lexsort treats the last key as the primary one
+            for column, column_descending in reversed(cache_key):
+                values = self.sort_key(column)
+                missing = np.isnan(values)
+                keys.append(np.where(missing, 0, -values if column_descending else values))
+                keys.append(missing)
+            self._orders[cache_key] = np.lexsort(keys) if keys else np.arange(len(self))
+        return self._orders[cache_key]
+
+    def link(self, position):
+        return self._select([position])["link"].iat[0]
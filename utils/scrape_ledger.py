@@ -0,0 +1,117 @@
+from datetime import datetime, date
+from utils.config import Config
+from utils.helpers.destination_cache import DestinationCache
+from utils.hotel_record import HotelRecord
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+class ScrapeLedger:
+    """Persisted record of when each (destination, filters, dates, guests) search cell was
+    last scraped, together with its rows, so incremental refreshes only re-scrape stale cells.
+
+    Cells live in a small SQLite table, so recording a grid only writes that grid's cells.
+    Cells too old to ever be fresh again, or for nights already past, are pruned on record().
+    """
+
+    _lock = threading.Lock()
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cells (
+            cell_key TEXT PRIMARY KEY,
+            checkin TEXT NOT NULL,
+            scraped_at REAL NOT NULL,
+            rows TEXT NOT NULL
+        )
+    """
+
+    def __init__(self, ledger_file=None):
+        self.ledger_file = ledger_file or Config.SCRAPE_LEDGER_FILE
+        self._setup_logging()
+        os.makedirs(os.path.dirname(os.path.abspath(self.ledger_file)), exist_ok=True)
+        with self._lock, self._connect() as connection:
+            connection.execute(self.SCHEMA)
+
+    def _connect(self):
+        # Short-lived connections: the ledger is used from dispatcher, scheduler and event-loop threads
+        return sqlite3.connect(self.ledger_file, timeout=30)
+
+    def _setup_logging(self):
+        self.logger = logging.getLogger('ScrapeLedger')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+
+    @staticmethod
+    def cell_key(job):
+        params = job['params']
+        return json.dumps([
+            DestinationCache.normalize(params['ss']),
+            sorted(params.get('filter') or []),
+            params['checkin'],
+            params['checkout'],
+            str(params['group_adults']),
+            str(params.get('no_rooms', '')),
+            str(params.get('group_children', '')),
+        ])
+
+    @staticmethod
+    def freshness_window(job, today=None):
+        """Seconds a cell stays fresh; nights close to today go stale sooner"""
+        today = today or date.today()
+        checkin = datetime.strptime(job['params']['checkin'], '%Y-%m-%d').date()
+        if (checkin - today).days <= Config.NEAR_TERM_DAYS:
+            return Config.NEAR_TERM_FRESHNESS
+        return Config.INCREMENTAL_FRESHNESS
+
+    def partition(self, jobs):
+        """Split jobs into ({index: reused rows} for fresh cells, [stale jobs])"""
+        now = time.time()
+        reused, stale = {}, []
+        with self._lock, self._connect() as connection:
+            for job in jobs:
+                cell = connection.execute("SELECT scraped_at, rows FROM cells WHERE cell_key = ?",
+                                          (self.cell_key(job),)).fetchone()
+                if cell and now - cell[0] < self.freshness_window(job):
+                    reused[job['index']] = [self._restore(row, cell[0]) for row in json.loads(cell[1])]
+                else:
+                    stale.append(job)
+        self.logger.info(f"Incremental refresh: reusing {len(reused)} fresh cell(s), scraping {len(stale)}")
+        return reused, stale
+
+    @staticmethod
+    def _restore(row, scraped_at):
+        """A stored row as a HotelRecord that keeps its original fetch time and is marked as
+        not fetched for this search"""
+        hotel = HotelRecord.from_dict(row)
+        hotel.fetched_at = row.get('fetched_at') or scraped_at
+        hotel.cached = True
+        return hotel
+
+    def record(self, jobs, results_by_index):
+        """Remember when each job was scraped and the rows it produced.
+
+        Jobs without rows are not recorded: an empty result is usually a failed search
+        (unresolved destination, no cards after retries) and must be scraped again.
+        """
+        now = time.time()
+        cells = [
+            (self.cell_key(job), job['params']['checkin'], now,
+             json.dumps([dict(hotel.to_dict(), fetched_at=hotel.fetched_at or now)
+                         for hotel in results_by_index[job['index']]]))
+            for job in jobs if results_by_index.get(job['index'])
+        ]
+        expired_before = now - max(Config.INCREMENTAL_FRESHNESS, Config.NEAR_TERM_FRESHNESS)
+        with self._lock, self._connect() as connection:
+            connection.executemany("INSERT OR REPLACE INTO cells (cell_key, checkin, scraped_at, rows) "
+                                   "VALUES (?, ?, ?, ?)", cells)
+            pruned = connection.execute("DELETE FROM cells WHERE scraped_at < ? OR checkin < ?",
+                                        (expired_before, date.today().isoformat())).rowcount
+        if pruned:
+            self.logger.info(f"Pruned {pruned} expired cell(s)")
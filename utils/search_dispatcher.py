@@ -0,0 +1,204 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from utils.hotel_scraper import HotelScraper
+from utils.web_driver_pool import WebDriverPool
+from utils.response_cache import ResponseCache, replay_only
+from utils.scrape_ledger import ScrapeLedger
+from utils.price_history import PriceHistoryStore
+from utils.helpers.resource_blocker import ResourceBlocker
+from utils.metrics import ScrapeMetrics
+from utils.config import Config
+import logging
+import threading
+import time
+
+def build_search_grid(params):
+    """Expand the search form parameters into one job per (night, adult count)"""
+    base_params = {
+        "ss": params['destination'],
+        "checkin": params['checkin_date'],
+        "checkout": params['checkout_date'],
+        "group_adults": params['base_adults'],
+        "no_rooms": params['rooms'],
+        "group_children": params['children'],
+        "sb": "1",
+        "src": "searchresults",
+        "src_elem": "sb",
+        "filter": params["filter_params"]
+    }
+
+    if params['search_type'] == "single":
+        nights = [(None, params['checkin_date'], params['checkout_date'])]
+    else:
+        nights = []
+        current_date = datetime.strptime(params['checkin_date'], '%Y-%m-%d')
+        end_date = datetime.strptime(params['checkout_date'], '%Y-%m-%d')
+        while current_date < end_date:
+            next_date = current_date + timedelta(days=1)
+            checkin = current_date.strftime('%Y-%m-%d')
+            nights.append((checkin, checkin, next_date.strftime('%Y-%m-%d')))
+            current_date = next_date
+
+    jobs = []
+    for date, checkin, checkout in nights:
+        for adult_count in params['adult_counts']:
+            search_params = dict(base_params)
+            search_params.update({
+                "checkin": checkin,
+                "checkout": checkout,
+                "group_adults": adult_count,
+            })
+            jobs.append({
+                "index": len(jobs),
+                "date": date,
+                "adults": adult_count,
+                "params": search_params
+            })
+    return jobs
+
+def expand_adult_counts(base_adults, adult_increment=0, step_count=1, max_adults=10):
+    """2, increment 1, 3 steps -> [2, 3, 4] (capped at the maximum adult count)"""
+    if adult_increment > 0 and step_count > 1:
+        return [base_adults + i * adult_increment for i in range(step_count)
+                if base_adults + i * adult_increment <= max_adults]
+    return [base_adults]
+
+def build_batch_grid(param_sets):
+    """One grid over several searches (e.g. destinations), with job indexes unique across them"""
+    jobs = []
+    for params in param_sets:
+        for job in build_search_grid(params):
+            job['index'] = len(jobs)
+            jobs.append(job)
+    return jobs
+
+def annotate_results(hotel_results, job):
+    """Stamp the job's night and adult count onto its HotelRecords"""
+    hotel_results = hotel_results or []
+    for hotel in hotel_results:
+        if job['date']:
+            hotel.date = job['date']
+        hotel.adults = job['adults']
+    return hotel_results
+
+def merge_in_grid_order(jobs, results_by_index):
+    """Concatenate per-job results in grid order, however they arrived"""
+    all_results = []
+    for job in jobs:
+        all_results.extend(results_by_index.get(job['index'], []))
+    return all_results
+
+
+class SearchDispatcher:
+    """Spread a search grid across a WebDriverPool and merge the results in grid order"""
+
+    def __init__(self, pool=None):
+        self.pool = pool or WebDriverPool()
+        self._scrapers = {}
+        self._lock = threading.Lock()
+        self._setup_logging()
+
+    def _setup_logging(self):
+        self.logger = logging.getLogger('SearchDispatcher')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+
+    def _scraper_for(self, pooled):
+        """One HotelScraper per pool slot so each driver keeps its own session state"""
+        with self._lock:
+            if pooled.slot not in self._scrapers:
+                self._scrapers[pooled.slot] = HotelScraper(driver_manager=pooled)
+            return self._scrapers[pooled.slot]
+
+    def run_job(self, job):
+        """Run a single grid job on the next free driver"""
+        metrics = ScrapeMetrics()
+        waiting_since = time.perf_counter()
+        with self.pool.acquire() as pooled:
+            metrics.observe_phase('driver_acquire', time.perf_counter() - waiting_since)
+            scraper = self._scraper_for(pooled)
+            # Request pacing is handled per host by FetchPolicy's token bucket
+            with metrics.phase('query'):
+                hotel_results = scraper.get_hotel_pricing(dict(job['params']))
+            metrics.increment('queries')
+            return annotate_results(hotel_results, job)
+
+    def prepare(self, destinations):
+        """Log in and resolve each destination once on a single driver, so the searches that
+        follow inject the saved session and hit the destination cache instead"""
+        with self.pool.acquire() as pooled:
+            scraper = self._scraper_for(pooled)
+            if not replay_only():
+                scraper.ensure_session()
+            for destination in destinations:
+                scraper.get_destination_info(destination)
+
+    def resolve_destination(self, search_term):
+        """Resolve a destination on the next free driver, for callers without a browser of their own"""
+        with self.pool.acquire() as pooled:
+            return self._scraper_for(pooled).get_destination_info(search_term)
+
+    def prepare_grid(self, jobs):
+        """prepare() for the destinations of a search grid; on failure each search logs in on
+        its own, one at a time"""
+        try:
+            self.prepare(dict.fromkeys(job['params']['ss'] for job in jobs))
+        except Exception as e:
+            self.logger.warning(f"Could not warm up session and destinations: {str(e)}")
+
+    def iter_run(self, jobs, incremental=False):
+        """Yield (job, hotel_results) for each job as soon as it completes.
+
+        Fresh cells reused from the ScrapeLedger (incremental=True) are yielded first.
+        Failed jobs are logged and skipped. Scraped rows go to the PriceHistoryStore; the
+        ledger, history and caches are saved once the grid is exhausted.
+        """
+        ledger = ScrapeLedger()
+        history = PriceHistoryStore() if Config.PRICE_HISTORY_ENABLED else None
+        reused, pending = ledger.partition(jobs) if incremental else ({}, list(jobs))
+        for job in jobs:
+            if job['index'] in reused:
+                yield job, reused[job['index']]
+
+        scraped = {}
+        self.logger.info(f"Dispatching {len(pending)} searches across {self.pool.size} driver(s)")
+        try:
+            with ThreadPoolExecutor(max_workers=self.pool.size) as executor:
+                futures = {executor.submit(self.run_job, job): job for job in pending}
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        scraped[job['index']] = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Search {job['index']} (date={job['date']}, adults={job['adults']}) failed: {str(e)}")
+                        continue
+                    if history is not None:
+                        history.record(job, scraped[job['index']])
+                    yield job, scraped[job['index']]
+        finally:
+            ledger.record(pending, scraped)
+            if history is not None:
+                history.flush()
+            if Config.RESPONSE_CACHE_ENABLED:
+                cache = ResponseCache()
+                cache.flush()
+                self.logger.info(f"Response cache: {cache.stats()}")
+            if Config.LEAN_SCRAPE:
+                self.logger.info(f"Resource blocking: {ResourceBlocker.stats()}")
+            ScrapeMetrics().export()
+
+    def run(self, jobs, incremental=False):
+        """Run all jobs on the pool and return the merged results in grid order.
+
+        With incremental=True, cells scraped within the freshness window are reused
+        from the ScrapeLedger and only stale cells are scheduled.
+        """
+        results_by_index = {job['index']: hotel_results for job, hotel_results in self.iter_run(jobs, incremental)}
+        return merge_in_grid_order(jobs, results_by_index)
+
+    def shutdown(self):
+        self.pool.quit_all()
@@ -2,17 +2,17 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 import logging
-from selenium.common.exceptions import WebDriverException
 import os
-import time
 import urllib.request
 import os.path
+from utils.helpers.retry_policy import FetchPolicy
+from utils.helpers.resource_blocker import ResourceBlocker
+from utils.metrics import ScrapeMetrics
+from utils.config import Config
 
 class WebDriverManager:
     _instance = None
     _driver = None
-    _retry_count = 3
-    _retry_delay = 2  # seconds
     _extension_path = os.path.join(os.path.dirname(__file__), 'adblocker_ultimate.crx')
 
     def __new__(cls):
@@ -36,7 +36,7 @@ class WebDriverManager:
             self.logger.warning("AdBlocker Ultimate extension not found at: " + self._extension_path)
             self.logger.info("Please download the extension and save it as 'adblocker_ultimate.crx' in the utils directory")
 
-    def _create_chrome_options(self):
+    def _create_chrome_options(self, profile_dir=None, lean=False):
         chrome_options = Options()
         
         # Set Chrome binary location
@@ -58,8 +58,8 @@ class WebDriverManager:
             self.logger.warning("Chrome binary not found in common locations. Please set CHROME_PATH environment variable.")
           
         
-        # Add AdBlocker Ultimate extension if available
-        if os.path.exists(self._extension_path):
+        # Add AdBlocker Ultimate extension if available (lean drivers block at the network level instead)
+        if not lean and os.path.exists(self._extension_path):
             chrome_options.add_extension(self._extension_path)
             self.logger.info("AdBlocker Ultimate extension added")
         
@@ -85,6 +85,8 @@ class WebDriverManager:
             'webrtc.multiple_routes_enabled': False,
             'webrtc.nonproxied_udp_enabled': False
         }
+        if lean:
+            prefs['profile.managed_default_content_settings.images'] = 2
         chrome_options.add_experimental_option('prefs', prefs)
         
         # Additional stability options
@@ -102,10 +104,21 @@ class WebDriverManager:
         # Set user agent
         chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36')
         
+        # Lean scrape profile: headless, no images, performance log for network stats
+        if lean:
+            chrome_options.add_argument('--headless=new')
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        
+        # Give pooled drivers their own profile so they don't share locks or cookies
+        if profile_dir:
+            chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+        
         return chrome_options
 
-    def _mask_selenium_properties(self):
+    def _mask_selenium_properties(self, driver=None):
         """Mask Selenium's presence by modifying navigator properties"""
+        driver = driver or self._driver
         mask_scripts = [
             # Remove webdriver property
             "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})",
@@ -118,38 +131,42 @@ class WebDriverManager:
         ]
         for script in mask_scripts:
             try:
-                self._driver.execute_script(script)
+                driver.execute_script(script)
             except Exception as e:
                 self.logger.warning(f"Failed to execute masking script: {str(e)}")
 
+    def create_driver(self, profile_dir=None, lean=None):
+        """Create a new, independent Chrome instance (used by the singleton and by WebDriverPool)"""
+        lean = Config.LEAN_SCRAPE if lean is None else lean
+        if not lean:
+            self._check_extension()
+        chrome_options = self._create_chrome_options(profile_dir, lean)
+        with ScrapeMetrics().phase('driver_start'):
+            driver = webdriver.Chrome(options=chrome_options)
+        driver.set_page_load_timeout(30)  # Set page load timeout
+        self._mask_selenium_properties(driver)  # Apply masking after driver creation
+        if lean:
+            ResourceBlocker().apply(driver)
+        return driver
+
     def get_driver(self):
-        try:
-            if self._driver is None:
-                self.logger.info("Initializing new WebDriver instance...")
-                self._check_extension()
-                chrome_options = self._create_chrome_options()
-                
-                try:
-                    self._driver = webdriver.Chrome(options=chrome_options)
-                    self._driver.set_page_load_timeout(30)  # Set page load timeout
-                    self._mask_selenium_properties()  # Apply masking after driver creation
-                    self.logger.info("WebDriver initialized successfully")
-                except Exception as e:
-                    self.logger.error(f"Failed to initialize WebDriver: {str(e)}")
-                    raise
-            
+        if self._driver is not None:
             # Test if driver is responsive
             try:
-                self._driver.current_url
+                with ScrapeMetrics().phase('driver_health_check'):
+                    self._driver.current_url
                 return self._driver
-            except:
+            except Exception:
                 self.logger.warning("Existing driver unresponsive, recreating...")
                 self.quit_driver()
-                
-        except WebDriverException as e:
-            self.quit_driver()
-            time.sleep(self._retry_delay)
-                    
+
+        self.logger.info("Initializing new WebDriver instance...")
+        try:
+            self._driver = FetchPolicy().call(None, self.create_driver, label="WebDriver start")
+            self.logger.info("WebDriver initialized successfully")
+        except Exception as e:
+            self.logger.error(f"Failed to initialize WebDriver: {str(e)}")
+            raise
         return self._driver
 
     def quit_driver(self):
@@ -0,0 +1,88 @@
+from contextlib import contextmanager
+from utils.web_driver_manager import WebDriverManager
+from utils.helpers.retry_policy import FetchPolicy
+from utils.metrics import ScrapeMetrics
+from utils.config import Config
+import logging
+import os
+import queue
+import tempfile
+import threading
+
+class PooledDriver:
+    """A single pool slot with the same get_driver/quit_driver interface as WebDriverManager"""
+
+    def __init__(self, slot, profile_dir):
+        self.slot = slot
+        self.profile_dir = profile_dir
+        self._driver = None
+        self.logger = logging.getLogger('WebDriverPool')
+
+    def get_driver(self):
+        if self._driver is not None:
+            # Test if driver is responsive
+            try:
+                with ScrapeMetrics().phase('driver_health_check'):
+                    self._driver.current_url
+                return self._driver
+            except Exception:
+                self.logger.warning(f"Driver in slot {self.slot} unresponsive, recreating...")
+                self.quit_driver()
+
+        self.logger.info(f"Initializing WebDriver for slot {self.slot} (profile: {self.profile_dir})")
+        self._driver = FetchPolicy().call(None, WebDriverManager().create_driver, self.profile_dir,
+                                          label="WebDriver start")
+        return self._driver
+
+    def quit_driver(self):
+        """Safely quit the WebDriver instance held by this slot"""
+        try:
+            if self._driver:
+                self._driver.quit()
+        except Exception as e:
+            self.logger.error(f"Error while quitting WebDriver in slot {self.slot}: {str(e)}")
+        finally:
+            self._driver = None
+
+
+class WebDriverPool:
+    """Bounded pool of independent Chrome drivers, each with its own profile directory"""
+
+    def __init__(self, size=None, profile_root=None):
+        self.size = max(1, size or Config.DRIVER_POOL_SIZE)
+        self._setup_logging()
+        profile_root = profile_root or Config.DRIVER_PROFILE_ROOT or tempfile.mkdtemp(prefix='webscrap_profiles_')
+        self.slots = []
+        self._available = queue.Queue()
+        for slot in range(self.size):
+            profile_dir = os.path.abspath(os.path.join(profile_root, f'driver_{slot}'))
+            os.makedirs(profile_dir, exist_ok=True)
+            pooled = PooledDriver(slot, profile_dir)
+            self.slots.append(pooled)
+            self._available.put(pooled)
+        self._lock = threading.Lock()
+
+    def _setup_logging(self):
+        self.logger = logging.getLogger('WebDriverPool')
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+
+    @contextmanager
+    def acquire(self, timeout=None):
+        """Borrow a driver slot for the duration of the with-block"""
+        pooled = self._available.get(timeout=timeout)
+        try:
+            yield pooled
+        finally:
+            self._available.put(pooled)
+
+    def quit_all(self):
+        """Quit every driver in the pool"""
+        with self._lock:
+            self.logger.info(f"Quitting {self.size} pooled WebDriver(s)...")
+            for pooled in self.slots:
+                pooled.quit_driver()